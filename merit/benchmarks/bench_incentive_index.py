@@ -0,0 +1,86 @@
+"""
+Compares per-neuron cross-subnet incentive lookups with and without the IncentiveIndex.
+
+    python -m merit.benchmarks.bench_incentive_index --subnets 128 --uids 256
+"""
+import argparse
+import random
+import time
+from types import SimpleNamespace
+
+from merit.neuron.incentive_index import IncentiveIndex
+
+
+def make_synthetic_infos(num_subnets: int, uids_per_subnet: int, overlap: float = 0.1, seed: int = 0):
+    """
+    Builds MetagraphInfo-like objects; `overlap` is the share of UIDs reusing hotkeys from a common pool.
+    """
+    rng = random.Random(seed)
+    shared = [f"5Shared{i:042d}" for i in range(uids_per_subnet)]
+    infos = []
+    for netuid in range(num_subnets):
+        hotkeys = [
+            rng.choice(shared) if rng.random() < overlap else f"5Net{netuid:04d}Uid{uid:05d}{'x' * 34}"
+            for uid in range(uids_per_subnet)
+        ]
+        incentives = [rng.random() / uids_per_subnet for _ in range(uids_per_subnet)]
+        infos.append(SimpleNamespace(netuid=netuid, hotkeys=hotkeys, incentives=incentives))
+    return infos
+
+
+def evaluate_rescan(infos, hotkeys, netuid):
+    expected_subnets = [info for info in infos if info.netuid not in (0, netuid)]
+    result = {}
+    for hotkey in hotkeys:
+        incentives = []
+        for info in expected_subnets:
+            hotkey_to_incentive = dict(zip(info.hotkeys, info.incentives))
+            incentives.append(hotkey_to_incentive.get(hotkey, 0.0))
+        result[hotkey] = sum(incentives) / len(expected_subnets) * 100000 if expected_subnets else 0.0
+    return result
+
+
+def evaluate_indexed(infos, hotkeys, netuid):
+    index = IncentiveIndex(infos, skip_netuids=(0, netuid))
+    num_expected_subnets = len(index.netuids)
+    result = {}
+    for hotkey in hotkeys:
+        incentives = index.get(hotkey)
+        result[hotkey] = sum(incentives.values()) / num_expected_subnets * 100000 if num_expected_subnets else 0.0
+    return result
+
+
+def _time(fn, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--subnets", type=int, default=128)
+    parser.add_argument("--uids", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    infos = make_synthetic_infos(args.subnets, args.uids)
+    netuid = 1
+    hotkeys = infos[netuid].hotkeys
+
+    baseline = evaluate_rescan(infos, hotkeys, netuid)
+    indexed = evaluate_indexed(infos, hotkeys, netuid)
+    assert all(abs(baseline[h] - indexed[h]) < 1e-9 for h in hotkeys), "Index results diverge from rescan."
+
+    rescan_s = _time(evaluate_rescan, infos, hotkeys, netuid, repeat=args.repeat)
+    indexed_s = _time(evaluate_indexed, infos, hotkeys, netuid, repeat=args.repeat)
+    print(f"{args.subnets} subnets x {args.uids} UIDs, {len(hotkeys)} evaluated hotkeys")
+    print(f"  rescan per neuron : {rescan_s * 1000:9.2f} ms")
+    print(f"  incentive index   : {indexed_s * 1000:9.2f} ms (including index build)")
+    print(f"  speedup           : {rescan_s / indexed_s:9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Times a full Validator cycle (ping round, evaluation, weight set) against a local fake subtensor and an
+in-process miner swarm, across own-subnet sizes and numbers of tracked subnets.
+
+    python -m merit.benchmarks.bench_validator_cycle
+    python -m merit.benchmarks.bench_validator_cycle --neurons 256 1024 --subnets 32 --latency 0.05
+    python -m merit.benchmarks.bench_validator_cycle --neurons 4096 --subnets 128 --ping_workers 4
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import bittensor as bt
+
+from merit.benchmarks.fakes import FakeConfig, FakeSubtensor, FakeSwarm, FakeSwarmFactory, make_wallet
+from merit.neuron.ping_pool import ShardedPingEngine
+from merit.neuron.validator import Validator
+
+
+def build_validator(num_neurons: int, num_subnets: int, latency: float, failure_rate: float,
+                    concurrency: int, uids_per_subnet: int = 256, ping_workers: int = 0):
+    subtensor = FakeSubtensor(num_neurons=num_neurons, num_subnets=num_subnets, uids_per_subnet=uids_per_subnet)
+    metagraph = subtensor.metagraph(subtensor.netuid)
+    swarm = FakeSwarm(metagraph, latency=latency, failure_rate=failure_rate)
+    config = FakeConfig(netuid=subtensor.netuid, ping_concurrency=concurrency, no_warm_start=True)
+    validator = Validator(config, wallet=make_wallet(metagraph.hotkeys[0]), subtensor=subtensor, dendrite=swarm)
+    if ping_workers:
+        factory = FakeSwarmFactory(metagraph, latency=latency, failure_rate=failure_rate)
+        validator.ping_engine = ShardedPingEngine(factory, ping_workers, concurrency=concurrency, probe=False)
+        validator.ping_engine.start()
+    validator.ping_engine.probe = False
+    return validator, subtensor
+
+
+async def run_cycle(validator, subtensor) -> dict:
+    timings = {}
+
+    start = time.perf_counter()
+    await validator._ping_round()
+    timings["ping"] = time.perf_counter() - start
+
+    subtensor.step(netuids=list(subtensor.infos)[:max(1, len(subtensor.infos) // 10)])
+    start = time.perf_counter()
+    await validator._refresh_all_metagraphs_info()
+    timings["refresh"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validator._evaluate_miners()
+    timings["evaluate"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await validator._set_weights(subtensor.get_current_block())
+    await validator.weight_submitter.wait()
+    timings["set_weights"] = time.perf_counter() - start
+
+    timings["total"] = sum(timings.values())
+    return timings
+
+
+async def bench(num_neurons: int, num_subnets: int, args) -> dict:
+    validator, subtensor = build_validator(num_neurons, num_subnets, args.latency, args.failure_rate,
+                                           args.concurrency, args.uids_per_subnet, args.ping_workers)
+    try:
+        return await run_cycle(validator, subtensor)
+    finally:
+        await validator.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--neurons", type=int, nargs="+", default=[256, 1024, 4096])
+    parser.add_argument("--subnets", type=int, nargs="+", default=[32, 128, 512])
+    parser.add_argument("--uids_per_subnet", type=int, default=256)
+    parser.add_argument("--latency", type=float, default=0.02, help="Mean miner response latency (seconds).")
+    parser.add_argument("--failure_rate", type=float, default=0.05)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--ping_workers", type=int, default=0,
+                        help="Shard pings across this many worker processes (0: in-process).")
+    args = parser.parse_args()
+
+    bt.logging.set_warning()
+    workdir = tempfile.mkdtemp(prefix="merit-bench-")
+    os.chdir(workdir)
+
+    columns = ("ping", "refresh", "evaluate", "set_weights", "total")
+    print(f"{'neurons':>8} {'subnets':>8} " + " ".join(f"{c + ' (s)':>15}" for c in columns))
+    for num_neurons in args.neurons:
+        for num_subnets in args.subnets:
+            timings = asyncio.run(bench(num_neurons, num_subnets, args))
+            print(f"{num_neurons:>8} {num_subnets:>8} " + " ".join(f"{timings[c]:>15.3f}" for c in columns))
+
+
+if __name__ == "__main__":
+    main()
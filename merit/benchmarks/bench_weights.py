@@ -0,0 +1,48 @@
+"""
+Times the pure-Python weight path against the NumPy single-vector and batched paths.
+
+    python -m merit.benchmarks.bench_weights --uids 256 --vectors 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from merit.neuron.validator import Validator
+from merit.neuron.weights import batch_normalized_weights, compute_normalized_weights
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uids", type=int, default=256)
+    parser.add_argument("--vectors", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    uids = list(range(args.uids))
+    matrix = rng.uniform(0, 5000, size=(args.vectors, args.uids))
+    matrix[rng.random(matrix.shape) < 0.3] = 0.0
+    reference = Validator.__new__(Validator)
+
+    start = time.perf_counter()
+    for scores in matrix:
+        reference._calculate_normalized_weights(uids, scores.tolist())
+    python_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for scores in matrix:
+        compute_normalized_weights(uids, scores)
+    single_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch_normalized_weights(uids, matrix)
+    batch_s = time.perf_counter() - start
+
+    print(f"{args.vectors} score vectors x {args.uids} UIDs")
+    print(f"  pure Python   : {python_s * 1000:9.2f} ms")
+    print(f"  NumPy single  : {single_s * 1000:9.2f} ms")
+    print(f"  NumPy batched : {batch_s * 1000:9.2f} ms ({python_s / batch_s:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
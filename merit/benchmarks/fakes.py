@@ -0,0 +1,224 @@
+"""
+Local stand-ins for the chain and the miner swarm, for benchmarks and load tests.
+
+FakeSubtensor serves a configurable own-subnet metagraph plus `num_subnets` other subnets through the
+same calls the validator makes on bt.subtensor. FakeSwarm answers PingSynapse in-process with real
+TOTP tokens and per-miner injectable latency and failures, behind a dendrite-compatible `call`;
+FakeSwarmFactory builds one inside each ping worker process.
+"""
+import asyncio
+import os
+import random
+import time
+from types import SimpleNamespace
+
+from merit.protocol.merit_protocol import PingSynapse
+from merit.utils.totp import TotpCache
+
+
+class FakeConfig(dict):
+    """
+    bt.config-like mapping: missing options read as None.
+    """
+
+    def __getattr__(self, name):
+        return self.get(name)
+
+
+def make_hotkey(netuid: int, uid: int) -> str:
+    return f"5Fake{netuid:04d}x{uid:06d}".ljust(48, "Z")
+
+
+def make_ip(uid: int) -> str:
+    # 8.0.0.0/8 is globally routable, so the validator's public-IPv4 filter accepts it; nothing is dialed.
+    return f"8.{(uid >> 16) & 0xFF}.{(uid >> 8) & 0xFF}.{uid & 0xFF}"
+
+
+class FakeNeuron:
+    __slots__ = ("uid", "hotkey", "axon_info", "dividends", "validator_trust")
+
+    def __init__(self, uid: int, hotkey: str, ip: str, port: int, validator: bool = False):
+        self.uid = uid
+        self.hotkey = hotkey
+        self.axon_info = SimpleNamespace(ip=ip, port=port)
+        self.dividends = 0.0
+        self.validator_trust = 1.0 if validator else 0.0
+
+
+class FakeMetagraph:
+    def __init__(self, netuid: int, neurons, weights_version: int = 1):
+        self.netuid = netuid
+        self.neurons = neurons
+        self.hotkeys = [neuron.hotkey for neuron in neurons]
+        self.hparams = SimpleNamespace(weights_version=weights_version)
+
+
+class FakeSubtensor:
+    """
+    Own subnet `netuid` with `num_neurons` UIDs (UID 0 is the validator) and `num_subnets` other subnets of
+    `uids_per_subnet` UIDs; `overlap` is the share of other-subnet UIDs held by hotkeys from the own subnet.
+    """
+
+    def __init__(self, netuid: int = 73, num_neurons: int = 256, num_subnets: int = 128,
+                 uids_per_subnet: int = 256, overlap: float = 0.2, tempo: int = 360, seed: int = 0):
+        self.rng = random.Random(seed)
+        self.netuid = netuid
+        self.tempo = tempo
+        self.block = 1_000_000
+        self.weights_set = []
+        self.last_update = None
+        self.set_weights_failures = 0  # upcoming set_weights calls that fail
+
+        neurons = [
+            FakeNeuron(uid, make_hotkey(netuid, uid), make_ip(uid), 8091, validator=(uid == 0))
+            for uid in range(num_neurons)
+        ]
+        self._metagraph = FakeMetagraph(netuid, neurons)
+
+        own_hotkeys = self._metagraph.hotkeys[1:]
+        netuids = [n for n in range(num_subnets + 2) if n != netuid][:num_subnets + 1]
+        self.infos = {}
+        for other in netuids:
+            hotkeys = [
+                self.rng.choice(own_hotkeys) if own_hotkeys and self.rng.random() < overlap
+                else make_hotkey(other, uid)
+                for uid in range(uids_per_subnet)
+            ]
+            incentives = [self.rng.random() / uids_per_subnet for _ in range(uids_per_subnet)]
+            self.infos[other] = SimpleNamespace(
+                netuid=other, last_step=self.block, hotkeys=hotkeys, incentives=incentives
+            )
+        self.infos[netuid] = SimpleNamespace(
+            netuid=netuid, last_step=self.block, hotkeys=list(self._metagraph.hotkeys),
+            incentives=[0.0] * num_neurons,
+        )
+
+    def step(self, netuids=None, blocks: int = 12):
+        """
+        Advances the chain; subnets in `netuids` (default: all) step and get fresh incentives.
+        """
+        self.block += blocks
+        for netuid in (self.infos if netuids is None else netuids):
+            info = self.infos[netuid]
+            info.last_step = self.block
+            info.incentives = [self.rng.random() / len(info.hotkeys) for _ in info.hotkeys]
+
+    def get_current_block(self) -> int:
+        return self.block
+
+    def blocks_since_last_update(self, netuid: int, uid: int) -> int:
+        return self.tempo if self.last_update is None else self.block - self.last_update
+
+    def get_hyperparameter(self, param_name: str, netuid: int):
+        if param_name != "LastUpdate":
+            return None
+        last_update = self.block - self.tempo if self.last_update is None else self.last_update
+        return [last_update] * len(self._metagraph.neurons)
+
+    def metagraph(self, netuid: int):
+        return self._metagraph
+
+    def get_all_metagraphs_info(self):
+        return list(self.infos.values())
+
+    def all_subnets(self):
+        return [SimpleNamespace(netuid=n, last_step=info.last_step) for n, info in self.infos.items()]
+
+    def get_metagraph_info(self, netuid: int):
+        return self.infos.get(netuid)
+
+    def set_weights(self, **kwargs):
+        if self.set_weights_failures:
+            self.set_weights_failures -= 1
+            return False, "Transaction failed"
+        # Lands in the next block.
+        self.weights_set.append(kwargs)
+        self.block += 1
+        self.last_update = self.block
+        return True, ""
+
+
+class FakeSwarm:
+    """
+    In-process miner swarm behind a bt.dendrite-compatible `call`. Each axon answers after
+    `latency` seconds (plus up to `jitter`), fails with probability `failure_rate` (timeout, missing
+    token or wrong token) and can be overridden per hotkey with `set_behaviour`.
+    """
+
+    def __init__(self, metagraph, latency: float = 0.02, jitter: float = 0.01, failure_rate: float = 0.05,
+                 seed: int = 0):
+        self._session = object()  # keeps PingEngine from installing an aiohttp session
+        self.rng = random.Random(seed)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.totp_cache = TotpCache()
+        self.by_axon = {(n.axon_info.ip, n.axon_info.port): n.hotkey for n in metagraph.neurons}
+        self.behaviour = {}
+        self.calls = 0
+        self.crash_marker = None
+
+    def set_behaviour(self, hotkey: str, latency: float = None, failure: str = None):
+        """
+        failure: None, "timeout" (answers 5x late without a token), "no_token", "bad_token", "crash"
+        (kills the hosting process the first time, while `crash_marker` does not exist yet) or "hang"
+        (blocks the hosting process's event loop for an hour, also once).
+        """
+        self.behaviour[hotkey] = (latency, failure)
+
+    async def call(self, target_axon, synapse: PingSynapse, timeout: float = 12.0, deserialize: bool = True):
+        self.calls += 1
+        hotkey = self.by_axon.get((target_axon.ip, target_axon.port))
+        latency, failure = self.behaviour.get(hotkey, (None, None))
+        if latency is None:
+            latency = self.latency + self.rng.random() * self.jitter
+        if failure is None and self.rng.random() < self.failure_rate:
+            failure = self.rng.choice(("timeout", "no_token", "bad_token"))
+
+        if failure in ("crash", "hang"):
+            if self.crash_marker and not os.path.exists(self.crash_marker):
+                open(self.crash_marker, "w").close()
+                if failure == "crash":
+                    os._exit(1)
+                time.sleep(3600)
+            failure = None
+        if failure == "timeout":
+            await asyncio.sleep(min(timeout, latency * 5))
+            return synapse
+        await asyncio.sleep(latency)
+        if failure == "no_token" or hotkey is None:
+            return synapse
+        synapse.token = "000000" if failure == "bad_token" else self.totp_cache.token(hotkey)
+        return synapse
+
+    async def aclose_session(self):
+        pass
+
+
+class FakeSwarmFactory:
+    """
+    Picklable FakeSwarm recipe for ShardedPingEngine workers. `crash_hotkey` makes the first worker
+    that pings it exit (or hang, with crash_mode="hang"), once (tracked by the `crash_marker` file).
+    """
+
+    def __init__(self, metagraph, latency: float = 0.02, jitter: float = 0.01, failure_rate: float = 0.05,
+                 crash_hotkey: str = None, crash_marker: str = None, crash_mode: str = "crash"):
+        self.metagraph = metagraph
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.crash_hotkey = crash_hotkey
+        self.crash_marker = crash_marker
+        self.crash_mode = crash_mode
+
+    def __call__(self):
+        swarm = FakeSwarm(self.metagraph, latency=self.latency, jitter=self.jitter, failure_rate=self.failure_rate,
+                          seed=os.getpid())
+        if self.crash_hotkey is not None:
+            swarm.crash_marker = self.crash_marker
+            swarm.set_behaviour(self.crash_hotkey, failure=self.crash_mode)
+        return swarm, TotpCache().verify
+
+
+def make_wallet(hotkey: str):
+    return SimpleNamespace(hotkey=SimpleNamespace(ss58_address=hotkey))
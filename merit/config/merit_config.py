@@ -3,13 +3,88 @@ TEMPO = 360  # Number of blocks per epoch
 
 # Results Settings
 EPOCH_RESULTS_DIR = "epoch_results"
-MAX_EPOCH_FILES = 48
+MAX_EPOCH_FILES = 48                # Legacy epoch_<block>.json files kept
+MAX_EPOCHS = 48                     # Epochs retained in the epoch store
+MAX_EPOCH_BYTES = 256 * 1024 ** 2   # Size cap for the epoch store (bytes)
+EPOCHS_PER_SEGMENT = 16             # Epochs per epoch store segment file
 
 # Recovery State Files
 STATE_FILE = ".merit_state.json"
 HEALTH_FILE = ".merit_health.json"
+SNAPSHOT_FILE = ".merit_snapshot.json.gz"  # Always suffixed with the netuid (see fileio.netuid_path)
+SNAPSHOT_MAX_AGE = 3 * 3600  # Ignore warm-start snapshots older than this (seconds)
 
 # Ping Settings
 PING_TIMEOUT = 10         # Timeout per ping attempt (seconds)
 PING_RETRY_ATTEMPTS = 2   # Number of retries if ping fails
 PING_RETRY_DELAY = 0.5    # Delay (in seconds) between retries
+
+# Chain Access Settings
+CHAIN_CALL_TIMEOUT = 30          # Default deadline for a single subtensor call (seconds)
+CHAIN_SYNC_TIMEOUT = 120         # Deadline for metagraph / all-metagraphs downloads (seconds)
+CHAIN_SET_WEIGHTS_TIMEOUT = 120  # Deadline for set_weights including inclusion wait (seconds)
+
+# Ping Engine Settings
+PING_CONCURRENCY = 64            # Max miners pinged at once
+PING_PROBE_PORT = True           # TCP-probe the axon port before sending the synapse
+PING_PROBE_TIMEOUT = 4.0         # Timeout for the TCP probe (seconds)
+PING_CONNECTIONS_PER_HOST = 2    # Pooled keep-alive connections per miner host
+
+# Cross-Subnet Refresh Settings
+SUBNET_FULL_REFRESH_INTERVAL = 3600  # Force a full get_all_metagraphs_info at least this often (seconds)
+SUBNET_FULL_REFRESH_RATIO = 0.5      # Fall back to a full fetch when this share of subnets changed
+
+# Adaptive Ping Scheduler Settings
+PING_SCHEDULER_MIN_INTERVAL = 120  # Recheck interval for new, recovering or failing miners (seconds)
+PING_SCHEDULER_MAX_FACTOR = 4      # Stable miners are pinged at most every ping_frequency * this
+PING_SCHEDULER_STABLE_STREAK = 6   # Successes in a row before a miner's interval starts doubling
+PING_SCHEDULER_TICK = 30           # Minimum sleep between scheduler passes (seconds)
+
+# Rolling Uptime Settings
+UPTIME_WINDOW = 48         # Ping outcomes kept per UID
+UPTIME_THRESHOLD = 0.8     # Rolling uptime that keeps a miner scored after a failed latest ping
+UPTIME_MIN_SAMPLES = 3     # Samples required before rolling uptime is trusted
+
+# Miner Axon Guard Settings
+MINER_PING_RATE = 0.2               # Sustained ping requests per second allowed per caller
+MINER_PING_BURST = 10               # Requests a caller may send at once before being rate limited
+MINER_MAX_TRACKED_CALLERS = 4096    # Rate-limit buckets kept before idle callers are evicted
+
+# Miner Registration Watcher Settings
+MINER_REGISTRATION_MIN_INTERVAL = 120      # First recheck of the miner's UID, and after it changes (seconds)
+MINER_REGISTRATION_MAX_INTERVAL = 1800     # Back-off ceiling for UID rechecks (seconds)
+MINER_PERMIT_REFRESH_INTERVAL = 360 * 12   # Metagraph pull to refresh the validator permit set, once per tempo (seconds)
+MINER_PERMIT_LOOKUP_RATE = 0.05           # Sustained single-hotkey permit lookups per second for unknown callers
+MINER_PERMIT_LOOKUP_BURST = 5              # Unknown-caller permit lookups allowed at once
+
+# Weight Submission Settings
+BLOCK_TIME = 12                  # Seconds per block
+WEIGHTS_RETRY_DELAY = 12         # First backoff after a failed or unconfirmed weight submission (seconds)
+WEIGHTS_MAX_RETRY_DELAY = 120    # Backoff ceiling between weight submission attempts (seconds)
+WEIGHTS_INCLUSION_BLOCKS = 5     # Blocks to wait for a submission to land before resubmitting
+
+# Tracing / Profiling Settings
+TRACE_FILE = "merit_trace.json"        # Chrome trace export of the validator cycle
+TRACE_MAX_SPANS = 100_000              # Completed spans kept in memory while tracing
+PROFILE_FILE = "merit_profile.folded"  # Folded stacks written when the sampling profiler stops
+PROFILE_INTERVAL = 0.005               # Sampling profiler period (seconds)
+
+# Dashboard API Settings
+DASHBOARD_CACHE_SIZE = 1024  # Rendered dashboard responses kept between index updates
+
+# Subnet Analytics Settings
+ANALYTICS_WINDOW = 24 * 3600         # Window for registration / churn counts (seconds)
+ANALYTICS_BURN_CLASSES = (           # Registration difficulty classes by burn ceiling (TAO)
+    (0.1, "low"),
+    (1.0, "medium"),
+    (float("inf"), "high"),
+)
+ANALYTICS_REFRESH_INTERVAL = 600     # Cross-subnet refresh period for miners running --subnet_analytics (seconds)
+
+# Incentive Smoothing Settings
+INCENTIVE_EMA_HALF_LIFE = 1440   # Half-life of the per-(hotkey, netuid) incentive EMA (blocks); 0 scores raw incentives
+
+# Ping Worker Pool Settings
+PING_WORKER_MAX_RESTARTS = 3   # Worker restarts allowed per ping round before a dead worker's pings count as failed
+PING_WORKER_STALL_GRACE = 5.0   # Slack over the worst-case ping time before a silent worker counts as hung (seconds)
+PING_WORKER_START_TIMEOUT = 60  # Time a new worker gets to import bittensor and report ready (seconds)
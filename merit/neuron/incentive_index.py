@@ -0,0 +1,61 @@
+class IncentiveIndex:
+    """
+    Cross-subnet incentive lookup keyed by hotkey.
+    Built once per metagraph info fetch, so evaluating a miner no longer rescans every subnet.
+    Subnets can be replaced or removed individually when only some of them changed.
+    """
+
+    def __init__(self, infos=(), skip_netuids=()):
+        self.skip_netuids = set(skip_netuids)
+        self.netuids = []
+        self._by_hotkey = {}
+        self._subnet_hotkeys = {}
+
+        for info in infos:
+            self.set_subnet(info.netuid, info.hotkeys, info.incentives)
+
+    def set_subnet(self, netuid: int, hotkeys, incentives):
+        """
+        Indexes (or re-indexes) one subnet's hotkeys and incentives.
+        """
+        if netuid in self.skip_netuids:
+            return
+        if netuid in self._subnet_hotkeys:
+            self._drop_entries(netuid)
+        else:
+            self.netuids.append(netuid)
+
+        self._subnet_hotkeys[netuid] = hotkeys
+        for hotkey, incentive in zip(hotkeys, incentives):
+            entry = self._by_hotkey.get(hotkey)
+            if entry is None:
+                entry = self._by_hotkey[hotkey] = {}
+            entry[netuid] = incentive
+
+    def remove_subnet(self, netuid: int):
+        if netuid not in self._subnet_hotkeys:
+            return
+        self._drop_entries(netuid)
+        del self._subnet_hotkeys[netuid]
+        self.netuids.remove(netuid)
+
+    def _drop_entries(self, netuid: int):
+        for hotkey in self._subnet_hotkeys[netuid]:
+            entry = self._by_hotkey.get(hotkey)
+            if entry is None:
+                continue
+            entry.pop(netuid, None)
+            if not entry:
+                del self._by_hotkey[hotkey]
+
+    def get(self, hotkey) -> dict:
+        """
+        Returns {netuid: incentive} for every indexed subnet the hotkey is registered on.
+        """
+        return self._by_hotkey.get(hotkey, {})
+
+    def __contains__(self, hotkey) -> bool:
+        return hotkey in self._by_hotkey
+
+    def __len__(self) -> int:
+        return len(self._by_hotkey)
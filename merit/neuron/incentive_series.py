@@ -0,0 +1,183 @@
+"""
+Time-smoothed cross-subnet incentives: one exponential moving average per (hotkey, netuid), kept in
+flat numpy arrays instead of raw history.
+
+Each subnet refresh folds the subnet's new incentives into its EMAs with a weight derived from how
+many blocks passed since the subnet's previous step, so subnets with different tempos decay at the
+same rate per block. A (hotkey, netuid) pair starts at its first observed value and its slot is freed
+as soon as the hotkey leaves the subnet, so memory is bounded by the current registrations. The EMAs
+and per-subnet steps round-trip through the warm-start snapshot (`to_dict` / `restore`), so smoothing
+survives a restart.
+"""
+import numpy as np
+
+from merit.config import merit_config
+from merit.neuron.scoring import BMPS_SCALE
+
+
+class IncentiveSeries:
+    """
+    `half_life` is in blocks. Subnets in `skip_netuids` are not tracked.
+    """
+
+    def __init__(self, half_life: float = merit_config.INCENTIVE_EMA_HALF_LIFE, skip_netuids=(),
+                 capacity: int = 1024):
+        self.half_life = half_life
+        self.skip_netuids = set(skip_netuids)
+        self._ema = np.zeros(capacity, dtype=np.float64)
+        self._owner = np.full(capacity, -1, dtype=np.int64)    # slot -> hotkey id, -1 if free
+        self._free_slots = list(range(capacity - 1, -1, -1))
+        self._subnet_slots = {}     # netuid -> {hotkey: slot}
+        self._steps = {}            # netuid -> last_step of the latest folded observation
+        self._hotkey_ids = {}       # hotkey -> id
+        self._hotkey_slots = []     # id -> number of slots held
+        self._free_ids = []
+
+    @property
+    def netuids(self) -> list:
+        return list(self._subnet_slots)
+
+    def __len__(self) -> int:
+        return len(self._hotkey_ids)
+
+    # Slots ------------------------------------------------------------------
+
+    def _alloc(self, hotkey: str) -> int:
+        if not self._free_slots:
+            size = self._ema.size
+            self._ema = np.concatenate([self._ema, np.zeros(size)])
+            self._owner = np.concatenate([self._owner, np.full(size, -1, dtype=np.int64)])
+            self._free_slots = list(range(2 * size - 1, size - 1, -1))
+        slot = self._free_slots.pop()
+        hotkey_id = self._hotkey_ids.get(hotkey)
+        if hotkey_id is None:
+            if self._free_ids:
+                hotkey_id = self._free_ids.pop()
+                self._hotkey_slots[hotkey_id] = 0
+            else:
+                hotkey_id = len(self._hotkey_slots)
+                self._hotkey_slots.append(0)
+            self._hotkey_ids[hotkey] = hotkey_id
+        self._hotkey_slots[hotkey_id] += 1
+        self._owner[slot] = hotkey_id
+        return slot
+
+    def _release(self, hotkey: str, slot: int):
+        hotkey_id = self._owner[slot]
+        self._owner[slot] = -1
+        self._ema[slot] = 0.0
+        self._free_slots.append(slot)
+        self._hotkey_slots[hotkey_id] -= 1
+        if not self._hotkey_slots[hotkey_id]:
+            del self._hotkey_ids[hotkey]
+            self._free_ids.append(int(hotkey_id))
+
+    # Updates ----------------------------------------------------------------
+
+    def _alpha(self, netuid: int, last_step):
+        """
+        Weight of the new observation, or None if the subnet has not stepped since the last one.
+        """
+        previous = self._steps.get(netuid)
+        if last_step is None or previous is None or self.half_life <= 0:
+            return 1.0
+        blocks = last_step - previous
+        if blocks <= 0:
+            return None
+        return 1.0 - 0.5 ** (blocks / self.half_life)
+
+    def set_subnet(self, netuid: int, hotkeys, incentives, last_step=None) -> set:
+        """
+        Folds one subnet's current incentives into its EMAs. Returns the hotkeys whose smoothed
+        incentive changed (including hotkeys that joined or left the subnet).
+        """
+        if netuid in self.skip_netuids:
+            return set()
+        previous_slots = self._subnet_slots.pop(netuid, {})
+        current = {}
+        slots = np.empty(len(hotkeys), dtype=np.int64)
+        fresh = np.zeros(len(hotkeys), dtype=bool)
+        for i, hotkey in enumerate(hotkeys):
+            slot = previous_slots.pop(hotkey, None)
+            if slot is None:
+                slot = self._alloc(hotkey)
+                fresh[i] = True
+            current[hotkey] = slots[i] = slot
+        changed = set(previous_slots)
+        for hotkey, slot in previous_slots.items():
+            self._release(hotkey, slot)
+        self._subnet_slots[netuid] = current
+
+        values = np.asarray(incentives, dtype=np.float64)
+        alpha = self._alpha(netuid, last_step)
+        old = self._ema[slots]
+        if alpha is None:
+            new = np.where(fresh, values, old)
+        else:
+            new = old + alpha * (values - old)
+            new[fresh] = values[fresh]
+            if last_step is not None:
+                self._steps[netuid] = last_step
+        self._ema[slots] = new
+        moved = np.flatnonzero(fresh | (new != old))
+        changed.update(hotkeys[i] for i in moved)
+        return changed
+
+    def remove_subnet(self, netuid: int) -> set:
+        previous_slots = self._subnet_slots.pop(netuid, {})
+        self._steps.pop(netuid, None)
+        for hotkey, slot in previous_slots.items():
+            self._release(hotkey, slot)
+        return set(previous_slots)
+
+    # Persistence ------------------------------------------------------------
+
+    def to_dict(self) -> dict:
+        """
+        JSON-friendly EMAs: one [netuid, last_step, hotkeys, values] entry per tracked subnet.
+        """
+        return {
+            "subnets": [
+                [netuid, self._steps.get(netuid), list(slots),
+                 self._ema[np.fromiter(slots.values(), dtype=np.int64, count=len(slots))].tolist()]
+                for netuid, slots in self._subnet_slots.items()
+            ]
+        }
+
+    def restore(self, data: dict):
+        """
+        Loads EMAs saved by `to_dict`, replacing any tracked state of the same subnets. Folding in the
+        infos they were saved with afterwards is a no-op, since those have the same `last_step`.
+        """
+        for netuid, last_step, hotkeys, values in (data or {}).get("subnets", []):
+            if netuid in self.skip_netuids:
+                continue
+            self.remove_subnet(netuid)
+            self.set_subnet(netuid, hotkeys, values)
+            if last_step is not None:
+                self._steps[netuid] = last_step
+
+    # Queries ----------------------------------------------------------------
+
+    def get(self, hotkey) -> dict:
+        """
+        Returns {netuid: smoothed incentive} for every tracked subnet the hotkey is registered on.
+        """
+        return {
+            netuid: float(self._ema[slots[hotkey]])
+            for netuid, slots in self._subnet_slots.items() if hotkey in slots
+        }
+
+    def bmps(self, hotkeys, num_expected_subnets: int) -> np.ndarray:
+        """
+        BMPs of `hotkeys` from the smoothed incentives, in one pass over all slots: the same average
+        as scoring.bmps, 0 for hotkeys on no tracked subnet.
+        """
+        if num_expected_subnets <= 0 or not self._hotkey_ids:
+            return np.zeros(len(hotkeys))
+        live = self._owner >= 0
+        totals = np.bincount(self._owner[live], weights=self._ema[live], minlength=len(self._hotkey_slots))
+        ids = np.fromiter((self._hotkey_ids.get(hotkey, -1) for hotkey in hotkeys), dtype=np.int64,
+                          count=len(hotkeys))
+        result = np.where(ids >= 0, totals[np.maximum(ids, 0)], 0.0)
+        return result / num_expected_subnets * BMPS_SCALE
@@ -1,11 +1,16 @@
 import bittensor as bt
-import pyotp
 import asyncio
-import hashlib
-import base64
+import time
+from typing import Tuple
 
 from merit.protocol.merit_protocol import PingSynapse
 from merit.config import merit_config
+from merit.neuron.miner_guard import NO_PERMIT, MinerGuard
+from merit.neuron.registration_watcher import RegistrationWatcher
+from merit.neuron.subnet_cache import SubnetInfoCache
+from merit.utils.chain import ChainClient
+from merit.utils.totp import TotpCache
+from merit.utils import metrics
 
 class Miner:
     def __init__(self, config: bt.Config):
@@ -13,18 +18,40 @@ class Miner:
 
         self.wallet = bt.wallet(config=config)
         self.subtensor = bt.subtensor(config=config)
+        self.chain = ChainClient(self.subtensor)
         self.netuid = config.netuid
+        self.exit_code = 0
+        self.totp_cache = TotpCache()
+        if config.metrics_port:
+            metrics.start_metrics_server(config.metrics_port)
+            bt.logging.info(f"Serving metrics on port {config.metrics_port}.")
 
         self.axon = bt.axon(wallet=self.wallet, config=config)
 
         # Hotkey registration check
-        self.metagraph = self.subtensor.metagraph(netuid=self.netuid)
-        if self.wallet.hotkey.ss58_address not in self.metagraph.hotkeys:
-            bt.logging.error(f"Hotkey {self.wallet.hotkey.ss58_address} is not registered on subnet {self.netuid}. Exiting.")
+        metagraph = self.subtensor.metagraph(netuid=self.netuid)
+        hotkey = self.wallet.hotkey.ss58_address
+        if hotkey not in metagraph.hotkeys:
+            bt.logging.error(f"Hotkey {hotkey} is not registered on subnet {self.netuid}. Exiting.")
             exit(1)
+        self.watcher = RegistrationWatcher(self.chain, hotkey, self.netuid, uid=metagraph.hotkeys.index(hotkey))
+
+        # Only permitted validators within their rate limit get past the blacklist, before signature checks.
+        self.guard = MinerGuard()
+        self.guard.update(metagraph)
+        self.permit_lookups = asyncio.Queue(maxsize=merit_config.MINER_PERMIT_LOOKUP_BURST)
+        self.loop = None
+        bt.logging.info(f"Accepting pings from {len(self.guard.permits)} permitted validators.")
+
+        # Optional cross-subnet registration / churn analytics, to help pick where to register next.
+        self.subnet_cache = SubnetInfoCache(self.chain) if config.subnet_analytics else None
 
         # Attach forward function
-        self.axon.attach(self.handle_ping_request)
+        self.axon.attach(
+            forward_fn=self.handle_ping_request,
+            blacklist_fn=self.blacklist,
+            priority_fn=self.priority,
+        )
 
         # Start local axon server
         self.axon.start()
@@ -37,45 +64,99 @@ class Miner:
         bt.logging.success(f"Miner served on netuid {self.netuid}.")
 
     async def handle_ping_request(self, synapse: PingSynapse) -> PingSynapse:
+        start = time.perf_counter()
         hotkey = self.wallet.hotkey.ss58_address
-        # Generate TOTP token based on hotkey
-        hashed = hashlib.sha256(hotkey.encode('utf-8')).digest()
-        base32_secret = base64.b32encode(hashed).decode('utf-8').strip('=')
-        totp = pyotp.TOTP(base32_secret)
-        token = totp.now()
+        # TOTP token based on hotkey, derived once per 30s step
+        token = self.totp_cache.token(hotkey)
 
         bt.logging.debug(f"[Miner] Sending PingResponse: hotkey={hotkey}, token={token}")
         synapse.token = token
+        metrics.MINER_REQUESTS.inc()
+        metrics.MINER_REQUEST_DURATION.observe(time.perf_counter() - start)
         return synapse
 
-    async def _periodic_registration_check(self, interval_seconds: int = 1800):
+    async def blacklist(self, synapse: PingSynapse) -> Tuple[bool, str]:
+        caller = synapse.dendrite
+        blacklisted, reason = self.guard.check(caller.hotkey if caller else None, caller.ip if caller else None)
+        if blacklisted:
+            metrics.MINER_REJECTED.inc(reason=reason)
+            # The axon serves requests on its own thread and loop, so the lookup is queued thread-safely.
+            if reason == NO_PERMIT and self.loop is not None and self.guard.request_lookup(caller.hotkey):
+                self.loop.call_soon_threadsafe(self._queue_permit_lookup, caller.hotkey)
+        return blacklisted, reason
+
+    def _queue_permit_lookup(self, hotkey: str):
+        try:
+            self.permit_lookups.put_nowait(hotkey)
+        except asyncio.QueueFull:
+            pass
+
+    async def priority(self, synapse: PingSynapse) -> float:
+        return self.guard.priority(synapse.dendrite.hotkey if synapse.dendrite else None)
+
+    async def _periodic_permit_refresh(self):
+        """
+        Refreshes the validator permit set once per tempo, when permits can change.
+        """
+        while True:
+            await asyncio.sleep(merit_config.MINER_PERMIT_REFRESH_INTERVAL)
+            try:
+                self.guard.update(await self.chain.metagraph(self.netuid))
+                bt.logging.debug(f"Refreshed validator permits: {len(self.guard.permits)} validators.")
+            except Exception as e:
+                bt.logging.warning(f"Validator permit refresh failed, keeping previous set: {e}")
+
+    async def _permit_lookup_worker(self):
+        """
+        Looks up unknown callers one hotkey at a time, so a validator that gained its permit since the
+        last refresh is admitted without waiting for the next tempo or downloading the metagraph.
+        """
+        while True:
+            hotkey = await self.permit_lookups.get()
+            try:
+                neuron = await self.chain.neuron_for_hotkey(hotkey, self.netuid)
+            except Exception as e:
+                bt.logging.debug(f"Permit lookup for {hotkey} failed: {e}")
+                continue
+            if neuron is not None and neuron.validator_permit:
+                self.guard.grant(hotkey, float(neuron.stake))
+                bt.logging.info(f"Admitted newly permitted validator {hotkey} (uid {neuron.uid}).")
+
+    async def _periodic_subnet_analytics(self):
         while True:
             try:
-                self.metagraph = self.subtensor.metagraph(netuid=self.netuid)
-                hotkey = self.wallet.hotkey.ss58_address
-
-                if hotkey not in self.metagraph.hotkeys:
-                    bt.logging.error(f"❌ Miner hotkey {hotkey} is no longer registered on subnet {self.netuid}. "
-                                     f"Exiting.")
-                    self.axon.stop()
-                    exit(1)
-                else:
-                    bt.logging.debug(f"✅ Miner hotkey {hotkey} still registered on subnet {self.netuid}.")
+                diff = await self.subnet_cache.refresh()
+                bt.logging.info(f"Subnet analytics ({diff.summary()}): {self.subnet_cache.analytics.summary()}.")
             except Exception as e:
-                bt.logging.error(f"⚠️ Registration check failed: {e}")
+                bt.logging.warning(f"Subnet analytics refresh failed: {e}")
+            await asyncio.sleep(merit_config.ANALYTICS_REFRESH_INTERVAL)
 
-            await asyncio.sleep(interval_seconds)
+    def _on_deregistered(self):
+        self.exit_code = 1
+        asyncio.get_event_loop().stop()
 
-    def run(self):
+    def run(self) -> int:
         """
-        Runs the miner indefinitely.
+        Runs the miner until interrupted or deregistered. Returns the process exit code.
         """
         bt.logging.info("Miner running...")
+        loop = self.loop = asyncio.get_event_loop()
+        tasks = [
+            loop.create_task(self.watcher.watch(self._on_deregistered)),
+            loop.create_task(self._periodic_permit_refresh()),
+            loop.create_task(self._permit_lookup_worker()),
+        ]
+        if self.subnet_cache is not None:
+            tasks.append(loop.create_task(self._periodic_subnet_analytics()))
         try:
-            loop = asyncio.get_event_loop()
-            loop.create_task(self._periodic_registration_check())
             loop.run_forever()
         except KeyboardInterrupt:
             bt.logging.warning("Miner shutting down...")
+        finally:
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
             self.axon.stop()
+            self.chain.close()
             bt.logging.warning("Miner shutdown complete.")
+        return self.exit_code
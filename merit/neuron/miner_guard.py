@@ -0,0 +1,124 @@
+import time
+
+from merit.config import merit_config
+
+NO_PERMIT = "caller has no validator permit"
+
+
+class TokenBucketLimiter:
+    """
+    Per-caller token buckets: each caller may burst up to `burst` requests and then gets `rate`
+    requests per second. Buckets idle long enough to have refilled are dropped once more than
+    `max_callers` are tracked, so spoofed callers cannot grow the table without bound.
+    """
+
+    def __init__(self, rate: float = merit_config.MINER_PING_RATE, burst: float = merit_config.MINER_PING_BURST,
+                 max_callers: int = merit_config.MINER_MAX_TRACKED_CALLERS):
+        self.rate = rate
+        self.burst = burst
+        self.max_callers = max_callers
+        self._buckets = {}  # caller -> [tokens, last refill time]
+
+    def allow(self, caller, now: float = None) -> bool:
+        now = time.monotonic() if now is None else now
+        bucket = self._buckets.get(caller)
+        if bucket is None:
+            if len(self._buckets) >= self.max_callers:
+                self._evict(now)
+            bucket = self._buckets[caller] = [self.burst, now]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+        if bucket[0] < 1.0:
+            return False
+        bucket[0] -= 1.0
+        return True
+
+    def _evict(self, now: float):
+        refill_time = self.burst / self.rate if self.rate > 0 else float("inf")
+        for caller in [c for c, (_, last) in self._buckets.items() if now - last >= refill_time]:
+            del self._buckets[caller]
+        if len(self._buckets) >= self.max_callers:
+            # Everyone is active: drop the least recently seen half.
+            by_age = sorted(self._buckets, key=lambda c: self._buckets[c][1])
+            for caller in by_age[:len(by_age) // 2 or 1]:
+                del self._buckets[caller]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class MinerGuard:
+    """
+    Cheap admission checks for the miner axon, run by its blacklist hook before the request signature
+    is verified: the caller must hold a validator permit on the subnet and stay within its rate limit.
+    The permit set (hotkey -> stake) is rebuilt from the metagraph at startup and once per tempo.
+    A caller without a permit may be a validator that just gained one, so its hotkey alone can be looked
+    up on chain; each hotkey at most once per `lookup_ttl` seconds, and all of them within a shared rate.
+    """
+
+    def __init__(self, limiter: TokenBucketLimiter = None,
+                 lookup_ttl: float = merit_config.MINER_PERMIT_REFRESH_INTERVAL,
+                 lookup_limiter: TokenBucketLimiter = None):
+        self.limiter = TokenBucketLimiter() if limiter is None else limiter
+        self.lookup_ttl = lookup_ttl
+        self.lookup_limiter = TokenBucketLimiter(
+            rate=merit_config.MINER_PERMIT_LOOKUP_RATE, burst=merit_config.MINER_PERMIT_LOOKUP_BURST, max_callers=1
+        ) if lookup_limiter is None else lookup_limiter
+        self.permits = {}
+        self._looked_up = {}  # hotkey -> time of its last permit lookup, kept as a negative cache
+
+    def update(self, metagraph):
+        permits = getattr(metagraph, "validator_permit", None)
+        stakes = getattr(metagraph, "S", None)
+        if permits is None:
+            self.permits = {}
+            return
+        self.permits = {
+            hotkey: float(stakes[uid]) if stakes is not None else 0.0
+            for uid, hotkey in enumerate(metagraph.hotkeys)
+            if bool(permits[uid])
+        }
+
+    def check(self, hotkey: str, ip: str, now: float = None):
+        """
+        Returns (blacklisted, reason). Until a permit set is loaded every caller is only rate limited.
+        """
+        if hotkey is None:
+            return True, "missing caller hotkey"
+        if self.permits and hotkey not in self.permits:
+            return True, NO_PERMIT
+        # Keyed by claimed hotkey and source IP, so a flood spoofing a validator's hotkey from another
+        # address cannot drain that validator's bucket.
+        if not self.limiter.allow((hotkey, ip), now):
+            return True, "rate limited"
+        return False, "allowed"
+
+    def request_lookup(self, hotkey: str, now: float = None) -> bool:
+        """
+        Called for a caller without a permit. Returns True if its hotkey should be looked up on chain now:
+        it was not looked up within the last `lookup_ttl` seconds and the shared lookup rate allows it.
+        """
+        now = time.monotonic() if now is None else now
+        if now - self._looked_up.get(hotkey, float("-inf")) < self.lookup_ttl:
+            return False
+        if not self.lookup_limiter.allow(None, now):
+            return False
+        if len(self._looked_up) >= self.limiter.max_callers:
+            self._looked_up = {h: t for h, t in self._looked_up.items() if now - t < self.lookup_ttl}
+            if len(self._looked_up) >= self.limiter.max_callers:
+                # Still full of live entries: keep the most recent half.
+                recent = sorted(self._looked_up, key=self._looked_up.get)[len(self._looked_up) // 2:]
+                self._looked_up = {h: self._looked_up[h] for h in recent}
+        self._looked_up[hotkey] = now
+        return True
+
+    def grant(self, hotkey: str, stake: float):
+        """
+        Admits a hotkey found to hold a permit by a lookup, until the next full permit refresh.
+        """
+        self.permits[hotkey] = stake
+        self._looked_up.pop(hotkey, None)
+
+    def priority(self, hotkey: str) -> float:
+        return self.permits.get(hotkey, 0.0)
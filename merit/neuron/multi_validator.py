@@ -0,0 +1,181 @@
+import bittensor as bt
+import asyncio
+import time
+
+from merit.neuron.ping_engine import PingResult
+from merit.neuron.ping_pool import make_ping_engine
+from merit.neuron.subnet_cache import SubnetInfoCache
+from merit.neuron.validator import Validator
+from merit.utils.chain import ChainClient
+from merit.utils.totp import TotpCache
+from merit.utils import dashboard, metrics, tracing
+
+
+class SharedResources:
+    """
+    Components shared by every Validator of a multi-netuid process.
+    """
+
+    def __init__(self, chain, dendrite, subnet_cache, totp_cache, ping_engine):
+        self.chain = chain
+        self.dendrite = dendrite
+        self.subnet_cache = subnet_cache
+        self.totp_cache = totp_cache
+        self.ping_engine = ping_engine
+        self.ping_lock = asyncio.Lock()
+
+
+class MultiValidator:
+    """
+    Validates several netuids from one process. The per-netuid validators share one chain connection,
+    one cross-subnet info cache (fetched and refreshed once for all of them) and one ping engine.
+    A miner axon registered on several of the netuids is pinged once per round, and the result is
+    recorded with every validator that targets it.
+    """
+
+    def __init__(self, config: bt.Config, netuids, wallet=None, subtensor=None, dendrite=None):
+        bt.logging.info(f"Initializing multi-netuid validator for netuids {list(netuids)}...")
+
+        self.wallet = wallet or bt.wallet(config=config)
+        self.subtensor = subtensor or bt.subtensor(config=config)
+        self.dendrite = dendrite or bt.dendrite(wallet=self.wallet)
+        self.ping_frequency = config.ping_frequency or 600
+        if config.metrics_port:
+            metrics.start_metrics_server(config.metrics_port)
+            bt.logging.info(f"Serving metrics on port {config.metrics_port}.")
+
+        chain = ChainClient(self.subtensor)
+        totp_cache = TotpCache()
+        self.shared = SharedResources(
+            chain=chain,
+            dendrite=self.dendrite,
+            subnet_cache=SubnetInfoCache(chain),
+            totp_cache=totp_cache,
+            ping_engine=make_ping_engine(config, self.wallet, self.dendrite, totp_cache.verify),
+        )
+        self._fetch_all_metagraphs_info()
+        self.validators = [
+            Validator(config, wallet=self.wallet, subtensor=self.subtensor, netuid=netuid, shared=self.shared)
+            for netuid in netuids
+        ]
+        if config.dashboard_port:
+            dashboard.start_dashboard_server(
+                config.dashboard_port,
+                {validator.netuid: validator.history_index for validator in self.validators},
+                analytics=self.shared.subnet_cache.analytics,
+            )
+            bt.logging.info(f"Serving dashboard API on port {config.dashboard_port}.")
+        self.last_chain_refresh = 0.0
+        self.ping_task = None
+
+    async def cleanup(self):
+        self.shared.ping_engine.close()
+        bt.logging.info("Multi-netuid validator cleanup: Closing Dendrite session.")
+        try:
+            await self.dendrite.aclose_session()
+        except Exception as e:
+            bt.logging.error(f"Error closing dendrite session: {e}")
+        self.shared.chain.close()
+
+    def _fetch_all_metagraphs_info(self):
+        try:
+            infos = self.subtensor.get_all_metagraphs_info()
+            bt.logging.success(f"Fetched {len(infos)} metagraphs info.")
+        except Exception as e:
+            bt.logging.warning(f"Failed to fetch all metagraphs info: {e}")
+            infos = []
+        self.shared.subnet_cache.seed(infos)
+
+    @tracing.traced("chain_sync.subnets")
+    async def _refresh_all_metagraphs_info(self):
+        try:
+            diff = await self.shared.subnet_cache.refresh()
+        except Exception as e:
+            bt.logging.warning(f"Failed to refresh metagraphs info, keeping previous snapshot: {e}")
+            return
+        bt.logging.success(f"Metagraphs info: {diff.summary()}.")
+        bt.logging.debug(f"Subnet analytics: {self.shared.subnet_cache.analytics.summary()}.")
+        for validator in self.validators:
+            validator._set_metagraphs_info(diff)
+
+    @tracing.traced("ping_pass")
+    async def _ping_pass(self, due: dict) -> dict:
+        """
+        Pings each distinct (hotkey, axon) among the due miners of every validator once and records the
+        result with each validator that targets it (process-wide metrics count it once). Returns failure
+        counts by stage per validator.
+        """
+        owners = {}
+        for validator, neurons in due.items():
+            for neuron in neurons:
+                key = (neuron.hotkey, neuron.axon_info.ip, neuron.axon_info.port)
+                owners.setdefault(key, []).append((validator, neuron))
+        unique = [entries[0][1] for entries in owners.values()]
+
+        failures = {validator: {} for validator in due}
+        async with self.shared.ping_lock:
+            async for result in self.shared.ping_engine.stream(unique):
+                Validator._observe_ping(result)
+                axon = result.neuron.axon_info
+                for validator, neuron in owners[(result.neuron.hotkey, axon.ip, axon.port)]:
+                    validator._record_ping(
+                        PingResult(neuron, result.success, result.rtt, result.stage), failures[validator]
+                    )
+        for validator in due:
+            validator._publish_valid_miners()
+
+        bt.logging.debug(f"Pinged {len(unique)} distinct axons for {sum(map(len, due.values()))} due miners.")
+        return failures
+
+    @tracing.traced("ping_round")
+    async def _ping_round(self):
+        """
+        One background pass for all netuids: refresh every metagraph and the shared cross-subnet cache
+        once per `ping_frequency`, then ping the union of the miners each validator's scheduler reports as due.
+        """
+        for validator in self.validators:
+            validator.ping_complete.clear()
+        round_start = time.perf_counter()
+
+        if time.time() - self.last_chain_refresh >= self.ping_frequency:
+            previous_hotkeys = {hotkey for validator in self.validators for hotkey in validator.metagraph.hotkeys}
+            for validator in self.validators:
+                await validator._refresh_metagraph()
+            hotkeys = {hotkey for validator in self.validators for hotkey in validator.metagraph.hotkeys}
+            self.shared.totp_cache.retain(hotkeys)
+            for hotkey in previous_hotkeys - hotkeys:
+                metrics.MINER_PING_RTT.remove(hotkey=hotkey)
+            await self._refresh_all_metagraphs_info()
+            self.last_chain_refresh = time.time()
+            for validator in self.validators:
+                validator.last_chain_refresh = self.last_chain_refresh
+
+        due = {validator: validator.ping_scheduler.due(validator._ping_targets()) for validator in self.validators}
+        failures = await self._ping_pass(due)
+        for validator in self.validators:
+            validator._finish_ping_round(due[validator], failures[validator], round_start)
+
+    async def _background_pinger(self):
+        while True:
+            try:
+                await self._ping_round()
+            except Exception as e:
+                bt.logging.error(f"Background pinger error: {e}")
+
+            await asyncio.sleep(min(validator._next_ping_delay() for validator in self.validators))
+
+    async def run(self):
+        bt.logging.info(f"Multi-netuid validator running for netuids {[v.netuid for v in self.validators]}...")
+
+        self.ping_task = asyncio.create_task(self._background_pinger())
+        for validator in self.validators:
+            validator.ping_task = self.ping_task
+        try:
+            await asyncio.gather(*(validator.run() for validator in self.validators))
+        finally:
+            self.ping_task.cancel()
+            try:
+                await self.ping_task
+            except asyncio.CancelledError:
+                pass
+            await self.cleanup()
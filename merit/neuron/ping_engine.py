@@ -0,0 +1,164 @@
+import bittensor as bt
+import aiohttp
+import asyncio
+import time
+
+from merit.protocol.merit_protocol import PingSynapse
+from merit.config import merit_config
+from merit.neuron.scoring import is_valid_public_ipv4
+
+# Stages a ping can end in; anything but OK is a failure at that stage.
+OK = "ok"
+INVALID_AXON = "invalid_axon"
+PROBE = "probe"
+FORWARD = "forward"
+TOKEN = "token"
+EXCEPTION = "exception"
+
+
+class PingResult:
+    __slots__ = ("neuron", "success", "rtt", "stage")
+
+    def __init__(self, neuron, success: bool, rtt: float = None, stage: str = OK):
+        self.neuron = neuron
+        self.success = success
+        self.rtt = rtt
+        self.stage = stage
+
+
+class PingEngine:
+    """
+    Pings miners with a bounded number in flight and yields results as they complete.
+    Probe sockets are closed straight away, and synapses go over a pooled keep-alive session
+    so repeated rounds reuse connections per miner host.
+    """
+
+    def __init__(
+        self,
+        dendrite,
+        verify_token,
+        concurrency: int = merit_config.PING_CONCURRENCY,
+        timeout: float = merit_config.PING_TIMEOUT,
+        retry_attempts: int = merit_config.PING_RETRY_ATTEMPTS,
+        retry_delay: float = merit_config.PING_RETRY_DELAY,
+        probe: bool = merit_config.PING_PROBE_PORT,
+    ):
+        self.dendrite = dendrite
+        self.verify_token = verify_token
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retry_attempts = max(1, retry_attempts)
+        self.retry_delay = retry_delay
+        self.probe = probe
+
+    def _ensure_session(self):
+        """
+        Installs a pooled session on the dendrite before its first request creates a default one.
+        """
+        if self.dendrite._session is None:
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrency,
+                limit_per_host=merit_config.PING_CONNECTIONS_PER_HOST,
+                keepalive_timeout=max(60.0, self.timeout * 2),
+                ttl_dns_cache=300,
+            )
+            self.dendrite._session = aiohttp.ClientSession(connector=connector)
+
+    async def _is_port_open(self, ip: str, port: int) -> bool:
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(ip, port), timeout=merit_config.PING_PROBE_TIMEOUT
+            )
+        except Exception:
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        return True
+
+    async def ping(self, neuron) -> PingResult:
+        axon = neuron.axon_info
+        ip = axon.ip
+        port = axon.port
+
+        if not is_valid_public_ipv4(ip) or port == 0:
+            bt.logging.debug(f"Skipping invalid IP/port for {neuron.hotkey}: {ip}:{port}")
+            return PingResult(neuron, False, stage=INVALID_AXON)
+
+        if self.probe:
+            for attempt in range(self.retry_attempts):
+                if await self._is_port_open(ip, port):
+                    break
+                if attempt < self.retry_attempts - 1:
+                    await asyncio.sleep(self.retry_delay)
+            else:
+                bt.logging.debug(f"Port closed after {self.retry_attempts} attempts for {neuron.hotkey}")
+                return PingResult(neuron, False, stage=PROBE)
+
+        try:
+            self._ensure_session()
+            start = time.perf_counter()
+            response = await self.dendrite.call(
+                target_axon=axon,
+                synapse=PingSynapse(hotkey=neuron.hotkey),
+                timeout=self.timeout,
+                deserialize=False,
+            )
+            rtt = time.perf_counter() - start
+
+            token = response.token if isinstance(response, PingSynapse) else None
+            if not token:
+                bt.logging.debug(f"Invalid response or missing token from {neuron.hotkey}")
+                return PingResult(neuron, False, rtt, stage=FORWARD)
+
+            # TOTP tokens are 6 digits; reject anything else before touching the verifier.
+            if len(token) != 6 or not token.isdigit() or not self.verify_token(neuron.hotkey, token):
+                bt.logging.debug(f"TOTP failed for {neuron.hotkey}")
+                return PingResult(neuron, False, rtt, stage=TOKEN)
+
+            bt.logging.debug(f"Ping success for {neuron.hotkey}")
+            return PingResult(neuron, True, rtt)
+
+        except Exception as e:
+            bt.logging.warning(f"Ping exception for {neuron.hotkey}: {e}")
+            return PingResult(neuron, False, stage=EXCEPTION)
+
+    def close(self):
+        """
+        Nothing to release: the dendrite belongs to the caller (see ShardedPingEngine.close).
+        """
+
+    async def stream(self, neurons):
+        """
+        Async generator yielding a PingResult per neuron in completion order,
+        with at most `concurrency` pings in flight.
+        """
+        pending = asyncio.Queue()
+        for neuron in neurons:
+            pending.put_nowait(neuron)
+        total = pending.qsize()
+        results = asyncio.Queue()
+
+        async def worker():
+            while True:
+                try:
+                    neuron = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    result = await self.ping(neuron)
+                except Exception as e:
+                    bt.logging.warning(f"Exception pinging {neuron.hotkey}: {e}")
+                    result = PingResult(neuron, False, stage=EXCEPTION)
+                results.put_nowait(result)
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.concurrency, total))]
+        try:
+            for _ in range(total):
+                yield await results.get()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
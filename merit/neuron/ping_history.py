@@ -0,0 +1,108 @@
+from array import array
+
+import numpy as np
+
+from merit.config import merit_config
+
+
+class PingHistory:
+    """
+    Ring buffer of the last `window` ping outcomes and RTTs per UID, kept in flat arrays indexed by
+    UID (so memory is bounded by the subnet size, not by hotkey churn). A slot is reset when a new
+    hotkey takes over its UID. Rolling uptime is O(1) from a running success count.
+    """
+
+    def __init__(self, window: int = merit_config.UPTIME_WINDOW):
+        self.window = window
+        self.hotkeys = []                 # uid -> hotkey owning the slot
+        self._ok = bytearray()            # uid * window + i -> 1 if the ping succeeded
+        self._rtt = array("f")            # uid * window + i -> RTT in seconds (NaN on failure)
+        self._pos = array("I")            # uid -> next write position
+        self._filled = array("I")         # uid -> samples held (<= window)
+        self._successes = array("I")      # uid -> successes among held samples
+
+    def _grow(self, num_uids: int):
+        extra = num_uids - len(self.hotkeys)
+        if extra <= 0:
+            return
+        self.hotkeys.extend([None] * extra)
+        self._ok.extend(bytes(extra * self.window))
+        self._rtt.extend([float("nan")] * (extra * self.window))
+        for column in (self._pos, self._filled, self._successes):
+            column.extend([0] * extra)
+
+    def _claim(self, uid: int, hotkey: str):
+        self._grow(uid + 1)
+        if self.hotkeys[uid] == hotkey:
+            return
+        self.hotkeys[uid] = hotkey
+        base = uid * self.window
+        self._ok[base:base + self.window] = bytes(self.window)
+        self._rtt[base:base + self.window] = array("f", [float("nan")] * self.window)
+        self._pos[uid] = self._filled[uid] = self._successes[uid] = 0
+
+    def record(self, uid: int, hotkey: str, success: bool, rtt: float = None):
+        self._claim(uid, hotkey)
+        index = uid * self.window + self._pos[uid]
+        if self._filled[uid] == self.window:
+            self._successes[uid] -= self._ok[index]
+        else:
+            self._filled[uid] += 1
+        self._ok[index] = 1 if success else 0
+        self._rtt[index] = rtt if success and rtt is not None else float("nan")
+        self._successes[uid] += 1 if success else 0
+        self._pos[uid] = (self._pos[uid] + 1) % self.window
+
+    def _owns(self, uid: int, hotkey: str) -> bool:
+        return uid < len(self.hotkeys) and self.hotkeys[uid] == hotkey
+
+    def samples(self, uid: int, hotkey: str) -> int:
+        return self._filled[uid] if self._owns(uid, hotkey) else 0
+
+    def uptime(self, uid: int, hotkey: str):
+        """
+        Share of successful pings in the window, or None if there is no history for this hotkey at `uid`.
+        """
+        if not self._owns(uid, hotkey) or not self._filled[uid]:
+            return None
+        return self._successes[uid] / self._filled[uid]
+
+    def latency_percentile(self, uid: int, hotkey: str, q: float = 50.0):
+        """
+        q-th percentile of successful ping RTTs in the window, or None if there are none.
+        """
+        if not self._owns(uid, hotkey):
+            return None
+        base = uid * self.window
+        rtts = np.frombuffer(self._rtt, dtype=np.float32)[base:base + self.window]
+        rtts = rtts[~np.isnan(rtts)]
+        if rtts.size == 0:
+            return None
+        return float(np.percentile(rtts, q))
+
+    def to_dict(self) -> dict:
+        """
+        JSON-friendly form for the health file; samples are stored oldest first.
+        """
+        uids = {}
+        for uid, hotkey in enumerate(self.hotkeys):
+            if hotkey is None or not self._filled[uid]:
+                continue
+            base = uid * self.window
+            filled = self._filled[uid]
+            start = (self._pos[uid] - filled) % self.window
+            order = [base + (start + i) % self.window for i in range(filled)]
+            uids[str(uid)] = {
+                "hotkey": hotkey,
+                "ok": "".join("1" if self._ok[i] else "0" for i in order),
+                "rtt": [None if self._rtt[i] != self._rtt[i] else round(self._rtt[i], 4) for i in order],
+            }
+        return {"window": self.window, "uids": uids}
+
+    @classmethod
+    def from_dict(cls, data: dict, window: int = merit_config.UPTIME_WINDOW):
+        history = cls(window)
+        for uid, entry in (data or {}).get("uids", {}).items():
+            for ok, rtt in list(zip(entry["ok"], entry["rtt"]))[-window:]:
+                history.record(int(uid), entry["hotkey"], ok == "1", rtt)
+        return history
@@ -0,0 +1,335 @@
+"""
+Optional multi-process ping engine: targets are sharded across worker processes, each running its own
+event loop, dendrite, PingEngine and TOTP verifier, so request signing, HTTP handling and token checks
+use several cores instead of competing with evaluation on the validator's loop.
+
+Work and results travel over one duplex pipe per worker as small pickled tuples: the axon info out,
+(key, success, rtt, stage) back. Hotkeys are sharded by a stable hash, so a miner is pinged from the
+same worker each round and reuses that worker's keep-alive connections. If a worker dies mid-round it
+is restarted and its unfinished targets are resent; once a round's restart budget is spent, the
+remaining targets of a dead worker are reported as failed. A worker that is alive but returns nothing
+for longer than one worst-case ping (hung loop, stalled dendrite) is terminated and handled the same
+way, so a round always ends. Dead workers are also replaced at the start of the next round.
+"""
+import asyncio
+import atexit
+import multiprocessing
+import time
+import zlib
+from types import SimpleNamespace
+
+import bittensor as bt
+
+from merit.config import merit_config
+from merit.neuron.ping_engine import EXCEPTION, PingEngine, PingResult
+from merit.utils.totp import TotpCache
+
+
+def make_ping_engine(config, wallet, dendrite, verify_token, **kwargs):
+    """
+    The validator's ping engine: sharded across `config.ping_workers` processes if set, else in-process.
+    """
+    concurrency = config.ping_concurrency or merit_config.PING_CONCURRENCY
+    if config.ping_workers and config.ping_workers > 0:
+        return ShardedPingEngine(WalletDendriteFactory(wallet), config.ping_workers, concurrency=concurrency, **kwargs)
+    return PingEngine(dendrite, verify_token, concurrency=concurrency, **kwargs)
+
+
+class WalletDendriteFactory:
+    """
+    Picklable recipe for a worker's dendrite and token verifier: reopens the validator's wallet by name.
+    """
+
+    def __init__(self, wallet):
+        self.name = wallet.name
+        self.hotkey = wallet.hotkey_str
+        self.path = wallet.path
+
+    def __call__(self):
+        wallet = bt.wallet(name=self.name, hotkey=self.hotkey, path=self.path)
+        return bt.dendrite(wallet=wallet), TotpCache().verify
+
+
+def _worker_main(conn, factory, engine_kwargs: dict):
+    try:
+        asyncio.run(_worker_loop(conn, factory, engine_kwargs))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Stop bittensor's log queue listener before multiprocessing closes its queue at exit,
+        # otherwise the listener thread dies on EOF with a traceback.
+        listener = getattr(bt.logging, "_listener", None)
+        if listener is not None:
+            listener.stop()
+            atexit.unregister(listener.stop)
+
+
+_READY = ("ready",)
+
+
+async def _worker_loop(conn, factory, engine_kwargs: dict):
+    dendrite, verify_token = factory()
+    engine = PingEngine(dendrite, verify_token, **engine_kwargs)
+    conn.send(_READY)
+    loop = asyncio.get_running_loop()
+    inbox = asyncio.Queue()
+
+    def on_readable():
+        try:
+            while conn.poll():
+                inbox.put_nowait(conn.recv())
+        except (EOFError, OSError):
+            loop.remove_reader(conn.fileno())
+            inbox.put_nowait(None)
+
+    async def run_round(round_id: int, targets):
+        neurons = [SimpleNamespace(key=key, hotkey=hotkey, axon_info=axon) for key, hotkey, axon in targets]
+        async for result in engine.stream(neurons):
+            conn.send((round_id, result.neuron.key, result.success, result.rtt, result.stage))
+
+    loop.add_reader(conn.fileno(), on_readable)
+    rounds = set()
+    try:
+        while True:
+            message = await inbox.get()
+            if message is None:
+                break
+            task = asyncio.create_task(run_round(*message))
+            rounds.add(task)
+            task.add_done_callback(rounds.discard)
+    finally:
+        for task in rounds:
+            task.cancel()
+        await asyncio.gather(*rounds, return_exceptions=True)
+        try:
+            await dendrite.aclose_session()
+        except Exception:
+            pass
+
+
+class _Worker:
+    __slots__ = ("index", "process", "conn", "outstanding", "last_progress", "ready")
+
+    def __init__(self, index: int, process, conn):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.outstanding = {}   # key -> (hotkey, axon) of the current round
+        self.last_progress = 0.0
+        self.ready = False
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+
+class ShardedPingEngine:
+    """
+    Drop-in for PingEngine (`ping` and `stream`) backed by `num_workers` processes built from `factory`,
+    a picklable callable returning (dendrite, verify_token). `concurrency` is the total number of pings
+    in flight, split across the workers. Workers start on the first round or on `start`; `close` stops them.
+    A worker with outstanding pings that sends no result for `stall_timeout` seconds (by default the
+    worst-case time of one ping plus PING_WORKER_STALL_GRACE) is treated as dead.
+    """
+
+    def __init__(
+        self,
+        factory,
+        num_workers: int,
+        concurrency: int = merit_config.PING_CONCURRENCY,
+        timeout: float = merit_config.PING_TIMEOUT,
+        retry_attempts: int = merit_config.PING_RETRY_ATTEMPTS,
+        retry_delay: float = merit_config.PING_RETRY_DELAY,
+        probe: bool = merit_config.PING_PROBE_PORT,
+        max_restarts: int = merit_config.PING_WORKER_MAX_RESTARTS,
+        stall_timeout: float = None,
+    ):
+        self.factory = factory
+        self.num_workers = max(1, num_workers)
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.retry_delay = retry_delay
+        self.probe = probe
+        self.max_restarts = max_restarts
+        if stall_timeout is None:
+            # Each in-flight ping ends within its probe attempts plus one synapse call.
+            attempts = max(1, retry_attempts)
+            probe_time = attempts * (merit_config.PING_PROBE_TIMEOUT + retry_delay) if probe else 0.0
+            stall_timeout = probe_time + timeout + merit_config.PING_WORKER_STALL_GRACE
+        self.stall_timeout = stall_timeout
+        self.restarts = 0
+        self.workers = []
+        self._context = multiprocessing.get_context("spawn")
+        self._round = 0
+
+    def _engine_kwargs(self) -> dict:
+        return {
+            "concurrency": -(-self.concurrency // self.num_workers),
+            "timeout": self.timeout,
+            "retry_attempts": self.retry_attempts,
+            "retry_delay": self.retry_delay,
+            "probe": self.probe,
+        }
+
+    def _spawn(self, index: int) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe(duplex=True)
+        process = self._context.Process(
+            target=_worker_main, args=(child_conn, self.factory, self._engine_kwargs()),
+            name=f"merit-ping-{index}", daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(index, process, parent_conn)
+
+    def start(self):
+        """
+        Starts the workers now rather than on the first round (each needs a few seconds to import bittensor).
+        """
+        if not self.workers:
+            self.workers = [self._spawn(index) for index in range(self.num_workers)]
+            bt.logging.info(f"Started {self.num_workers} ping worker processes.")
+
+    def _shard(self, hotkey: str) -> int:
+        return zlib.crc32(hotkey.encode("utf-8")) % self.num_workers
+
+    async def ping(self, neuron) -> PingResult:
+        results = self.stream([neuron])
+        try:
+            return await results.__anext__()
+        finally:
+            await results.aclose()
+
+    async def stream(self, neurons):
+        """
+        Async generator yielding a PingResult per neuron in completion order.
+        """
+        neurons = list(neurons)
+        if not neurons:
+            return
+        self.start()
+        self._round += 1
+        round_id = self._round
+        restarts_left = self.max_restarts
+        loop = asyncio.get_running_loop()
+        results = asyncio.Queue()
+
+        def on_readable(worker: _Worker):
+            try:
+                while worker.conn.poll():
+                    message = worker.conn.recv()
+                    worker.last_progress = time.monotonic()
+                    if message == _READY:
+                        worker.ready = True
+                        continue
+                    rid, key, success, rtt, stage = message
+                    if rid == round_id and worker.outstanding.pop(key, None) is not None:
+                        results.put_nowait(PingResult(neurons[key], success, rtt, stage))
+            except (EOFError, OSError):
+                loop.remove_reader(worker.conn.fileno())
+                results.put_nowait(worker)  # worker died
+
+        def dispatch(worker: _Worker):
+            worker.last_progress = time.monotonic()
+            if worker.outstanding:
+                targets = [(key, hotkey, axon) for key, (hotkey, axon) in worker.outstanding.items()]
+                try:
+                    worker.conn.send((round_id, targets))
+                except OSError:
+                    results.put_nowait(worker)
+                    return
+            loop.add_reader(worker.conn.fileno(), on_readable, worker)
+
+        for worker in self.workers:
+            worker.outstanding = {}
+        for key, neuron in enumerate(neurons):
+            self.workers[self._shard(neuron.hotkey)].outstanding[key] = (neuron.hotkey, neuron.axon_info)
+        for worker in list(self.workers):
+            dispatch(worker if worker.alive else self._respawn(worker))
+
+        def deadline(worker: _Worker) -> float:
+            # A worker still starting up gets until PING_WORKER_START_TIMEOUT to report ready.
+            allowed = self.stall_timeout
+            if not worker.ready:
+                allowed = max(allowed, merit_config.PING_WORKER_START_TIMEOUT)
+            return worker.last_progress + allowed
+
+        def stalled() -> list:
+            now = time.monotonic()
+            return [w for w in self.workers if w.outstanding and deadline(w) <= now]
+
+        def next_deadline() -> float:
+            busy = [deadline(w) for w in self.workers if w.outstanding]
+            return max(0.0, min(busy) - time.monotonic()) if busy else self.stall_timeout
+
+        remaining = len(neurons)
+        hung = []
+        try:
+            while remaining:
+                if hung:
+                    item = hung.pop()
+                else:
+                    try:
+                        item = await asyncio.wait_for(results.get(), timeout=next_deadline())
+                    except asyncio.TimeoutError:
+                        for worker in stalled():
+                            bt.logging.warning(f"Ping worker {worker.index} stopped responding, terminating it.")
+                            try:
+                                loop.remove_reader(worker.conn.fileno())
+                            except (OSError, ValueError):
+                                pass
+                            worker.process.terminate()
+                            hung.append(worker)
+                        continue
+                if isinstance(item, PingResult):
+                    remaining -= 1
+                    yield item
+                    continue
+                if item is not self.workers[item.index] or not item.outstanding:
+                    continue  # already replaced, e.g. EOF after a stall termination
+                # A worker died or hung: restart it and resend what it had not answered.
+                lost = item.outstanding
+                bt.logging.warning(f"Ping worker {item.index} lost with {len(lost)} pings outstanding.")
+                if restarts_left > 0:
+                    restarts_left -= 1
+                    dispatch(self._respawn(item))
+                    continue
+                item.outstanding = {}
+                for key in lost:
+                    remaining -= 1
+                    yield PingResult(neurons[key], False, stage=EXCEPTION)
+        finally:
+            for worker in self.workers:
+                try:
+                    loop.remove_reader(worker.conn.fileno())
+                except (OSError, ValueError):
+                    pass
+                if worker.outstanding:
+                    # Round abandoned by the caller: nobody reads the worker's late results, which would
+                    # eventually block it on a full pipe, so it is replaced on the next round instead.
+                    worker.process.terminate()
+                    worker.outstanding = {}
+
+    def _respawn(self, worker: _Worker) -> _Worker:
+        """
+        Replaces a dead worker in place; the replacement takes over its outstanding targets.
+        """
+        worker.conn.close()
+        worker.process.join(timeout=1.0)
+        self.restarts += 1
+        replacement = self.workers[worker.index] = self._spawn(worker.index)
+        replacement.outstanding = worker.outstanding
+        worker.outstanding = {}
+        return replacement
+
+    def close(self):
+        for worker in self.workers:
+            try:
+                worker.conn.close()
+            except OSError:
+                pass
+        for worker in self.workers:
+            worker.process.join(timeout=5.0)
+            if worker.process.is_alive():
+                worker.process.terminate()
+        self.workers = []
@@ -0,0 +1,98 @@
+import time
+
+from merit.config import merit_config
+
+
+class MinerReliability:
+    __slots__ = ("streak", "failures", "last_ping", "next_ping")
+
+    def __init__(self):
+        self.streak = 0       # consecutive successes
+        self.failures = 0     # consecutive failures
+        self.last_ping = 0.0
+        self.next_ping = 0.0
+
+
+class PingScheduler:
+    """
+    Decides which miners are due for a ping from their recent history.
+
+    New or just-recovered miners and miners that just failed are rechecked after `min_interval`;
+    each further consecutive failure doubles that, up to `max_interval`, so dead axons fade out.
+    Miners with a few successes in a row are pinged every `base_interval` (the ping frequency),
+    and each further `stable_streak` successes doubles that, up to `max_interval`. With
+    `adaptive=False` every miner is due every `base_interval`, as before.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        min_interval: float = merit_config.PING_SCHEDULER_MIN_INTERVAL,
+        max_interval: float = None,
+        stable_streak: int = merit_config.PING_SCHEDULER_STABLE_STREAK,
+        adaptive: bool = True,
+    ):
+        self.base_interval = base_interval
+        self.min_interval = min(min_interval, base_interval)
+        self.max_interval = max(max_interval or base_interval * merit_config.PING_SCHEDULER_MAX_FACTOR, base_interval)
+        self.stable_streak = max(1, stable_streak)
+        self.adaptive = adaptive
+        self._state = {}
+
+    def interval(self, hotkey: str) -> float:
+        state = self._state.get(hotkey)
+        if not self.adaptive:
+            return self.base_interval
+        if state is not None and state.failures:
+            return min(self.min_interval * 2 ** (state.failures - 1), self.max_interval)
+        if state is None or state.streak < 2:
+            return self.min_interval
+        if state.streak < self.stable_streak:
+            return self.base_interval
+        return min(self.base_interval * 2 ** (state.streak // self.stable_streak), self.max_interval)
+
+    def record(self, hotkey: str, success: bool, now: float = None):
+        now = time.time() if now is None else now
+        state = self._state.get(hotkey)
+        if state is None:
+            state = self._state[hotkey] = MinerReliability()
+        if success:
+            state.streak += 1
+            state.failures = 0
+        else:
+            state.streak = 0
+            state.failures += 1
+        state.last_ping = now
+        # A small margin keeps miners pinged on the same tick together on later ticks.
+        state.next_ping = now + self.interval(hotkey) - merit_config.PING_SCHEDULER_TICK / 2
+
+    def is_due(self, hotkey: str, now: float = None) -> bool:
+        state = self._state.get(hotkey)
+        if state is None:
+            return True
+        return (time.time() if now is None else now) >= state.next_ping
+
+    def due(self, neurons, now: float = None) -> list:
+        now = time.time() if now is None else now
+        return [neuron for neuron in neurons if self.is_due(neuron.hotkey, now)]
+
+    def next_due_in(self, neurons, now: float = None) -> float:
+        """
+        Seconds until the earliest of `neurons` becomes due (0 if one already is).
+        """
+        now = time.time() if now is None else now
+        soonest = self.max_interval
+        for neuron in neurons:
+            state = self._state.get(neuron.hotkey)
+            if state is None:
+                return 0.0
+            soonest = min(soonest, state.next_ping - now)
+        return max(soonest, 0.0)
+
+    def retain(self, hotkeys):
+        keep = set(hotkeys)
+        for hotkey in [h for h in self._state if h not in keep]:
+            del self._state[hotkey]
+
+    def __len__(self) -> int:
+        return len(self._state)
@@ -0,0 +1,63 @@
+import bittensor as bt
+import asyncio
+
+from merit.config import merit_config
+
+
+class RegistrationWatcher:
+    """
+    Watches one hotkey's registration with a single UID lookup (get_uid_for_hotkey_on_subnet) run on
+    the chain worker thread, instead of pulling the whole metagraph. The recheck interval doubles
+    after every check up to `max_interval` (also after failed queries, so an unreachable chain is not
+    hammered) and falls back to `min_interval` when the UID changes.
+    """
+
+    def __init__(
+        self,
+        chain,
+        hotkey: str,
+        netuid: int,
+        uid: int = None,
+        min_interval: float = merit_config.MINER_REGISTRATION_MIN_INTERVAL,
+        max_interval: float = merit_config.MINER_REGISTRATION_MAX_INTERVAL,
+    ):
+        self.chain = chain
+        self.hotkey = hotkey
+        self.netuid = netuid
+        self.uid = uid
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.interval = min_interval
+
+    async def poll(self) -> bool:
+        """
+        Checks the registration once and updates the interval. Returns False once the hotkey is deregistered.
+        """
+        try:
+            uid = await self.chain.get_uid_for_hotkey_on_subnet(self.hotkey, self.netuid)
+        except Exception as e:
+            bt.logging.warning(f"⚠️ Registration check failed: {e}")
+            self.interval = min(self.interval * 2, self.max_interval)
+            return True
+
+        if uid is None:
+            return False
+        if self.uid is not None and uid != self.uid:
+            bt.logging.warning(f"Miner hotkey {self.hotkey} moved from UID {self.uid} to UID {uid}.")
+            self.interval = self.min_interval
+        else:
+            bt.logging.debug(f"✅ Miner hotkey {self.hotkey} still registered on subnet {self.netuid} (UID {uid}).")
+            self.interval = min(self.interval * 2, self.max_interval)
+        self.uid = uid
+        return True
+
+    async def watch(self, on_deregistered):
+        """
+        Polls until the hotkey is deregistered, then calls `on_deregistered()` and returns.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            if not await self.poll():
+                bt.logging.error(f"❌ Miner hotkey {self.hotkey} is no longer registered on subnet {self.netuid}.")
+                on_deregistered()
+                return
@@ -0,0 +1,207 @@
+"""
+Offline replay of recorded validator inputs through the scoring and weight model, with no chain or
+network access.
+
+Inputs are epoch store directories (the recorded per-miner BMPs of every epoch) and warm-start snapshot
+files, re-scored with the validator's own rules (scoring.is_reachable / scoring.score_neuron) from their
+metagraph, cross-subnet incentives, incentive EMAs and ping outcomes. Rolling uptime is not part of a
+snapshot; pass the validator's health file to apply it, otherwise only the latest ping counts.
+Each scenario is a burner weight and S-curve.
+Epochs that share the same UID vector are stacked and weighted in one batch_normalized_weights call,
+so months of epochs replay in one process in seconds.
+"""
+import itertools
+import json
+import os
+
+import numpy as np
+
+from merit.neuron import scoring
+from merit.neuron.incentive_index import IncentiveIndex
+from merit.neuron.incentive_series import IncentiveSeries
+from merit.neuron.ping_history import PingHistory
+from merit.neuron.weights import DEFAULT_BURNER_UID, DEFAULT_BURNER_WEIGHT, DEFAULT_S_CURVE, batch_normalized_weights
+from merit.storage.epoch_store import EpochStore
+from merit.storage.snapshot import load_snapshot
+
+REPLAY_BATCH_SIZE = 1024  # Epochs weighted per batch_normalized_weights call
+
+
+class ReplayEpoch:
+    __slots__ = ("block", "uids", "scores", "recorded_weights")
+
+    def __init__(self, block: int, uids: tuple, scores, recorded_weights=None):
+        self.block = block
+        self.uids = uids
+        self.scores = scores
+        self.recorded_weights = recorded_weights  # aligned with uids, NaN where nothing was recorded
+
+
+class Scenario:
+    __slots__ = ("name", "burner_weight", "s_curve")
+
+    def __init__(self, burner_weight: float = DEFAULT_BURNER_WEIGHT, s_curve=DEFAULT_S_CURVE, name: str = None):
+        self.burner_weight = burner_weight
+        self.s_curve = tuple(s_curve)
+        self.name = name or f"burn={burner_weight:g} s_curve={','.join(f'{c:g}' for c in self.s_curve)}"
+
+
+def _with_burner(uids: list, scores: list, weights: list):
+    # The validator always puts the burner UID first, even when it is a skipped validator.
+    if DEFAULT_BURNER_UID not in uids:
+        uids.insert(0, DEFAULT_BURNER_UID)
+        scores.insert(0, 0.0)
+        weights.insert(0, float("nan"))
+    return tuple(uids), scores, weights
+
+
+def epochs_from_store(root: str, since_block: int = None):
+    """
+    Yields a ReplayEpoch per stored epoch, using the BMPs and weights recorded at the time.
+    """
+    for block, summary in EpochStore(root).iter_epochs(since_block):
+        rows = sorted(summary.values(), key=lambda row: row["uid"])
+        uids, scores, weights = _with_burner(
+            [row["uid"] for row in rows], [row["bmps"] for row in rows], [row["weight"] for row in rows]
+        )
+        yield ReplayEpoch(block, uids, scores, weights)
+
+
+def evaluate_snapshot(snapshot, ping_history=None) -> ReplayEpoch:
+    """
+    Scores a warm-start snapshot with the rules of Validator._evaluate_miners: the same skip,
+    reachability (latest ping, else rolling uptime from `ping_history`, a PingHistory) and scoring
+    functions, and the smoothed BMPs when the snapshot carries incentive EMAs.
+    """
+    metagraph = snapshot.metagraph
+    skip_netuids = (0, metagraph.netuid)
+    index = IncentiveIndex(snapshot.infos, skip_netuids=skip_netuids)
+    num_expected_subnets = len(index.netuids)
+    neurons = [neuron for neuron in metagraph.neurons if not scoring.should_skip_neuron(neuron)]
+
+    smoothed = [None] * len(neurons)
+    if snapshot.incentive_series is not None:
+        series = IncentiveSeries(skip_netuids=skip_netuids)
+        series.restore(snapshot.incentive_series)
+        smoothed = series.bmps([neuron.hotkey for neuron in neurons], num_expected_subnets)
+
+    uids, scores = [], []
+    for neuron, smoothed_bmps in zip(neurons, smoothed):
+        reachable = scoring.is_reachable(neuron, snapshot.ping_success.get(neuron.hotkey, False), ping_history)
+        uids.append(neuron.uid)
+        scores.append(scoring.score_neuron(neuron, reachable, index.get(neuron.hotkey), num_expected_subnets,
+                                           smoothed_bmps))
+    uids, scores, weights = _with_burner(uids, scores, [float("nan")] * len(uids))
+    block = max((info.last_step or 0 for info in snapshot.infos), default=0)
+    return ReplayEpoch(block, uids, scores, weights)
+
+
+def load_ping_history(path: str):
+    """
+    PingHistory from a validator health file, or None if `path` is unset or missing.
+    """
+    if not path or not os.path.isfile(path):
+        return None
+    with open(path, "r") as f:
+        return PingHistory.from_dict(json.load(f))
+
+
+def load_epochs(paths, since_block: int = None, ping_history=None):
+    """
+    Yields ReplayEpochs from epoch store directories, snapshot files and directories of snapshot files.
+    `ping_history` supplies rolling uptime for snapshots.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            if any(name.startswith("seg_") for name in os.listdir(path)):
+                yield from epochs_from_store(path, since_block)
+                continue
+            files = sorted(os.path.join(path, name) for name in os.listdir(path) if name.endswith(".json.gz"))
+        else:
+            files = [path]
+        for file in files:
+            snapshot = load_snapshot(file, max_age=0)
+            if snapshot is None:
+                continue
+            epoch = evaluate_snapshot(snapshot, ping_history)
+            if since_block is None or epoch.block >= since_block:
+                yield epoch
+
+
+def _batches(epochs, batch_size: int):
+    """
+    Groups consecutive epochs with the same UID vector, at most `batch_size` per group.
+    """
+    for uids, group in itertools.groupby(epochs, key=lambda epoch: epoch.uids):
+        group = iter(group)
+        while True:
+            chunk = list(itertools.islice(group, batch_size))
+            if not chunk:
+                break
+            yield uids, chunk
+
+
+def replay(epochs, scenarios, batch_size: int = REPLAY_BATCH_SIZE) -> dict:
+    """
+    Weights every epoch under every scenario. Returns {scenario name: [per-epoch result dict, ...]} with
+    the burner weight, number of weighted miners, top miner weight and the largest difference from the
+    weights recorded at the time (None if nothing was recorded).
+    """
+    results = {scenario.name: [] for scenario in scenarios}
+    for uids, chunk in _batches(epochs, batch_size):
+        uid_array = np.asarray(uids)
+        is_burner = uid_array == DEFAULT_BURNER_UID
+        scores = np.array([epoch.scores for epoch in chunk], dtype=np.float64)
+        recorded = np.array([epoch.recorded_weights for epoch in chunk], dtype=np.float64)
+        for scenario in scenarios:
+            weights = batch_normalized_weights(
+                uid_array, scores, burner_weight=scenario.burner_weight, s_curve=scenario.s_curve
+            )
+            miner_weights = weights[:, ~is_burner]
+            with np.errstate(invalid="ignore"):
+                diffs = np.abs(np.where(np.isnan(recorded), 0.0, weights - recorded))
+            has_recorded = ~np.all(np.isnan(recorded), axis=1)
+            for row, epoch in enumerate(chunk):
+                results[scenario.name].append({
+                    "block": epoch.block,
+                    "burn": float(weights[row, is_burner].sum()),
+                    "miners": int((miner_weights[row] > 0).sum()),
+                    "top_weight": float(miner_weights[row].max()) if miner_weights.shape[1] else 0.0,
+                    "max_diff": float(diffs[row].max()) if has_recorded[row] else None,
+                })
+    return results
+
+
+def summarize(results: dict) -> str:
+    lines = [f"{'scenario':<60} {'epochs':>7} {'burn':>7} {'miners':>8} {'top wt':>8} {'max |dw|':>9}"]
+    for name, rows in results.items():
+        if not rows:
+            lines.append(f"{name:<60} {0:>7}")
+            continue
+        diffs = [row["max_diff"] for row in rows if row["max_diff"] is not None]
+        lines.append(
+            f"{name:<60} {len(rows):>7} {np.mean([r['burn'] for r in rows]):>7.3f} "
+            f"{np.mean([r['miners'] for r in rows]):>8.1f} {np.mean([r['top_weight'] for r in rows]):>8.4f} "
+            f"{(max(diffs) if diffs else float('nan')):>9.2e}"
+        )
+    return "\n".join(lines)
+
+
+def run_replay(paths, burner_weights=None, s_curves=None, since_block: int = None, output: str = None,
+               health: str = None) -> dict:
+    """
+    Entry point for `run_validator.py --replay`: replays `paths` under every burner weight x S-curve
+    combination, prints a summary and optionally writes the per-epoch results to `output` as JSON.
+    `health` is a validator health file whose rolling uptime applies to snapshots.
+    """
+    scenarios = [
+        Scenario(burner_weight, s_curve)
+        for burner_weight in (burner_weights or [DEFAULT_BURNER_WEIGHT])
+        for s_curve in (s_curves or [DEFAULT_S_CURVE])
+    ]
+    results = replay(load_epochs(paths, since_block, load_ping_history(health)), scenarios)
+    print(summarize(results))
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f)
+    return results
@@ -0,0 +1,66 @@
+"""
+Per-miner scoring rules shared by the live validator and offline replay. Kept free of bittensor imports.
+"""
+import ipaddress
+
+from merit.config import merit_config
+
+BMPS_SCALE = 100000
+
+
+def is_valid_public_ipv4(ip: str) -> bool:
+    try:
+        parsed_ip = ipaddress.IPv4Address(ip)
+        return parsed_ip.is_global
+    except ipaddress.AddressValueError:
+        return False
+
+
+def has_valid_axon(neuron) -> bool:
+    axon = neuron.axon_info
+    return is_valid_public_ipv4(axon.ip) and axon.port != 0
+
+
+def should_skip_neuron(neuron) -> bool:
+    """
+    Validators (any dividends or validator trust) are neither pinged nor scored.
+    """
+    try:
+        return neuron.dividends > 0 or neuron.validator_trust > 0
+    except Exception:
+        return False
+
+
+def bmps(incentives_by_netuid: dict, num_expected_subnets: int) -> float:
+    """
+    A miner's BMPs: its incentive summed over the tracked subnets, averaged over all of them and scaled.
+    """
+    avg_incentive = (
+        sum(incentives_by_netuid.values()) / num_expected_subnets if num_expected_subnets > 0 else 0.0
+    )
+    return avg_incentive * BMPS_SCALE
+
+
+def is_reachable(neuron, latest_ping_success: bool, ping_history=None) -> bool:
+    """
+    A miner counts as reachable if its latest ping succeeded or its rolling uptime in `ping_history`
+    (a PingHistory) is still above UPTIME_THRESHOLD, so a single dropped ping does not zero its BMPs.
+    """
+    if latest_ping_success:
+        return True
+    if ping_history is None or ping_history.samples(neuron.uid, neuron.hotkey) < merit_config.UPTIME_MIN_SAMPLES:
+        return False
+    return ping_history.uptime(neuron.uid, neuron.hotkey) >= merit_config.UPTIME_THRESHOLD
+
+
+def score_neuron(neuron, reachable: bool, incentives_by_netuid: dict, num_expected_subnets: int,
+                 smoothed_bmps: float = None) -> float:
+    """
+    A miner's score: 0 without a valid public axon or when unreachable, else its BMPs (the smoothed
+    value when incentive smoothing is on).
+    """
+    if not has_valid_axon(neuron) or not reachable:
+        return 0.0
+    if smoothed_bmps is not None:
+        return float(smoothed_bmps)
+    return bmps(incentives_by_netuid, num_expected_subnets)
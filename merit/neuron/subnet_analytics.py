@@ -0,0 +1,217 @@
+"""
+Running per-subnet statistics for popularity rankings, maintained from the MetagraphDiffs produced by
+SubnetInfoCache: registrations, deregistrations, hotkey churn, incentive mass and registration
+difficulty class. Each update touches only the subnets a refresh refetched, and windowed counts
+expire from a single event queue, so nothing is ever recomputed from history.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+
+from merit.config import merit_config
+
+
+class SubnetStats:
+    __slots__ = (
+        "netuid", "hotkeys", "incentive_mass", "difficulty", "burn", "registration_allowed", "difficulty_class",
+        "registrations", "deregistrations", "window_registrations", "window_deregistrations", "tracked_since",
+    )
+
+    def __init__(self, netuid: int, tracked_since: float):
+        self.netuid = netuid
+        self.hotkeys = 0
+        self.incentive_mass = 0.0
+        self.difficulty = None
+        self.burn = None
+        self.registration_allowed = None
+        self.difficulty_class = None
+        self.registrations = 0              # since tracking started
+        self.deregistrations = 0
+        self.window_registrations = 0       # within the analytics window
+        self.window_deregistrations = 0
+        self.tracked_since = tracked_since
+
+    @property
+    def churn_rate(self) -> float:
+        """
+        Share of the subnet's hotkeys deregistered within the window.
+        """
+        return self.window_deregistrations / self.hotkeys if self.hotkeys else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "hotkeys": self.hotkeys,
+            "incentive_mass": self.incentive_mass,
+            "difficulty": self.difficulty,
+            "burn": self.burn,
+            "difficulty_class": self.difficulty_class,
+            "registrations": self.registrations,
+            "deregistrations": self.deregistrations,
+            "window_registrations": self.window_registrations,
+            "window_deregistrations": self.window_deregistrations,
+            "churn_rate": self.churn_rate,
+            "tracked_since": self.tracked_since,
+        }
+
+
+def difficulty_class(info, burn_classes=merit_config.ANALYTICS_BURN_CLASSES) -> str:
+    """
+    "closed" when registration is off, else the first class whose burn ceiling (TAO) covers the
+    subnet's registration burn; "unknown" when the burn is not known (e.g. restored from a snapshot).
+    """
+    if getattr(info, "registration_allowed", None) is False:
+        return "closed"
+    burn = getattr(info, "burn", None)
+    if burn is None:
+        return "unknown"
+    for ceiling, name in burn_classes:
+        if burn <= ceiling:
+            return name
+    return burn_classes[-1][1]
+
+
+class SubnetAnalytics:
+    """
+    Subnets first seen in a refresh are taken as a baseline: their current hotkeys are not counted as
+    registrations. Thread-safe, since the dashboard server renders from its own threads.
+    """
+
+    RANKINGS = {
+        "registrations": lambda s: s.window_registrations,
+        "churn": lambda s: s.churn_rate,
+        "incentive_mass": lambda s: s.incentive_mass,
+        "hotkeys": lambda s: s.hotkeys,
+    }
+
+    def __init__(self, window: float = merit_config.ANALYTICS_WINDOW,
+                 burn_classes=merit_config.ANALYTICS_BURN_CLASSES):
+        self.window = window
+        self.burn_classes = burn_classes
+        self.subnets = {}           # netuid -> SubnetStats
+        self.classes = {}           # difficulty class -> set of netuids
+        self.total_registrations = 0
+        self.total_deregistrations = 0
+        self.total_incentive_mass = 0.0
+        self.version = 0
+        self.last_modified = time.time()
+        self._events = deque()      # (time, netuid, registrations, deregistrations), oldest first
+        self._rendered = None
+        self._lock = threading.Lock()
+
+    def update(self, diff, infos: dict, now: float = None):
+        """
+        Applies a MetagraphDiff; `infos` is the cache's netuid -> SubnetInfo map after the refresh.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            for netuid in diff.refreshed:
+                info = infos.get(netuid)
+                if info is None:
+                    self._remove(netuid)
+                    continue
+                stats = self.subnets.get(netuid)
+                if stats is None:
+                    stats = self.subnets[netuid] = SubnetStats(netuid, now)
+                else:
+                    registered = len(diff.added.get(netuid, ()))
+                    deregistered = len(diff.removed.get(netuid, ()))
+                    if registered or deregistered:
+                        self._record(stats, now, registered, deregistered)
+                self._refresh_stats(stats, info)
+            self._expire(now)
+            self._changed()
+
+    def _refresh_stats(self, stats: SubnetStats, info):
+        mass = float(sum(info.incentives))
+        self.total_incentive_mass += mass - stats.incentive_mass
+        stats.incentive_mass = mass
+        stats.hotkeys = len(info.hotkeys)
+        stats.difficulty = getattr(info, "difficulty", None)
+        stats.burn = getattr(info, "burn", None)
+        stats.registration_allowed = getattr(info, "registration_allowed", None)
+        cls = difficulty_class(info, self.burn_classes)
+        if cls != stats.difficulty_class:
+            if stats.difficulty_class is not None:
+                self.classes[stats.difficulty_class].discard(stats.netuid)
+            self.classes.setdefault(cls, set()).add(stats.netuid)
+            stats.difficulty_class = cls
+
+    def _record(self, stats: SubnetStats, now: float, registered: int, deregistered: int):
+        stats.registrations += registered
+        stats.deregistrations += deregistered
+        stats.window_registrations += registered
+        stats.window_deregistrations += deregistered
+        self.total_registrations += registered
+        self.total_deregistrations += deregistered
+        self._events.append((now, stats.netuid, registered, deregistered))
+
+    def _expire(self, now: float):
+        cutoff = now - self.window
+        while self._events and self._events[0][0] < cutoff:
+            _, netuid, registered, deregistered = self._events.popleft()
+            stats = self.subnets.get(netuid)
+            if stats is not None:
+                stats.window_registrations -= registered
+                stats.window_deregistrations -= deregistered
+
+    def _remove(self, netuid: int):
+        stats = self.subnets.pop(netuid, None)
+        if stats is None:
+            return
+        self.total_incentive_mass -= stats.incentive_mass
+        if stats.difficulty_class is not None:
+            self.classes[stats.difficulty_class].discard(netuid)
+
+    def _changed(self):
+        self.version += 1
+        self.last_modified = time.time()
+        self._rendered = None
+
+    # Queries ----------------------------------------------------------------
+
+    def get(self, netuid: int):
+        return self.subnets.get(netuid)
+
+    def ranking(self, by: str = "registrations", limit: int = None) -> list:
+        """
+        Netuids ordered by `by` (registrations in the window, churn, incentive_mass or hotkeys), highest first.
+        """
+        key = self.RANKINGS[by]
+        with self._lock:
+            ranked = sorted(self.subnets.values(), key=lambda s: (-key(s), s.netuid))
+        return [stats.netuid for stats in ranked[:limit]]
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return self._to_dict()
+
+    def _to_dict(self) -> dict:
+        return {
+            "window": self.window,
+            "subnets": {str(netuid): stats.to_dict() for netuid, stats in sorted(self.subnets.items())},
+            "classes": {cls: sorted(netuids) for cls, netuids in sorted(self.classes.items()) if netuids},
+            "total_registrations": self.total_registrations,
+            "total_deregistrations": self.total_deregistrations,
+            "total_incentive_mass": self.total_incentive_mass,
+        }
+
+    def render(self):
+        """
+        Returns (body, etag) for the dashboard API, cached until the next update.
+        """
+        with self._lock:
+            if self._rendered is None:
+                body = json.dumps(self._to_dict(), separators=(",", ":")).encode("utf-8")
+                self._rendered = (body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+            return self._rendered
+
+    def summary(self, limit: int = 5) -> str:
+        top = ", ".join(
+            f"{netuid} (+{self.subnets[netuid].window_registrations})" for netuid in self.ranking(limit=limit)
+        )
+        return (
+            f"{len(self.subnets)} subnets, +{self.total_registrations} / -{self.total_deregistrations} hotkeys "
+            f"since start; most registrations: {top or 'none'}"
+        )
@@ -0,0 +1,165 @@
+import bittensor as bt
+import time
+from array import array
+
+from merit.config import merit_config
+from merit.neuron.subnet_analytics import SubnetAnalytics
+
+
+class MetagraphDiff:
+    """
+    Per-netuid hotkey changes between two cross-subnet snapshots.
+    """
+    __slots__ = ("added", "removed", "changed", "refreshed", "full")
+
+    def __init__(self, full: bool = False):
+        self.added = {}      # netuid -> set of hotkeys that registered
+        self.removed = {}    # netuid -> set of hotkeys that left
+        self.changed = {}    # netuid -> set of hotkeys whose incentive changed
+        self.refreshed = []  # netuids refetched (including subnets that appeared or disappeared)
+        self.full = full
+
+    def add_subnet_diff(self, netuid: int, old_info, new_info):
+        old = dict(zip(old_info.hotkeys, old_info.incentives)) if old_info is not None else {}
+        new = dict(zip(new_info.hotkeys, new_info.incentives)) if new_info is not None else {}
+        self.refreshed.append(netuid)
+        added = new.keys() - old.keys()
+        removed = old.keys() - new.keys()
+        changed = {hotkey for hotkey, incentive in new.items() if hotkey in old and old[hotkey] != incentive}
+        if added:
+            self.added[netuid] = set(added)
+        if removed:
+            self.removed[netuid] = set(removed)
+        if changed:
+            self.changed[netuid] = changed
+
+    def affected_hotkeys(self, skip_netuids=()) -> set:
+        """
+        Union of hotkeys whose cross-subnet incentives may differ, ignoring `skip_netuids`.
+        """
+        affected = set()
+        for per_netuid in (self.added, self.removed, self.changed):
+            for netuid, hotkeys in per_netuid.items():
+                if netuid not in skip_netuids:
+                    affected |= hotkeys
+        return affected
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self) -> str:
+        return (
+            f"{'full' if self.full else 'incremental'} refresh of {len(self.refreshed)} subnets: "
+            f"+{sum(map(len, self.added.values()))} / -{sum(map(len, self.removed.values()))} hotkeys, "
+            f"{sum(map(len, self.changed.values()))} incentive changes"
+        )
+
+
+class SubnetInfo:
+    """
+    The part of a chain MetagraphInfo the validator reads: hotkeys as a tuple of strings interned
+    across subnets, incentives packed as float32, and the registration parameters used by subnet
+    analytics (None when the source did not carry them, e.g. a warm-start snapshot).
+    """
+    __slots__ = ("netuid", "last_step", "hotkeys", "incentives", "difficulty", "burn", "registration_allowed")
+
+    def __init__(self, netuid: int, last_step, hotkeys: tuple, incentives: array,
+                 difficulty=None, burn=None, registration_allowed=None):
+        self.netuid = netuid
+        self.last_step = last_step
+        self.hotkeys = hotkeys
+        self.incentives = incentives
+        self.difficulty = difficulty
+        self.burn = burn
+        self.registration_allowed = registration_allowed
+
+
+class SubnetInfoCache:
+    """
+    Local snapshot of every subnet's metagraph info, refreshed incrementally.
+    Each round reads the cheap per-subnet `last_step` from `all_subnets()` and refetches only subnets
+    whose epoch has stepped (incentives only move on a step) or that appeared; a full
+    `get_all_metagraphs_info()` is still done periodically and when most subnets changed at once.
+    Infos are stored as compact SubnetInfo records and the chain objects are dropped on ingest.
+    Every diff is also applied to `analytics` (a SubnetAnalytics).
+    """
+
+    def __init__(
+        self,
+        chain,
+        full_refresh_interval: float = merit_config.SUBNET_FULL_REFRESH_INTERVAL,
+        full_refresh_ratio: float = merit_config.SUBNET_FULL_REFRESH_RATIO,
+    ):
+        self.chain = chain
+        self.full_refresh_interval = full_refresh_interval
+        self.full_refresh_ratio = full_refresh_ratio
+        self.infos = {}       # netuid -> metagraph info
+        self.last_steps = {}  # netuid -> last_step block the cached info reflects
+        self.last_full_refresh = 0.0
+        self._hotkeys = {}    # hotkey -> the single string instance shared by every subnet
+        self.analytics = SubnetAnalytics()
+
+    def snapshot(self) -> list:
+        return [self.infos[netuid] for netuid in sorted(self.infos)]
+
+    def _compact(self, info) -> SubnetInfo:
+        pool = self._hotkeys
+        burn = getattr(info, "burn", None)
+        return SubnetInfo(
+            int(info.netuid),
+            getattr(info, "last_step", None),
+            tuple(pool.setdefault(hotkey, hotkey) for hotkey in info.hotkeys),
+            array("f", info.incentives),
+            difficulty=getattr(info, "difficulty", None),
+            burn=float(getattr(burn, "tao", burn)) if burn is not None else None,
+            registration_allowed=getattr(info, "registration_allowed", None),
+        )
+
+    def seed(self, infos, refreshed_at: float = None) -> MetagraphDiff:
+        """
+        Replaces the whole snapshot with `infos` (a full fetch) and returns the diff against the previous one.
+        `refreshed_at` backdates the full refresh when seeding from a saved snapshot.
+        """
+        diff = MetagraphDiff(full=True)
+        self._hotkeys = {}  # a full fetch drops hotkeys that left every subnet from the pool
+        new_infos = {int(info.netuid): self._compact(info) for info in infos}
+        for netuid in sorted(self.infos.keys() | new_infos.keys()):
+            diff.add_subnet_diff(netuid, self.infos.get(netuid), new_infos.get(netuid))
+        self.infos = new_infos
+        self.last_steps = {netuid: info.last_step for netuid, info in new_infos.items()}
+        self.last_full_refresh = time.time() if refreshed_at is None else refreshed_at
+        self.analytics.update(diff, self.infos)
+        return diff
+
+    async def refresh(self) -> MetagraphDiff:
+        if not self.infos or time.time() - self.last_full_refresh >= self.full_refresh_interval:
+            return self.seed(await self.chain.get_all_metagraphs_info())
+
+        subnets = await self.chain.all_subnets() or []
+        live = {subnet.netuid: subnet.last_step for subnet in subnets}
+        stale = [netuid for netuid, last_step in live.items() if self.last_steps.get(netuid) != last_step]
+        gone = [netuid for netuid in self.infos if netuid not in live]
+
+        if len(stale) >= self.full_refresh_ratio * max(len(live), 1):
+            return self.seed(await self.chain.get_all_metagraphs_info())
+
+        # Fetch every stepped subnet before touching the cache: if one fetch fails, nothing is applied
+        # and the next refresh refetches (and reports) all of them again.
+        fetched = {}
+        for netuid in stale:
+            info = await self.chain.get_metagraph_info(netuid)
+            if info is not None:
+                fetched[netuid] = self._compact(info)
+
+        diff = MetagraphDiff()
+        for netuid, info in fetched.items():
+            diff.add_subnet_diff(netuid, self.infos.get(netuid), info)
+            self.infos[netuid] = info
+            self.last_steps[netuid] = live[netuid]
+        for netuid in gone:
+            diff.add_subnet_diff(netuid, self.infos.pop(netuid), None)
+            self.last_steps.pop(netuid, None)
+
+        self.analytics.update(diff, self.infos)
+        bt.logging.debug(f"Subnet cache: {len(stale)} stepped, {len(gone)} removed of {len(live)} subnets.")
+        return diff
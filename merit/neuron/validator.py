@@ -1,262 +1,537 @@
 import bittensor as bt
-import pyotp
 import asyncio
 import os
 import json
-import hashlib
-import base64
-import ipaddress
 import time
-from merit.protocol.merit_protocol import PingSynapse
 from merit.config import merit_config
+from merit.neuron.incentive_index import IncentiveIndex
+from merit.neuron.incentive_series import IncentiveSeries
+from merit.neuron.subnet_cache import MetagraphDiff, SubnetInfoCache
+from merit.neuron import ping_engine, scoring
+from merit.neuron.ping_pool import make_ping_engine
+from merit.neuron.ping_scheduler import PingScheduler
+from merit.neuron.ping_history import PingHistory
+from merit.neuron.weights import compute_normalized_weights
+from merit.neuron.weight_submitter import WeightSubmitter
+from merit.utils.chain import ChainClient
+from merit.utils.totp import TotpCache
+from merit.utils import dashboard, metrics, tracing
+from merit.utils.fileio import atomic_write_json, netuid_path
+from merit.storage.epoch_store import EpochStore
+from merit.storage.history_index import HistoryIndex
+from merit.storage.snapshot import load_snapshot, save_snapshot
+
 
 class Validator:
-    def __init__(self, config: bt.Config):
+    def __init__(self, config: bt.Config, wallet=None, subtensor=None, dendrite=None, netuid=None, shared=None):
+        """
+        `wallet`, `subtensor` and `dendrite` default to ones built from `config`; passing them in lets
+        benchmarks and tests drive a Validator against local stand-ins. `netuid` overrides `config.netuid`.
+
+        `shared` (a SharedResources, see merit.neuron.multi_validator) supplies the chain client, dendrite,
+        cross-subnet cache, TOTP cache, ping engine and ping lock when one process validates several
+        netuids. The owner of `shared` then refreshes the cross-subnet cache and runs the ping rounds,
+        and this validator keeps its files under netuid-suffixed names.
+        """
         bt.logging.info("Initializing Validator...")
 
-        self.wallet = bt.wallet(config=config)
-        self.subtensor = bt.subtensor(config=config)
-        self.dendrite = bt.dendrite(wallet=self.wallet)
-        self.netuid = config.netuid
+        self.shared = shared
+        self.wallet = wallet or bt.wallet(config=config)
+        self.subtensor = subtensor or bt.subtensor(config=config)
+        self.chain = shared.chain if shared else ChainClient(self.subtensor)
+        self.dendrite = shared.dendrite if shared else dendrite or bt.dendrite(wallet=self.wallet)
+        self.netuid = config.netuid if netuid is None else netuid
         self.ping_frequency = config.ping_frequency or 600
         self.eval_frequency = config.eval_frequency or 600
         self.last_eval_time = 0
         self.no_zero_weights = config.no_zero_weights or False
-        os.makedirs(merit_config.EPOCH_RESULTS_DIR, exist_ok=True)
+        if config.metrics_port and not shared:
+            metrics.start_metrics_server(config.metrics_port)
+            bt.logging.info(f"Serving metrics on port {config.metrics_port}.")
+        if shared:
+            self.state_file = netuid_path(merit_config.STATE_FILE, self.netuid)
+            self.health_file = netuid_path(merit_config.HEALTH_FILE, self.netuid)
+            self.epoch_results_dir = netuid_path(merit_config.EPOCH_RESULTS_DIR, self.netuid)
+        else:
+            self.state_file = merit_config.STATE_FILE
+            self.health_file = merit_config.HEALTH_FILE
+            self.epoch_results_dir = merit_config.EPOCH_RESULTS_DIR
+        self.snapshot_file = netuid_path(merit_config.SNAPSHOT_FILE, self.netuid)
+        os.makedirs(self.epoch_results_dir, exist_ok=True)
+        self.epoch_store = EpochStore(self.epoch_results_dir)
+        self.history_index = HistoryIndex.from_store(self.epoch_store) if config.dashboard_port else None
         self.latest_ping_success = {}
         self.valid_miners = set()
         self.ping_complete = asyncio.Event()
         self.ping_task = None
         self.first_ping_done = False
-        self.metagraph = self.subtensor.metagraph(netuid=self.netuid)
+        self.resumed_from_snapshot = False
         self.state = self._load_state()
+        self.dirty_hotkeys = set()
+        self.full_eval_pending = True
+        self.eval_num_subnets = None
         self.health = self._load_health()
-        self.all_metagraphs_info = self._fetch_all_metagraphs_info()
+        self.ping_history = PingHistory.from_dict(self.health)
+        self.all_metagraphs_info = []
+        self.incentive_index = IncentiveIndex()
+        half_life = merit_config.INCENTIVE_EMA_HALF_LIFE if config.incentive_half_life is None \
+            else config.incentive_half_life
+        self.incentive_series = IncentiveSeries(half_life, skip_netuids=(0, self.netuid)) if half_life > 0 else None
+        self.subnet_cache = shared.subnet_cache if shared else SubnetInfoCache(self.chain)
+        self.subnet_analytics = self.subnet_cache.analytics
+        if self.history_index is not None and not shared:
+            dashboard.start_dashboard_server(
+                config.dashboard_port, {self.netuid: self.history_index}, analytics=self.subnet_analytics
+            )
+            bt.logging.info(f"Serving dashboard API on port {config.dashboard_port} "
+                            f"({len(self.history_index)} epochs indexed).")
+        self.last_metagraph_diff = None
+        self.latest_ping_times = {}
+        # The warm-start snapshot holds the whole cross-subnet cache, so it is only used by a standalone validator.
+        snapshot = None if config.no_warm_start or shared else load_snapshot(self.snapshot_file, netuid=self.netuid)
+        if snapshot is not None:
+            self._restore_snapshot(snapshot)
+        else:
+            self.metagraph = self.subtensor.metagraph(netuid=self.netuid)
+            if shared:
+                self._set_metagraphs_info(MetagraphDiff(full=True))
+            else:
+                self._fetch_all_metagraphs_info()
         self.eval_rounds = 0
         self.ping_retry_attempts = merit_config.PING_RETRY_ATTEMPTS
         self.ping_retry_delay = merit_config.PING_RETRY_DELAY
-        self.latest_ping_times = {}
+        if shared:
+            self.totp_cache = shared.totp_cache
+            self.ping_engine = shared.ping_engine
+            self.ping_lock = shared.ping_lock
+        else:
+            self.totp_cache = TotpCache()
+            self.ping_engine = make_ping_engine(
+                config,
+                self.wallet,
+                self.dendrite,
+                self.totp_cache.verify,
+                retry_attempts=self.ping_retry_attempts,
+                retry_delay=self.ping_retry_delay,
+            )
+            self.ping_lock = asyncio.Lock()
+        self.ping_scheduler = PingScheduler(self.ping_frequency, adaptive=not config.no_adaptive_ping)
+        self.weight_submitter = WeightSubmitter(self.chain, self.wallet, self.netuid)
+        self.last_chain_refresh = 0.0
 
     async def cleanup(self):
         """
-        Gracefully close all async resources (e.g., aiohttp sessions).
+        Gracefully close all async resources (e.g., aiohttp sessions). Shared resources are closed by their owner.
         """
+        await self.weight_submitter.close()
+        if self.shared:
+            return
+        self.ping_engine.close()
         bt.logging.info("Validator cleanup: Closing Dendrite session.")
         try:
             await self.dendrite.aclose_session()
         except Exception as e:
             bt.logging.error(f"Error closing dendrite session: {e}")
+        self.chain.close()
 
     def _fetch_all_metagraphs_info(self):
         try:
             infos = self.subtensor.get_all_metagraphs_info()
             bt.logging.success(f"Fetched {len(infos)} metagraphs info.")
-            return infos
         except Exception as e:
             bt.logging.warning(f"Failed to fetch all metagraphs info: {e}")
-            return []
+            infos = []
+        self._set_metagraphs_info(self.subnet_cache.seed(infos))
+        return infos
+
+    @tracing.traced("chain_sync.subnets")
+    async def _refresh_all_metagraphs_info(self):
+        """
+        Async counterpart of _fetch_all_metagraphs_info. Only refetches subnets that stepped since the
+        last refresh and keeps the previous snapshot if the refresh fails.
+        """
+        try:
+            diff = await self.subnet_cache.refresh()
+        except Exception as e:
+            bt.logging.warning(f"Failed to refresh metagraphs info, keeping previous snapshot: {e}")
+            return self.all_metagraphs_info
+        bt.logging.success(f"Metagraphs info: {diff.summary()}.")
+        bt.logging.debug(f"Subnet analytics: {self.subnet_analytics.summary()}.")
+        self._set_metagraphs_info(diff)
+        return self.all_metagraphs_info
+
+    def _set_metagraphs_info(self, diff):
+        """
+        Publishes the subnet cache snapshot and updates the hotkey -> {netuid: incentive} index,
+        rebuilding it on a full refresh and re-indexing only the refreshed subnets otherwise.
+        The smoothed incentive series (if enabled) folds in the refreshed subnets.
+        """
+        self.last_metagraph_diff = diff
+        self.dirty_hotkeys |= diff.affected_hotkeys(skip_netuids=(0, self.netuid))
+        self.all_metagraphs_info = self.subnet_cache.snapshot()
+        if self.incentive_series is not None:
+            self._update_incentive_series(diff)
+        if diff.full:
+            self.incentive_index = IncentiveIndex(self.all_metagraphs_info, skip_netuids=(0, self.netuid))
+            return
+        for netuid in diff.refreshed:
+            info = self.subnet_cache.infos.get(netuid)
+            if info is None:
+                self.incentive_index.remove_subnet(netuid)
+            else:
+                self.incentive_index.set_subnet(netuid, info.hotkeys, info.incentives)
+
+    def _update_incentive_series(self, diff):
+        series = self.incentive_series
+        infos = self.subnet_cache.infos
+        # A full diff may list no subnets (a validator joining a shared cache), so it folds in all of them.
+        netuids = set(infos) | set(series.netuids) if diff.full else diff.refreshed
+        for netuid in netuids:
+            info = infos.get(netuid)
+            if info is None:
+                self.dirty_hotkeys |= series.remove_subnet(netuid)
+            else:
+                self.dirty_hotkeys |= series.set_subnet(netuid, info.hotkeys, info.incentives, info.last_step)
+
+    def _restore_snapshot(self, snapshot):
+        """
+        Resumes from a warm-start snapshot: the saved metagraph, cross-subnet info and last ping round
+        are used right away, and the background pinger revalidates all of them on its first round.
+        Saved incentive EMAs are restored before the infos are folded in, so smoothing carries over.
+        """
+        self.metagraph = snapshot.metagraph
+        if self.incentive_series is not None:
+            self.incentive_series.restore(snapshot.incentive_series)
+        self._set_metagraphs_info(self.subnet_cache.seed(snapshot.infos, refreshed_at=snapshot.timestamp))
+        self.latest_ping_success = dict(snapshot.ping_success)
+        self.latest_ping_times = dict(snapshot.ping_times)
+        registered = set(self.metagraph.hotkeys)
+        self.valid_miners = {h for h, ok in self.latest_ping_success.items() if ok and h in registered}
+        self.first_ping_done = True
+        self.resumed_from_snapshot = True
+        bt.logging.success(
+            f"Warm start from snapshot ({snapshot.age:.0f}s old): {len(self.metagraph.neurons)} neurons, "
+            f"{len(snapshot.infos)} subnets, {len(self.valid_miners)} reachable miners.")
+
+    @tracing.traced("disk.snapshot")
+    async def _save_snapshot(self):
+        """
+        Writes the warm-start snapshot from a worker thread: serializing and compressing the cross-subnet
+        info takes long enough to delay pings and weight submission if done on the event loop. The
+        metagraph and infos are replaced rather than mutated on refresh, so only the ping dicts and the
+        incentive EMAs are copied first.
+        """
+        if self.shared:
+            return
+        try:
+            series = self.incentive_series.to_dict() if self.incentive_series is not None else None
+            await asyncio.to_thread(
+                save_snapshot,
+                self.snapshot_file,
+                self.metagraph,
+                self.all_metagraphs_info,
+                dict(self.latest_ping_success),
+                dict(self.latest_ping_times),
+                series,
+            )
+        except Exception as e:
+            bt.logging.warning(f"Failed to save warm-start snapshot: {e}")
 
     def _load_state(self):
-        if os.path.isfile(merit_config.STATE_FILE):
-            with open(merit_config.STATE_FILE, "r") as f:
-                return json.load(f)
+        if os.path.isfile(self.state_file):
+            try:
+                with open(self.state_file, "r") as f:
+                    return json.load(f)
+            except ValueError as e:
+                bt.logging.warning(f"Ignoring unreadable state file: {e}")
         return {}
 
+    @tracing.traced("disk.state")
     def _save_state(self):
-        with open(merit_config.STATE_FILE, "w") as f:
-            json.dump(self.state, f, indent=4)
-
-    def _clear_state(self):
-        if os.path.isfile(merit_config.STATE_FILE):
-            os.remove(merit_config.STATE_FILE)
+        try:
+            atomic_write_json(self.state_file, self.state)
+        except OSError as e:
+            bt.logging.warning(f"Failed to save state file: {e}")
 
     def _load_health(self):
-        if os.path.isfile(merit_config.HEALTH_FILE):
-            with open(merit_config.HEALTH_FILE, "r") as f:
-                return json.load(f)
+        if os.path.isfile(self.health_file):
+            try:
+                with open(self.health_file, "r") as f:
+                    return json.load(f)
+            except ValueError as e:
+                bt.logging.warning(f"Ignoring unreadable health file: {e}")
         return {}
 
+    @tracing.traced("disk.health")
     def _save_health(self):
-        with open(merit_config.HEALTH_FILE, "w") as f:
-            json.dump(self.health, f, indent=4)
+        self.health = self.ping_history.to_dict()
+        try:
+            atomic_write_json(self.health_file, self.health)
+        except OSError as e:
+            bt.logging.warning(f"Failed to save health file: {e}")
 
     def _prune_epoch_results(self):
-        if not os.path.isdir(merit_config.EPOCH_RESULTS_DIR):
-            bt.logging.warning(f"Epoch results directory {merit_config.EPOCH_RESULTS_DIR} not found. Skipping prune.")
+        if not os.path.isdir(self.epoch_results_dir):
+            bt.logging.warning(f"Epoch results directory {self.epoch_results_dir} not found. Skipping prune.")
             return
-        files = sorted([
-            f for f in os.listdir(merit_config.EPOCH_RESULTS_DIR) if f.startswith("epoch_")
-        ])
-        for old_file in files[:-merit_config.MAX_EPOCH_FILES]:
-            os.remove(os.path.join(merit_config.EPOCH_RESULTS_DIR, old_file))
+        removed = self.epoch_store.prune()
+        if removed:
+            bt.logging.debug(f"Pruned {removed} epochs from the epoch store.")
+
+        # Legacy per-epoch JSON files, ordered by block number rather than by name.
+        legacy_files = []
+        for f in os.listdir(self.epoch_results_dir):
+            if f.startswith("epoch_") and f.endswith(".json"):
+                try:
+                    legacy_files.append((int(f[len("epoch_"):-len(".json")]), f))
+                except ValueError:
+                    continue
+        legacy_files.sort()
+        for _, old_file in legacy_files[:-merit_config.MAX_EPOCH_FILES]:
+            os.remove(os.path.join(self.epoch_results_dir, old_file))
 
     def is_valid_public_ipv4(self, ip: str) -> bool:
-        try:
-            parsed_ip = ipaddress.IPv4Address(ip)
-            return parsed_ip.is_global
-        except ipaddress.AddressValueError:
-            return False
+        return ping_engine.is_valid_public_ipv4(ip)
 
     def _should_skip_neuron(self, neuron) -> bool:
-        try:
-            return neuron.dividends > 0 or neuron.validator_trust > 0
-        except Exception:
-            return False
+        return scoring.should_skip_neuron(neuron)
 
-    async def _is_port_open(self, ip: str, port: int) -> bool:
-        try:
-            await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=4.0)
-            return True
-        except Exception:
-            return False
-
-    async def ping_miner(self, neuron) -> bool:
-        axon = neuron.axon_info
-        ip = axon.ip
-        port = axon.port
-
-        if not self.is_valid_public_ipv4(ip) or port == 0:
-            bt.logging.debug(f"Skipping invalid IP/port for {neuron.hotkey}: {ip}:{port}")
-            return False
-
-        for attempt in range(self.ping_retry_attempts):
-            if await self._is_port_open(ip, port):
-                break
-            if attempt < self.ping_retry_attempts - 1:
-                await asyncio.sleep(self.ping_retry_delay)
-        else:
-            bt.logging.debug(f"Port closed after {self.ping_retry_attempts} attempts for {neuron.hotkey}")
-            return False
+    def _track_registrations(self, old_metagraph, new_metagraph):
+        """
+        Marks hotkeys dirty whose registration, UID, axon or validator status differs between two metagraphs.
+        """
+        def signatures(metagraph):
+            return {
+                neuron.hotkey: (neuron.uid, neuron.axon_info.ip, neuron.axon_info.port, self._should_skip_neuron(neuron))
+                for neuron in metagraph.neurons
+            }
 
-        try:
-            request = PingSynapse(hotkey=neuron.hotkey)
-            response = await self.dendrite.forward(axon, request, timeout=merit_config.PING_TIMEOUT)
+        old, new = signatures(old_metagraph), signatures(new_metagraph)
+        self.dirty_hotkeys.update(hotkey for hotkey in old.keys() | new.keys() if old.get(hotkey) != new.get(hotkey))
 
-            if not isinstance(response, PingSynapse) or not response.token:
-                bt.logging.debug(f"Invalid response or missing token from {neuron.hotkey}")
-                return False
+    async def ping_miner(self, neuron) -> bool:
+        """
+        One-off ping outside the scheduled rounds. Holds the ping lock, since the ping engine runs one
+        round at a time (a sharded engine drops the results of a round interrupted by another call).
+        """
+        async with self.ping_lock:
+            result = await self.ping_engine.ping(neuron)
+        if result.success:
+            self.latest_ping_times[neuron.hotkey] = time.time()
+        return result.success
 
-            hashed = hashlib.sha256(neuron.hotkey.encode('utf-8')).digest()
-            base32_secret = base64.b32encode(hashed).decode('utf-8').strip('=')
-            totp = pyotp.TOTP(base32_secret)
+    def _ping_targets(self) -> list:
+        return [
+            neuron for neuron in self.metagraph.neurons
+            if not self._should_skip_neuron(neuron)
+        ]
 
-            if not totp.verify(response.token, valid_window=1):
-                bt.logging.debug(f"TOTP failed for {neuron.hotkey}")
-                return False
+    @tracing.traced("ping_pass")
+    async def _ping_pass(self, neurons):
+        """
+        Pings `neurons`, records each outcome with the scheduler and republishes `valid_miners`
+        from the latest outcome of every current target. Returns failure counts by stage.
+        """
+        failures = {}
+        async with self.ping_lock:
+            async for result in self.ping_engine.stream(neurons):
+                self._record_ping(result, failures)
+                self._observe_ping(result)
+        self._publish_valid_miners()
+        return failures
+
+    @staticmethod
+    def _observe_ping(result):
+        """
+        Process-wide ping metrics, updated once per ping sent (a shared ping may be recorded by several validators).
+        """
+        metrics.PING_RESULTS.inc(stage=result.stage)
+        if result.success:
+            metrics.PING_RTT.observe(result.rtt)
+            metrics.MINER_PING_RTT.set(result.rtt, hotkey=result.neuron.hotkey)
+
+    def _record_ping(self, result, failures: dict):
+        hotkey = result.neuron.hotkey
+        # A repeated success leaves reachability unchanged; anything else may move it (failures shift uptime).
+        if not result.success or self.latest_ping_success.get(hotkey) is not True:
+            self.dirty_hotkeys.add(hotkey)
+        self.latest_ping_success[hotkey] = result.success
+        self.ping_scheduler.record(hotkey, result.success)
+        self.ping_history.record(result.neuron.uid, hotkey, result.success, result.rtt)
+        if result.success:
+            self.latest_ping_times[hotkey] = time.time()
+        else:
+            failures[result.stage] = failures.get(result.stage, 0) + 1
 
-            self.latest_ping_times[neuron.hotkey] = time.time()
-            bt.logging.debug(f"Ping success for {neuron.hotkey}")
-            return True
+    def _publish_valid_miners(self):
+        self.valid_miners = {
+            neuron.hotkey for neuron in self._ping_targets() if self.latest_ping_success.get(neuron.hotkey)
+        }
 
+    @tracing.traced("ping_round")
+    async def _ping_round(self):
+        """
+        One background pass: refresh the metagraph and cross-subnet info once per `ping_frequency`,
+        then ping the miners the scheduler reports as due. The warm-start snapshot is rewritten only on
+        rounds that refreshed chain data.
+        """
+        self.ping_complete.clear()
+        round_start = time.perf_counter()
+
+        chain_refreshed = time.time() - self.last_chain_refresh >= self.ping_frequency
+        if chain_refreshed:
+            previous_hotkeys = set(self.metagraph.hotkeys)
+            await self._refresh_metagraph()
+            self.totp_cache.retain(self.metagraph.hotkeys)
+            # Only deregistered miners lose their RTT gauge; miners not due this round keep their last value.
+            for hotkey in previous_hotkeys.difference(self.metagraph.hotkeys):
+                metrics.MINER_PING_RTT.remove(hotkey=hotkey)
+            await self._refresh_all_metagraphs_info()
+            self.last_chain_refresh = time.time()
+
+        ping_targets = self._ping_targets()
+        due = self.ping_scheduler.due(ping_targets)
+        bt.logging.debug(f"Starting background ping round: {len(due)} of {len(ping_targets)} miners due.")
+
+        failures = await self._ping_pass(due)
+        self._finish_ping_round(due, failures, round_start)
+        if chain_refreshed:
+            await self._save_snapshot()
+
+    @tracing.traced("chain_sync.metagraph")
+    async def _refresh_metagraph(self):
+        metagraph = await self.chain.metagraph(self.netuid)
+        self._track_registrations(self.metagraph, metagraph)
+        self.metagraph = metagraph
+        self.ping_scheduler.retain(self.metagraph.hotkeys)
+
+    def _finish_ping_round(self, due, failures: dict, round_start: float):
+        ping_targets = self._ping_targets()
+        metrics.PING_ROUND_TARGETS.set(len(due))
+        metrics.PING_ROUND_DURATION.observe(time.perf_counter() - round_start)
+
+        total_targets = len(ping_targets)
+        failed = total_targets - len(self.valid_miners)
+        reachable_count = len(self.valid_miners)
+        bt.logging.info(
+            f"{len(self.valid_miners)} reachable, {failed} unreachable out of {total_targets} ping targets "
+            f"({len(due)} pinged this round). Failures by stage: {failures}")
+        bt.logging.success(f"Ping round complete. {reachable_count} miners reachable.")
+        bt.logging.debug(f"Chain call latency: {self.chain.format_stats()}")
+        self._save_health()
+        self.first_ping_done = True
+        self.ping_complete.set()
+
+    @tracing.traced("ping_overdue")
+    async def _ping_overdue(self):
+        """
+        Pings every target whose scheduled recheck has lapsed, so no miner is evaluated on a stale result.
+        """
+        overdue = self.ping_scheduler.due(self._ping_targets())
+        if overdue:
+            bt.logging.debug(f"Verifying {len(overdue)} overdue miners before evaluation.")
+            await self._ping_pass(overdue)
 
-        except Exception as e:
-            bt.logging.warning(f"Ping exception for {neuron.hotkey}: {e}")
-            return False
+    def _next_ping_delay(self) -> float:
+        until_refresh = self.ping_frequency - (time.time() - self.last_chain_refresh)
+        until_due = self.ping_scheduler.next_due_in(self._ping_targets())
+        return min(max(min(until_refresh, until_due), merit_config.PING_SCHEDULER_TICK), self.ping_frequency)
 
     async def _background_pinger(self):
         while True:
             try:
-                self.ping_complete.clear()
-
-                self.metagraph.sync(subtensor=self.subtensor)
-                self.all_metagraphs_info = self._fetch_all_metagraphs_info()
-                bt.logging.debug("Starting background ping round...")
-
-                ping_targets = [
-                    neuron for neuron in self.metagraph.neurons
-                    if not self._should_skip_neuron(neuron)
-                ]
-
-                results = await asyncio.gather(
-                    *(self.ping_miner(neuron) for neuron in ping_targets),
-                    return_exceptions=True
-                )
-
-                self.valid_miners.clear()
-                for neuron, result in zip(ping_targets, results):
-                    if isinstance(result, Exception):
-                        bt.logging.warning(f"Exception pinging {neuron.hotkey}: {result}")
-                        success = False
-                    else:
-                        success = result
-
-                    self.latest_ping_success[neuron.hotkey] = success
-                    if success:
-                        self.valid_miners.add(neuron.hotkey)
-
-                total_targets = len(ping_targets)
-                failed = total_targets - len(self.valid_miners)
-                reachable_count = len(self.valid_miners)
-                bt.logging.info(
-                    f"{len(self.valid_miners)} reachable, {failed} unreachable out of {total_targets} ping targets.")
-                bt.logging.success(f"Ping round complete. {reachable_count} miners reachable.")
-                self.first_ping_done = True
-                self.ping_complete.set()
-
+                await self._ping_round()
             except Exception as e:
                 bt.logging.error(f"Background pinger error: {e}")
 
-            await asyncio.sleep(self.ping_frequency)
+            await asyncio.sleep(self._next_ping_delay())
 
-    def _evaluate_miners(self):
-        bt.logging.debug("Evaluating miners...")
-        self.state = {}
-        evaluated_count = 0
+    def _is_reachable(self, neuron) -> bool:
+        return scoring.is_reachable(neuron, neuron.hotkey in self.valid_miners, self.ping_history)
 
-        expected_subnets = [
-            info for info in self.all_metagraphs_info
-            if info.netuid not in (0, self.netuid)
-        ]
-        num_expected_subnets = len(expected_subnets)
-
-        for neuron in self.metagraph.neurons:
-            if self._should_skip_neuron(neuron):
-                continue
+    def _score_neuron(self, neuron, num_expected_subnets: int, smoothed_bmps: float = None) -> float:
+        hotkey = neuron.hotkey
+        reachable = self._is_reachable(neuron)
+        incentives_by_netuid = self.incentive_index.get(hotkey)
+        bmps = scoring.score_neuron(neuron, reachable, incentives_by_netuid, num_expected_subnets, smoothed_bmps)
 
-            hotkey = neuron.hotkey
+        if not scoring.has_valid_axon(neuron):
             axon = neuron.axon_info
-
-            if not self.is_valid_public_ipv4(axon.ip) or axon.port == 0:
-                bt.logging.debug(f"Skipping {hotkey}: Invalid axon IP or port ({axon.ip}:{axon.port})")
-                self.state[hotkey] = 0.0
-                continue
-
-            if hotkey not in self.valid_miners:
-                bt.logging.debug(f"Miner {hotkey} was not pinged successfully or skipped. Assigning BMPs=0.0")
-                self.state[hotkey] = 0.0
-                continue
-
-            incentives_with_netuid = []
-            for info in expected_subnets:
-                hotkey_to_incentive = dict(zip(info.hotkeys, info.incentives))
-                incentive = hotkey_to_incentive.get(hotkey, 0.0)
-                incentives_with_netuid.append((info.netuid, incentive))
-
-            incentives = [val for _, val in incentives_with_netuid]
-
-            avg_incentive = sum(incentives) / num_expected_subnets if num_expected_subnets > 0 else 0.0
-            bmps = avg_incentive * 100000
-            self.state[hotkey] = bmps
-
+            bt.logging.debug(f"Skipping {hotkey}: Invalid axon IP or port ({axon.ip}:{axon.port})")
+        elif not reachable:
+            bt.logging.debug(
+                f"Miner {hotkey} was not pinged successfully or skipped "
+                f"(uptime={self.ping_history.uptime(neuron.uid, hotkey)}). Assigning BMPs=0.0")
+        else:
             bt.logging.debug(
-                f"Miner {hotkey}: Subnet Incentives = {incentives_with_netuid}, "
-                f"Avg = {avg_incentive:.6f}, BMPs = {bmps:.2f}"
+                f"Miner {hotkey}: Subnet Incentives = {incentives_by_netuid}, "
+                f"Avg = {bmps / scoring.BMPS_SCALE:.6f}, BMPs = {bmps:.2f}"
+                f"{' (smoothed)' if smoothed_bmps is not None else ''}"
             )
+        return bmps
 
-            evaluated_count += 1
-
-        self._save_state()
-        total_neurons = len([n for n in self.metagraph.neurons if not self._should_skip_neuron(n)])
-        skipped = total_neurons - evaluated_count
-        bt.logging.info(f"Evaluated {evaluated_count} miners (others set to 0.0 = {skipped}).")
+    @tracing.traced("evaluate")
+    def _evaluate_miners(self) -> int:
+        """
+        Rescores only the miners whose inputs changed since the last evaluation: new ping outcomes,
+        cross-subnet incentive changes and registration changes (collected in `dirty_hotkeys`).
+        Everything is rescored on the first evaluation and when the number of tracked subnets changes,
+        since that divides every average. With incentive smoothing on, the BMPs of every miner being
+        rescored come from one vectorized pass over the EMA series. The state file is rewritten only if
+        a score changed.
+        Returns the number of miners rescored.
+        """
+        bt.logging.debug("Evaluating miners...")
+        eval_start = time.perf_counter()
+
+        num_expected_subnets = len(self.incentive_index.netuids)
+        targets = {
+            neuron.hotkey: neuron for neuron in self.metagraph.neurons
+            if not self._should_skip_neuron(neuron)
+        }
+        full = self.full_eval_pending or num_expected_subnets != self.eval_num_subnets
+        if full:
+            to_score = list(targets)
+        else:
+            to_score = [hotkey for hotkey in targets if hotkey in self.dirty_hotkeys or hotkey not in self.state]
+
+        smoothed = [None] * len(to_score)
+        if self.incentive_series is not None:
+            smoothed = self.incentive_series.bmps(to_score, num_expected_subnets)
+
+        changed = 0
+        for hotkey in [hotkey for hotkey in self.state if hotkey not in targets]:
+            del self.state[hotkey]
+            changed += 1
+        for hotkey, smoothed_bmps in zip(to_score, smoothed):
+            bmps = self._score_neuron(targets[hotkey], num_expected_subnets, smoothed_bmps)
+            if self.state.get(hotkey) != bmps:
+                self.state[hotkey] = bmps
+                changed += 1
+
+        self.dirty_hotkeys.clear()
+        self.full_eval_pending = False
+        self.eval_num_subnets = num_expected_subnets
+        if changed:
+            self._save_state()
+
+        scored = sum(1 for hotkey in targets if self.state.get(hotkey, 0.0) > 0)
+        bt.logging.info(
+            f"Rescored {len(to_score)} of {len(targets)} miners ({'full' if full else 'incremental'}), "
+            f"{changed} scores changed, {scored} with BMPs > 0.")
         self.eval_rounds += 1
         bt.logging.info(f"Evaluation round #{self.eval_rounds} complete.")
+        metrics.EVALUATE_DURATION.observe(time.perf_counter() - eval_start)
+        return len(to_score)
 
+    @tracing.traced("weights.reference")
     def _calculate_normalized_weights(self, uids, scores, burner_uid=0, burner_weight=0.75):
         """
         Calculates normalized weights using an S-curve incentive model.
         UID 0 always receives `burner_weight` (default 75%).
         Only miners with score > 0.0 share the remaining 25%.
+
+        Pure-Python reference for merit.neuron.weights.compute_normalized_weights, which run() uses.
         """
 
         # Filter out burner UID and zero-score miners
@@ -296,6 +571,117 @@ class Validator:
 
         return final_weights
 
+    @tracing.traced("weights.compute")
+    def _compute_weights(self):
+        """
+        Builds the uid / score vectors from the current state and returns (uids, normalized_weights, total_bmps).
+        `normalized_weights` is empty when there is nothing to set.
+        """
+        uids, scores = [], []
+        for neuron in self.metagraph.neurons:
+            if self._should_skip_neuron(neuron):
+                continue
+            uids.append(neuron.uid)
+            score = self.state.get(neuron.hotkey, 0.0)
+            scores.append(score)
+
+        burner_uid = 0
+        if burner_uid not in uids:
+            bt.logging.debug(f"Inserting burner UID {burner_uid} for burn allocation.")
+            uids.insert(0, burner_uid)
+            scores.insert(0, 0.0)
+
+        total_bmps = sum(score for uid, score in zip(uids, scores) if uid != burner_uid)
+
+        if total_bmps == 0 and self.no_zero_weights and len(scores) > 0:
+            bt.logging.warning("All scores are zero, but --no_zero_weights is set. "
+                               "Assigning 75% to burner UID and 25% evenly among others.")
+            eligible_count = len([uid for uid in uids if uid != burner_uid])
+            distributed_weight = (1.0 - 0.75) / eligible_count if eligible_count > 0 else 0.0
+            normalized_weights = [0.75 if uid == burner_uid else distributed_weight for uid in uids]
+        elif total_bmps > 0:
+            normalized_weights = compute_normalized_weights(
+                uids, scores, burner_uid=burner_uid, burner_weight=0.75
+            ).tolist()
+        else:
+            normalized_weights = []
+
+        return uids, normalized_weights, total_bmps
+
+    @tracing.traced("epoch_summary")
+    def _build_epoch_summary(self, uids, normalized_weights) -> dict:
+        epoch_summary = {}
+        weight_by_uid = dict(zip(uids, normalized_weights))
+
+        for neuron in self.metagraph.neurons:
+            if self._should_skip_neuron(neuron):
+                continue
+
+            hotkey = neuron.hotkey
+            uid = neuron.uid
+            score = self.state.get(hotkey, 0.0)
+            weight = weight_by_uid.get(uid, 0.0)
+
+            subnet_incentives = {
+                netuid: round(incentive, 6)
+                for netuid, incentive in self.incentive_index.get(hotkey).items()
+            }
+
+            ping_success = self.latest_ping_success.get(hotkey, False)
+            last_ping_ts = self.latest_ping_times.get(hotkey, 0.0)
+
+            epoch_summary[hotkey] = {
+                "uid": uid,
+                "weight": round(weight, 6),
+                "bmps": round(score, 6),
+                "subnet_incentives": subnet_incentives,
+                "ping_success": ping_success,
+                "last_ping_timestamp": last_ping_ts,
+                "timestamp": time.time()
+            }
+        return epoch_summary
+
+    @tracing.traced("set_weights")
+    async def _set_weights(self, current_block: int):
+        """
+        Hands the current weight vector to the weight submitter and returns without waiting for inclusion.
+        The epoch summary is stored once the weights are on chain.
+        """
+        uids, normalized_weights, total_bmps = self._compute_weights()
+
+        if normalized_weights:
+            bt.logging.info(f"Setting weights: total_bmps = {total_bmps:.4f}")
+
+            bt.logging.debug("Final normalized weights (uid: weight, hotkey):")
+            for uid, score in zip(uids, normalized_weights):
+                hotkey = self.metagraph.hotkeys[uid]
+                bt.logging.debug(f"  UID {uid:4d} | Weight = {score:.6f} | Hotkey = {hotkey}")
+
+            weight_sum = sum(normalized_weights)
+            if not (0.999 <= weight_sum <= 1.001):
+                bt.logging.warning(f"⚠️ Normalized weights sum to {weight_sum:.6f}, not ≈1.0")
+
+            epoch_summary = self._build_epoch_summary(uids, normalized_weights)
+
+            def on_included(submission):
+                with tracing.span("disk.epoch_store", block=submission.included_block):
+                    self.epoch_store.append(submission.included_block, epoch_summary)
+                    self._prune_epoch_results()
+                if self.history_index is not None:
+                    self.history_index.add_epoch(submission.included_block, epoch_summary)
+                    self.history_index.retain_since(self.epoch_store.blocks()[0])
+
+            self.weight_submitter.submit(
+                self.metagraph.hotkeys.index(self.wallet.hotkey.ss58_address),
+                uids,
+                normalized_weights,
+                self.metagraph.hparams.weights_version,
+                on_included=on_included,
+            )
+            bt.logging.info(f"Weights submitted at block {current_block} (Eval round #{self.eval_rounds}).")
+        else:
+            bt.logging.warning("All scores are zero, skipping setting weights.")
+
     async def run(self):
         bt.logging.info("Validator running...")
 
@@ -304,14 +690,24 @@ class Validator:
 
         try:
             while True:
-                current_block = self.subtensor.get_current_block()
+                try:
+                    current_block = await self.chain.get_current_block()
+                except Exception as e:
+                    bt.logging.warning(f"Failed to fetch current block: {e}")
+                    await asyncio.sleep(12)
+                    continue
                 try:
                     my_uid = self.metagraph.hotkeys.index(self.wallet.hotkey.ss58_address)
                 except ValueError:
                     bt.logging.error("Validator hotkey not found in metagraph. Skipping weight set.")
                     await asyncio.sleep(30)
                     continue
-                blocks_since_update = self.subtensor.blocks_since_last_update(netuid=self.netuid, uid=my_uid)
+                try:
+                    blocks_since_update = await self.chain.blocks_since_last_update(netuid=self.netuid, uid=my_uid)
+                except Exception as e:
+                    bt.logging.warning(f"Failed to fetch blocks since last update: {e}")
+                    await asyncio.sleep(12)
+                    continue
 
                 bt.logging.debug(
                     f"My UID: {my_uid}, blocks since last weights set: {blocks_since_update}, TEMPO: {merit_config.TEMPO}")
@@ -323,106 +719,20 @@ class Validator:
 
                 now = time.time()
                 if now - self.last_eval_time >= self.eval_frequency:
-                    await asyncio.shield(self.ping_complete.wait())
+                    if self.resumed_from_snapshot:
+                        # First evaluation after a warm start uses the snapshot's complete ping round.
+                        self.resumed_from_snapshot = False
+                    else:
+                        await asyncio.shield(self.ping_complete.wait())
+                        await self._ping_overdue()
                     self._evaluate_miners()
                     self.last_eval_time = now
 
-                if blocks_since_update >= (merit_config.TEMPO - 2):
+                if self.weight_submitter.pending:
+                    bt.logging.debug("Weight submission in flight, waiting for inclusion...")
+                elif blocks_since_update >= (merit_config.TEMPO - 2):
                     bt.logging.info("Enough blocks passed. Setting weights now...")
-
-                    uids, scores = [], []
-                    for neuron in self.metagraph.neurons:
-                        if self._should_skip_neuron(neuron):
-                            continue
-                        uids.append(neuron.uid)
-                        score = self.state.get(neuron.hotkey, 0.0)
-                        scores.append(score)
-
-                    burner_uid = 0
-                    if burner_uid not in uids:
-                        bt.logging.debug(f"Inserting burner UID {burner_uid} for burn allocation.")
-                        uids.insert(0, burner_uid)
-                        scores.insert(0, 0.0)
-
-                    total_bmps = sum(score for uid, score in zip(uids, scores) if uid != burner_uid)
-
-                    if total_bmps == 0 and self.no_zero_weights and len(scores) > 0:
-                        bt.logging.warning("All scores are zero, but --no_zero_weights is set. "
-                                           "Assigning 75% to burner UID and 25% evenly among others.")
-                        eligible_count = len([uid for uid in uids if uid != burner_uid])
-                        distributed_weight = (1.0 - 0.75) / eligible_count if eligible_count > 0 else 0.0
-                        normalized_weights = [0.75 if uid == burner_uid else distributed_weight for uid in uids]
-                    elif total_bmps > 0:
-                        normalized_weights = self._calculate_normalized_weights(uids, scores, burner_uid=burner_uid,
-                                                                                burner_weight=0.75)
-                    else:
-                        normalized_weights = []
-
-                    if normalized_weights:
-                        bt.logging.info(f"Setting weights: total_bmps = {total_bmps:.4f}")
-
-                        bt.logging.debug("Final normalized weights (uid: weight, hotkey):")
-                        for uid, score in zip(uids, normalized_weights):
-                            hotkey = self.metagraph.hotkeys[uid]
-                            bt.logging.debug(f"  UID {uid:4d} | Weight = {score:.6f} | Hotkey = {hotkey}")
-
-                        weight_sum = sum(normalized_weights)
-                        if not (0.999 <= weight_sum <= 1.001):
-                            bt.logging.warning(f"⚠️ Normalized weights sum to {weight_sum:.6f}, not ≈1.0")
-
-                        self.subtensor.set_weights(
-                            wallet=self.wallet,
-                            netuid=self.netuid,
-                            uids=uids,
-                            weights=normalized_weights,
-                            version_key=self.metagraph.hparams.weights_version,
-                            wait_for_inclusion=True,
-                        )
-                        bt.logging.success(
-                            f"Weights set successfully at block {current_block} (Eval round #{self.eval_rounds}).")
-
-                        block = self.subtensor.get_current_block()
-                        path = os.path.join(merit_config.EPOCH_RESULTS_DIR, f"epoch_{block}.json")
-                        epoch_summary = {}
-
-                        for neuron in self.metagraph.neurons:
-                            if self._should_skip_neuron(neuron):
-                                continue
-
-                            hotkey = neuron.hotkey
-                            uid = neuron.uid
-                            score = self.state.get(hotkey, 0.0)
-                            weight = next((w for u, w in zip(uids, normalized_weights) if u == uid), 0.0)
-
-                            subnet_incentives = {}
-                            for info in self.all_metagraphs_info:
-                                if info.netuid in (0, self.netuid):
-                                    continue
-                                if hotkey in info.hotkeys:
-                                    index = info.hotkeys.index(hotkey)
-                                    subnet_incentives[info.netuid] = round(info.incentives[index], 6)
-
-                            ping_success = self.latest_ping_success.get(hotkey, False)
-                            last_ping_ts = self.latest_ping_times.get(hotkey, 0.0)
-
-                            epoch_summary[hotkey] = {
-                                "uid": uid,
-                                "weight": round(weight, 6),
-                                "bmps": round(score, 6),
-                                "subnet_incentives": subnet_incentives,
-                                "ping_success": ping_success,
-                                "last_ping_timestamp": last_ping_ts,
-                                "timestamp": time.time()
-                            }
-
-                        with open(path, "w") as f:
-                            json.dump(epoch_summary, f, indent=4)
-                    else:
-                        bt.logging.warning("All scores are zero, skipping setting weights.")
-
-                    self._clear_state()
-                    self.state = {}
-                    self._prune_epoch_results()
+                    await self._set_weights(current_block)
                 else:
                     bt.logging.debug(f"Not enough blocks passed yet ({blocks_since_update}). Waiting...")
 
@@ -0,0 +1,157 @@
+import bittensor as bt
+import asyncio
+import time
+
+from merit.config import merit_config
+from merit.utils import metrics, tracing
+
+PENDING = "pending"
+INCLUDED = "included"
+EXPIRED = "expired"
+CANCELLED = "cancelled"
+
+
+class WeightSubmission:
+    __slots__ = ("uid", "uids", "weights", "version_key", "on_included", "attempts", "status", "message",
+                 "included_block", "latency")
+
+    def __init__(self, uid: int, uids, weights, version_key: int, on_included=None):
+        self.uid = uid
+        self.uids = uids
+        self.weights = weights
+        self.version_key = version_key
+        self.on_included = on_included
+        self.attempts = 0
+        self.status = PENDING
+        self.message = ""
+        self.included_block = None
+        self.latency = None  # seconds from the first attempt to observed inclusion
+
+
+class WeightSubmitter:
+    """
+    Background weight-setting stage. `submit` takes a computed weight vector and returns straight away;
+    a task sends the extrinsic without waiting for inclusion, then watches the validator's last-update
+    block until it moves past the submission block. Failed or unconfirmed attempts are retried with
+    exponential backoff until `deadline_blocks` have passed since the first one. Submitting a new
+    vector replaces one still in flight.
+    """
+
+    def __init__(
+        self,
+        chain,
+        wallet,
+        netuid: int,
+        deadline_blocks: int = merit_config.TEMPO,
+        retry_delay: float = merit_config.WEIGHTS_RETRY_DELAY,
+        max_retry_delay: float = merit_config.WEIGHTS_MAX_RETRY_DELAY,
+        inclusion_blocks: int = merit_config.WEIGHTS_INCLUSION_BLOCKS,
+        block_time: float = merit_config.BLOCK_TIME,
+    ):
+        self.chain = chain
+        self.wallet = wallet
+        self.netuid = netuid
+        self.deadline_blocks = deadline_blocks
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.inclusion_blocks = inclusion_blocks
+        self.block_time = block_time
+        self.current = None
+        self._task = None
+
+    @property
+    def pending(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def submit(self, uid: int, uids, weights, version_key: int, on_included=None) -> WeightSubmission:
+        """
+        Queues `weights` for `uids` and returns the WeightSubmission tracking it. `on_included(submission)`
+        runs once the weights are on chain.
+        """
+        if self.pending:
+            bt.logging.warning("Replacing a weight submission that has not landed yet.")
+            self.current.status = CANCELLED
+            self._task.cancel()
+        self.current = WeightSubmission(uid, uids, weights, version_key, on_included)
+        self._task = asyncio.create_task(self._run(self.current))
+        return self.current
+
+    async def wait(self):
+        if self._task is not None:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def close(self):
+        if self.pending:
+            self._task.cancel()
+        await self.wait()
+
+    async def _run(self, submission: WeightSubmission):
+        start = time.perf_counter()
+        deadline = start + self.deadline_blocks * self.block_time
+        delay = self.retry_delay
+        while True:
+            submission.attempts += 1
+            try:
+                submit_block = await self.chain.get_current_block()
+                submit_start = time.perf_counter()
+                with tracing.span("set_weights.submit", attempt=submission.attempts):
+                    success, message = await self.chain.set_weights(
+                        wallet=self.wallet,
+                        netuid=self.netuid,
+                        uids=submission.uids,
+                        weights=submission.weights,
+                        version_key=submission.version_key,
+                        wait_for_inclusion=False,
+                        wait_for_finalization=False,
+                    )
+                metrics.SET_WEIGHTS_DURATION.observe(time.perf_counter() - submit_start)
+                submission.message = message
+                if success:
+                    submission.included_block = await self._wait_for_inclusion(submission.uid, submit_block)
+                    if submission.included_block is not None:
+                        break
+                    submission.message = f"not included within {self.inclusion_blocks} blocks"
+            except Exception as e:
+                submission.message = str(e)
+
+            if time.perf_counter() + delay >= deadline:
+                submission.status = EXPIRED
+                metrics.WEIGHT_SUBMISSIONS.inc(outcome=EXPIRED)
+                bt.logging.error(
+                    f"Giving up on weights after {submission.attempts} attempts: {submission.message}")
+                return submission
+            metrics.WEIGHT_SUBMISSIONS.inc(outcome="retried")
+            bt.logging.warning(
+                f"Weight submission attempt {submission.attempts} failed ({submission.message}), "
+                f"retrying in {delay:.0f}s.")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_retry_delay)
+
+        submission.status = INCLUDED
+        submission.latency = time.perf_counter() - start
+        metrics.WEIGHT_SUBMISSIONS.inc(outcome=INCLUDED)
+        metrics.WEIGHTS_INCLUSION_LATENCY.observe(submission.latency)
+        bt.logging.success(
+            f"Weights included at block {submission.included_block} after {submission.attempts} attempt(s), "
+            f"{submission.latency:.1f}s after the first submission.")
+        if submission.on_included is not None:
+            try:
+                submission.on_included(submission)
+            except Exception as e:
+                bt.logging.error(f"Error handling included weights: {e}")
+        return submission
+
+    @tracing.traced("set_weights.inclusion")
+    async def _wait_for_inclusion(self, uid: int, submit_block: int):
+        """
+        Returns the block the validator's weights were last updated at once it is past `submit_block`,
+        or None if that does not happen within `inclusion_blocks` blocks. The block is read directly
+        from LastUpdate, so a block landing mid-check cannot shift it.
+        """
+        for attempt in range(self.inclusion_blocks + 1):
+            if attempt:
+                await asyncio.sleep(self.block_time)
+            last_update = await self.chain.last_update(netuid=self.netuid, uid=uid)
+            if last_update is not None and last_update > submit_block:
+                return last_update
+        return None
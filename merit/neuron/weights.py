@@ -0,0 +1,96 @@
+"""
+NumPy implementation of the S-curve weight model in Validator._calculate_normalized_weights.
+The pure-Python method stays the reference; these functions must agree with it within float tolerance.
+Kept free of bittensor imports so offline tools and simulations can use it directly.
+"""
+import numpy as np
+
+DEFAULT_BURNER_UID = 0
+DEFAULT_BURNER_WEIGHT = 0.75
+# Coefficients (c3, c2, c1, c0) of the rank reward c3*r^3 + c2*r^2 + c1*r + c0 + 1.
+DEFAULT_S_CURVE = (-1.038e-7, 6.214e-5, -0.0129, -0.0118)
+
+
+def parse_s_curve(value: str) -> tuple:
+    coefficients = tuple(float(part) for part in value.split(","))
+    if len(coefficients) != 4:
+        raise ValueError(f"S-curve needs 4 comma-separated coefficients (c3,c2,c1,c0), got {value!r}")
+    return coefficients
+
+
+def s_curve_rewards(n: int, s_curve=DEFAULT_S_CURVE) -> np.ndarray:
+    """
+    S-curve reward for ranks 1..n, clipped at zero.
+    """
+    c3, c2, c1, c0 = s_curve
+    rank = np.arange(1, n + 1, dtype=np.float64)
+    reward = (c3 * (rank ** 3)) + (c2 * (rank ** 2)) + (c1 * rank) + c0 + 1
+    return np.maximum(reward, 0.0)
+
+
+def compute_normalized_weights(uids, scores, burner_uid=DEFAULT_BURNER_UID, burner_weight=DEFAULT_BURNER_WEIGHT,
+                               s_curve=DEFAULT_S_CURVE):
+    """
+    Vectorized equivalent of Validator._calculate_normalized_weights; returns a float64 array aligned with `uids`.
+    """
+    uids = np.asarray(uids, dtype=np.int64)
+    scores = np.asarray(scores, dtype=np.float64)
+    weights = np.zeros(len(uids), dtype=np.float64)
+
+    is_burner = uids == burner_uid
+    weights[is_burner] = burner_weight
+
+    valid = np.flatnonzero(~is_burner & (scores > 0.0))
+    if valid.size == 0:
+        return weights
+
+    # Stable descending sort keeps input order among equal scores, like sorted(..., reverse=True).
+    ranked = valid[np.argsort(-scores[valid], kind="stable")]
+    rewards = s_curve_rewards(ranked.size, s_curve)
+    total_incentive = rewards.sum()
+    if total_incentive <= 0:
+        weights[ranked] = (1.0 - burner_weight) / ranked.size
+    else:
+        weights[ranked] = (rewards / total_incentive) * (1.0 - burner_weight)
+    return weights
+
+
+def batch_normalized_weights(uids, score_matrix, burner_uid=DEFAULT_BURNER_UID, burner_weight=DEFAULT_BURNER_WEIGHT,
+                             s_curve=DEFAULT_S_CURVE):
+    """
+    Computes weights for many hypothetical score vectors over the same `uids` in one pass.
+    `score_matrix` has shape (num_vectors, len(uids)); the result has the same shape.
+    """
+    uids = np.asarray(uids, dtype=np.int64)
+    scores = np.atleast_2d(np.asarray(score_matrix, dtype=np.float64))
+    num_vectors, num_uids = scores.shape
+    weights = np.zeros((num_vectors, num_uids), dtype=np.float64)
+
+    is_burner = uids == burner_uid
+    weights[:, is_burner] = burner_weight
+
+    valid = ~is_burner[np.newaxis, :] & (scores > 0.0)
+    counts = valid.sum(axis=1)
+    if not counts.any():
+        return weights
+
+    # Invalid entries sort last; position p in a row is rank p + 1 among that row's valid miners.
+    order = np.argsort(np.where(valid, -scores, np.inf), axis=1, kind="stable")
+    rewards = s_curve_rewards(num_uids, s_curve)
+    cumulative = np.concatenate(([0.0], np.cumsum(rewards)))
+    totals = cumulative[counts]
+
+    positions = np.arange(num_uids)[np.newaxis, :]
+    in_rank = positions < counts[:, np.newaxis]
+    share = 1.0 - burner_weight
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ranked_weights = np.where(
+            (totals > 0)[:, np.newaxis],
+            rewards[np.newaxis, :] / totals[:, np.newaxis] * share,
+            share / np.maximum(counts, 1)[:, np.newaxis],
+        )
+    ranked_weights = np.where(in_rank, ranked_weights, 0.0)
+
+    rows = np.arange(num_vectors)[:, np.newaxis]
+    weights[rows, order] += ranked_weights
+    return weights
@@ -0,0 +1,405 @@
+"""
+Lightweight offline `merit` CLI for inspecting a validator's files without importing bittensor.
+
+    merit epochs [--since B] [--until B] [--hotkey HK ...] [--uid U ...]   list or filter epoch results
+    merit state                                                            summarize state and health files
+    merit weights [--burner_weight W] [--s_curve c3,c2,c1,c0]             recompute weights from the state file
+    merit diff [BLOCK_A BLOCK_B]                                           compare two epochs (default: last two)
+
+Paths default to the validator's own (run from its working directory); `--netuid` selects the per-netuid
+files of a multi-netuid validator. Subcommands import only what they need (numpy at most), so they start
+in a fraction of a second.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from merit.config import merit_config
+
+
+def _paths(args):
+    """
+    Resolves the state, health and epoch store paths, honouring explicit flags over `--netuid`.
+    """
+    state, health, epochs = merit_config.STATE_FILE, merit_config.HEALTH_FILE, merit_config.EPOCH_RESULTS_DIR
+    if args.netuid is not None:
+        from merit.utils.fileio import netuid_path
+        state, health, epochs = (netuid_path(path, args.netuid) for path in (state, health, epochs))
+    return args.state or state, args.health or health, args.epochs or epochs
+
+
+def _load_json(path: str):
+    if not os.path.isfile(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def _age(path: str) -> str:
+    seconds = max(0.0, time.time() - os.path.getmtime(path))
+    if seconds < 120:
+        return f"{seconds:.0f}s ago"
+    if seconds < 7200:
+        return f"{seconds / 60:.0f}m ago"
+    return f"{seconds / 3600:.1f}h ago"
+
+
+def _store(path: str):
+    from merit.storage.epoch_store import EpochStore
+    if not os.path.isdir(path):
+        raise SystemExit(f"merit: epoch results directory {path!r} not found")
+    return EpochStore(path)
+
+
+def _emit_json(obj):
+    print(json.dumps(obj, separators=(",", ":")))
+
+
+# epochs ---------------------------------------------------------------------
+
+def _row_matches(row: dict, args) -> bool:
+    if args.uid and row["uid"] not in args.uid:
+        return False
+    if args.min_weight is not None and row["weight"] < args.min_weight:
+        return False
+    if args.ping == "ok" and not row["ping_success"]:
+        return False
+    if args.ping == "fail" and row["ping_success"]:
+        return False
+    return True
+
+
+def _filtered_rows(store, args):
+    """
+    Yields (block, hotkey, row) for every row passing the filters. Hotkey filters seek to that hotkey's
+    rows through the store index instead of decoding whole epochs.
+    """
+    def in_range(block):
+        return args.until is None or block <= args.until
+
+    if args.hotkey:
+        rows = [
+            (block, hotkey, row)
+            for hotkey in args.hotkey
+            for block, row in store.hotkey_history(hotkey, since_block=args.since)
+            if in_range(block)
+        ]
+        rows.sort(key=lambda item: (item[0], item[2]["uid"]))
+        yield from ((block, hotkey, row) for block, hotkey, row in rows if _row_matches(row, args))
+        return
+    for block, summary in store.iter_epochs(since_block=args.since):
+        if not in_range(block):
+            break
+        for hotkey, row in sorted(summary.items(), key=lambda item: item[1]["uid"]):
+            if _row_matches(row, args):
+                yield block, hotkey, row
+
+
+def cmd_epochs(args) -> int:
+    store = _store(_paths(args)[2])
+    filtering = args.hotkey or args.uid or args.min_weight is not None or args.ping or args.rows
+    if not filtering:
+        # One line per epoch.
+        if not args.json:
+            print(f"{'block':>10} {'miners':>7} {'weighted':>9} {'pinged':>7} {'burn':>7} {'total bmps':>12}")
+        for block, summary in store.iter_epochs(since_block=args.since):
+            if args.until is not None and block > args.until:
+                break
+            rows = summary.values()
+            line = {
+                "block": block,
+                "miners": len(summary),
+                "weighted": sum(1 for row in rows if row["weight"] > 0),
+                "pinged": sum(1 for row in rows if row["ping_success"]),
+                "burn": round(sum(row["weight"] for row in rows if row["uid"] == 0), 6),
+                "total_bmps": round(sum(row["bmps"] for row in rows), 6),
+            }
+            if args.json:
+                _emit_json(line)
+            else:
+                print(f"{block:>10} {line['miners']:>7} {line['weighted']:>9} {line['pinged']:>7} "
+                      f"{line['burn']:>7.3f} {line['total_bmps']:>12.2f}")
+        return 0
+
+    if not args.json:
+        print(f"{'block':>10} {'uid':>5} {'hotkey':<48} {'weight':>9} {'bmps':>12} {'ping':>5}  subnets")
+    for block, hotkey, row in _filtered_rows(store, args):
+        if args.json:
+            _emit_json({"block": block, "hotkey": hotkey, **row})
+            continue
+        subnets = ",".join(str(netuid) for netuid, incentive in row["subnet_incentives"].items() if incentive > 0)
+        print(f"{block:>10} {row['uid']:>5} {hotkey:<48} {row['weight']:>9.6f} {row['bmps']:>12.2f} "
+              f"{'ok' if row['ping_success'] else 'fail':>5}  {subnets or '-'}")
+    return 0
+
+
+# state ----------------------------------------------------------------------
+
+def _health_summary(health: dict) -> dict:
+    uptimes, latencies, down = [], [], []
+    for uid, entry in health.get("uids", {}).items():
+        samples = entry["ok"]
+        if not samples:
+            continue
+        uptime = samples.count("1") / len(samples)
+        uptimes.append(uptime)
+        latencies.extend(rtt for rtt in entry["rtt"] if rtt is not None)
+        if samples[-1] == "0":
+            down.append((uptime, int(uid), entry["hotkey"]))
+    latencies.sort()
+    down.sort()
+    return {
+        "window": health.get("window"),
+        "tracked": len(uptimes),
+        "mean_uptime": sum(uptimes) / len(uptimes) if uptimes else None,
+        "median_rtt": latencies[len(latencies) // 2] if latencies else None,
+        "down": [{"uid": uid, "hotkey": hotkey, "uptime": uptime} for uptime, uid, hotkey in down],
+    }
+
+
+def cmd_state(args) -> int:
+    state_path, health_path, _ = _paths(args)
+    try:
+        state, health = _load_json(state_path), _load_json(health_path)
+    except ValueError as e:
+        raise SystemExit(f"merit: unreadable state or health file: {e}")
+
+    summary = {"state_file": state_path, "health_file": health_path}
+    if state is not None:
+        scores = sorted(state.values(), reverse=True)
+        top = sorted(state.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        summary["state"] = {
+            "written": _age(state_path),
+            "miners": len(state),
+            "scored": sum(1 for score in scores if score > 0),
+            "total_bmps": sum(scores),
+            "max_bmps": scores[0] if scores else 0.0,
+            "median_bmps": scores[len(scores) // 2] if scores else 0.0,
+            "top": [{"hotkey": hotkey, "bmps": score} for hotkey, score in top],
+        }
+    if health is not None:
+        h = summary["health"] = {"written": _age(health_path), **_health_summary(health)}
+        h["failing"] = len(h["down"])
+        h["down"] = h["down"][:args.top]
+
+    if args.json:
+        _emit_json(summary)
+        return 0 if state is not None or health is not None else 1
+
+    if state is None:
+        print(f"state:  {state_path} not found")
+    else:
+        s = summary["state"]
+        print(f"state:  {state_path} (written {s['written']})")
+        print(f"        {s['miners']} miners, {s['scored']} with BMPs > 0, total {s['total_bmps']:.2f}, "
+              f"max {s['max_bmps']:.2f}, median {s['median_bmps']:.2f}")
+        for entry in s["top"]:
+            print(f"        {entry['hotkey']:<48} {entry['bmps']:>12.2f}")
+    if health is None:
+        print(f"health: {health_path} not found")
+    else:
+        h = summary["health"]
+        mean_uptime = "n/a" if h["mean_uptime"] is None else f"{h['mean_uptime']:.1%}"
+        median_rtt = "n/a" if h["median_rtt"] is None else f"{h['median_rtt'] * 1000:.0f}ms"
+        print(f"health: {health_path} (written {h['written']})")
+        print(f"        {h['tracked']} uids tracked over a {h['window']}-ping window, mean uptime {mean_uptime}, "
+              f"median RTT {median_rtt}, {h['failing']} failing their last ping")
+        for entry in h["down"]:
+            print(f"        uid {entry['uid']:>5} {entry['hotkey']:<48} uptime {entry['uptime']:.0%}")
+    return 0 if state is not None or health is not None else 1
+
+
+# weights --------------------------------------------------------------------
+
+def _weight_targets(args, epochs_dir: str):
+    """
+    Returns ([(uid, hotkey)], recorded {uid: weight}, source) for the miners weights are set over:
+    the non-validator neurons of a warm-start snapshot if given, else the rows of the latest epoch.
+    """
+    if args.snapshot:
+        from merit.neuron.scoring import should_skip_neuron
+        from merit.storage.snapshot import load_snapshot
+        snapshot = load_snapshot(args.snapshot, max_age=0)
+        if snapshot is None:
+            raise SystemExit(f"merit: snapshot {args.snapshot!r} is missing, unreadable or from another version")
+        targets = [(n.uid, n.hotkey) for n in snapshot.metagraph.neurons if not should_skip_neuron(n)]
+        return targets, {}, args.snapshot
+    latest = _store(epochs_dir).latest()
+    if latest is None:
+        raise SystemExit(f"merit: no epochs in {epochs_dir!r}; pass --snapshot for the UID mapping")
+    block, summary = latest
+    targets = sorted(((row["uid"], hotkey) for hotkey, row in summary.items()), key=lambda item: item[0])
+    return targets, {row["uid"]: row["weight"] for row in summary.values()}, f"epoch {block}"
+
+
+def cmd_weights(args) -> int:
+    from merit.neuron.weights import (
+        DEFAULT_BURNER_UID, DEFAULT_BURNER_WEIGHT, DEFAULT_S_CURVE, compute_normalized_weights, parse_s_curve,
+    )
+
+    try:
+        s_curve = parse_s_curve(args.s_curve) if args.s_curve else DEFAULT_S_CURVE
+    except ValueError as e:
+        raise SystemExit(f"merit: {e}")
+    state_path, _, epochs_dir = _paths(args)
+    try:
+        state = _load_json(state_path)
+    except ValueError as e:
+        raise SystemExit(f"merit: unreadable state file: {e}")
+    if state is None:
+        raise SystemExit(f"merit: state file {state_path!r} not found")
+
+    burner_weight = DEFAULT_BURNER_WEIGHT if args.burner_weight is None else args.burner_weight
+    targets, recorded, source = _weight_targets(args, epochs_dir)
+    uids = [uid for uid, _ in targets]
+    hotkeys = {uid: hotkey for uid, hotkey in targets}
+    scores = [state.get(hotkey, 0.0) for _, hotkey in targets]
+    # Same vectors as Validator._compute_weights: the burner UID always comes first.
+    if DEFAULT_BURNER_UID not in uids:
+        uids.insert(0, DEFAULT_BURNER_UID)
+        scores.insert(0, 0.0)
+    weights = compute_normalized_weights(uids, scores, burner_weight=burner_weight, s_curve=s_curve).tolist()
+
+    rows = [
+        {"uid": uid, "hotkey": hotkeys.get(uid), "bmps": score, "weight": weight, "recorded": recorded.get(uid)}
+        for uid, score, weight in zip(uids, scores, weights)
+        if weight > 0 or recorded.get(uid)
+    ]
+    rows.sort(key=lambda row: row["weight"], reverse=True)
+    if args.top:
+        rows = rows[:args.top]
+    if args.json:
+        for row in rows:
+            _emit_json(row)
+        return 0
+    print(f"{len(uids)} uids from {source}, {sum(1 for uid, s in zip(uids, scores) if s > 0 and uid != DEFAULT_BURNER_UID)} "
+          f"miners with BMPs > 0 in {state_path}")
+    print(f"{'uid':>5} {'hotkey':<48} {'bmps':>12} {'weight':>9} {'recorded':>9}")
+    for row in rows:
+        recorded_weight = "-" if row["recorded"] is None else f"{row['recorded']:.6f}"
+        print(f"{row['uid']:>5} {row['hotkey'] or '-':<48} {row['bmps']:>12.2f} {row['weight']:>9.6f} "
+              f"{recorded_weight:>9}")
+    return 0
+
+
+# diff -----------------------------------------------------------------------
+
+def diff_epochs(old: dict, new: dict) -> dict:
+    """
+    Compares two {hotkey: row} epoch summaries: hotkeys that joined or left, UID moves, ping flips and
+    weight / BMPs changes (sorted by the size of the weight change).
+    """
+    changed = []
+    for hotkey in old.keys() & new.keys():
+        a, b = old[hotkey], new[hotkey]
+        if (a["uid"], a["weight"], a["bmps"], a["ping_success"]) == (b["uid"], b["weight"], b["bmps"], b["ping_success"]):
+            continue
+        changed.append({
+            "hotkey": hotkey,
+            "uid": b["uid"],
+            "old_uid": a["uid"],
+            "weight": b["weight"],
+            "weight_delta": round(b["weight"] - a["weight"], 6),
+            "bmps_delta": round(b["bmps"] - a["bmps"], 6),
+            "ping": [a["ping_success"], b["ping_success"]],
+        })
+    changed.sort(key=lambda entry: (-abs(entry["weight_delta"]), entry["uid"]))
+    return {
+        "joined": sorted(({"hotkey": h, "uid": new[h]["uid"]} for h in new.keys() - old.keys()), key=lambda e: e["uid"]),
+        "left": sorted(({"hotkey": h, "uid": old[h]["uid"]} for h in old.keys() - new.keys()), key=lambda e: e["uid"]),
+        "changed": changed,
+    }
+
+
+def cmd_diff(args) -> int:
+    store = _store(_paths(args)[2])
+    if args.blocks:
+        if len(args.blocks) != 2:
+            raise SystemExit("merit: diff takes two blocks, or none for the last two epochs")
+        block_a, block_b = args.blocks
+    else:
+        blocks = store.blocks()
+        if len(blocks) < 2:
+            raise SystemExit("merit: fewer than two epochs stored")
+        block_a, block_b = blocks[-2:]
+    old, new = store.read_epoch(block_a), store.read_epoch(block_b)
+    for block, summary in ((block_a, old), (block_b, new)):
+        if not summary:
+            raise SystemExit(f"merit: epoch {block} is not stored")
+
+    result = diff_epochs(old, new)
+    if args.json:
+        _emit_json({"from": block_a, "to": block_b, **result})
+        return 0
+    changed = result["changed"][:args.top] if args.top else result["changed"]
+    print(f"epoch {block_a} -> {block_b}: {len(result['joined'])} joined, {len(result['left'])} left, "
+          f"{len(result['changed'])} changed")
+    for entry in result["joined"]:
+        print(f"  + uid {entry['uid']:>5} {entry['hotkey']}")
+    for entry in result["left"]:
+        print(f"  - uid {entry['uid']:>5} {entry['hotkey']}")
+    for entry in changed:
+        moved = f" (was uid {entry['old_uid']})" if entry["old_uid"] != entry["uid"] else ""
+        ping = "" if entry["ping"][0] == entry["ping"][1] else f" ping {'ok' if entry['ping'][1] else 'fail'}"
+        print(f"  ~ uid {entry['uid']:>5} {entry['hotkey']:<48} weight {entry['weight']:.6f} "
+              f"({entry['weight_delta']:+.6f}) bmps {entry['bmps_delta']:+.2f}{ping}{moved}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--netuid", type=int, default=None,
+                        help="Read the per-netuid files of a multi-netuid validator.")
+    common.add_argument("--state", type=str, default=None, help=f"State file (defaults to {merit_config.STATE_FILE}).")
+    common.add_argument("--health", type=str, default=None,
+                        help=f"Health file (defaults to {merit_config.HEALTH_FILE}).")
+    common.add_argument("--epochs", type=str, default=None,
+                        help=f"Epoch results directory (defaults to {merit_config.EPOCH_RESULTS_DIR}).")
+    common.add_argument("--json", action="store_true", help="Print JSON (one object per line) instead of tables.")
+
+    parser = argparse.ArgumentParser(prog="merit", description="Inspect validator state, epochs and weights offline.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    epochs = commands.add_parser("epochs", parents=[common], help="List epochs, or epoch rows matching filters.")
+    epochs.add_argument("--since", type=int, default=None, help="Only epochs at or after this block.")
+    epochs.add_argument("--until", type=int, default=None, help="Only epochs at or before this block.")
+    epochs.add_argument("--hotkey", type=str, nargs="+", default=None, help="Only rows of these hotkeys.")
+    epochs.add_argument("--uid", type=int, nargs="+", default=None, help="Only rows of these UIDs.")
+    epochs.add_argument("--min_weight", type=float, default=None, help="Only rows with at least this weight.")
+    epochs.add_argument("--ping", choices=("ok", "fail"), default=None, help="Only rows whose last ping succeeded/failed.")
+    epochs.add_argument("--rows", action="store_true", help="Print every row instead of one line per epoch.")
+    epochs.set_defaults(handler=cmd_epochs)
+
+    state = commands.add_parser("state", parents=[common], help="Summarize the state and health files.")
+    state.add_argument("--top", type=int, default=10, help="Number of top miners / failing UIDs to list.")
+    state.set_defaults(handler=cmd_state)
+
+    weights = commands.add_parser("weights", parents=[common], help="Recompute weights from the state file.")
+    weights.add_argument("--snapshot", type=str, default=None,
+                         help="Warm-start snapshot to take UIDs from (defaults to the latest stored epoch).")
+    weights.add_argument("--burner_weight", type=float, default=None, help="Weight of the burner UID (defaults to 0.75).")
+    weights.add_argument("--s_curve", type=str, default=None, help="S-curve coefficients 'c3,c2,c1,c0'.")
+    weights.add_argument("--top", type=int, default=None, help="Only list the N largest weights.")
+    weights.set_defaults(handler=cmd_weights)
+
+    diff = commands.add_parser("diff", parents=[common], help="Compare two epochs (default: the last two).")
+    diff.add_argument("blocks", type=int, nargs="*", help="Blocks of the two epochs to compare.")
+    diff.add_argument("--top", type=int, default=None, help="Only list the N largest changes.")
+    diff.set_defaults(handler=cmd_diff)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # Output piped into head / less that exited early.
+        sys.stderr.close()
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,6 @@
 import bittensor as bt
 import argparse
+import sys
 from merit.neuron.miner import Miner
 
 def main():
@@ -10,12 +11,16 @@ def main():
     bt.logging.add_args(parser)
 
     parser.add_argument("--netuid", type=int, required=True, help="Subnet netuid to mine on.")
+    parser.add_argument("--metrics_port", type=int, default=None,
+                        help="Optional port for a Prometheus-style /metrics endpoint (disabled by default).")
+    parser.add_argument("--subnet_analytics", action="store_true",
+                        help="Periodically log cross-subnet registration, churn and incentive statistics.")
 
     config = bt.config(parser=parser)
     bt.logging(config=config)
 
     miner = Miner(config=config)
-    miner.run()
+    sys.exit(miner.run())
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,11 @@
 import bittensor as bt
 import argparse
 import asyncio
+from merit.config import merit_config
+from merit.neuron import replay, weights
 from merit.neuron.validator import Validator
+from merit.neuron.multi_validator import MultiValidator
+from merit.utils import tracing
 
 def main():
     parser = argparse.ArgumentParser()
@@ -12,23 +16,136 @@ def main():
 
     parser.add_argument("--netuid",
                         type=int,
-                        required=True,
-                        help="Subnet netuid to validate.")
+                        nargs="+",
+                        default=None,
+                        help="Subnet netuid(s) to validate. Several netuids share one process, chain connection, "
+                             "cross-subnet cache and ping engine.")
 
     parser.add_argument("--ping_frequency",
                         type=int,
                         default=None,
                         help="Optional ping frequency in seconds.")
 
+    parser.add_argument("--ping_concurrency",
+                        type=int,
+                        default=None,
+                        help="Optional maximum number of miners pinged at once.")
+
+    parser.add_argument("--ping_workers",
+                        type=int,
+                        default=None,
+                        help="Optional number of worker processes to shard pings across, each with its own "
+                             "dendrite (pings run on the validator's event loop by default).")
+
+    parser.add_argument("--no_adaptive_ping",
+                        action="store_true",
+                        help="Ping every miner every ping_frequency instead of scheduling by reliability.")
+
+    parser.add_argument("--no_warm_start",
+                        action="store_true",
+                        help="Ignore the saved snapshot and do a full chain sync and ping round before evaluating.")
+
+    parser.add_argument("--metrics_port",
+                        type=int,
+                        default=None,
+                        help="Optional port for a Prometheus-style /metrics endpoint (disabled by default).")
+
+    parser.add_argument("--incentive_half_life",
+                        type=int,
+                        default=None,
+                        help="Half-life in blocks of the cross-subnet incentive EMA BMPs are computed from "
+                             "(defaults to 1440; 0 scores the latest incentives as fetched).")
+
+    parser.add_argument("--dashboard_port",
+                        type=int,
+                        default=None,
+                        help="Optional port for the read-only dashboard HTTP API over epoch history (disabled by default).")
+
+    parser.add_argument("--trace",
+                        action="store_true",
+                        help="Record per-phase spans from startup and write them as Chrome trace JSON on exit. "
+                             "Tracing can also be toggled at runtime with SIGUSR2, the sampling profiler with SIGUSR1.")
+
+    parser.add_argument("--trace_file",
+                        type=str,
+                        default=None,
+                        help="Chrome trace output path (defaults to merit_trace.json).")
+
     parser.add_argument("--no_zero_weights",
                         action="store_true",
                         help="Evenly split weights across miners if all scores are zero instead of skipping.")
 
+    parser.add_argument("--replay",
+                        type=str,
+                        nargs="+",
+                        default=None,
+                        help="Replay epoch result directories and/or snapshot files through scoring and weight "
+                             "computation offline (no wallet, chain or network access) and exit.")
+
+    parser.add_argument("--replay_since_block",
+                        type=int,
+                        default=None,
+                        help="Only replay epochs at or after this block.")
+
+    parser.add_argument("--burner_weight",
+                        type=float,
+                        nargs="+",
+                        default=None,
+                        help="Burner weight(s) to compare in replay mode (defaults to 0.75).")
+
+    parser.add_argument("--s_curve",
+                        type=str,
+                        nargs="+",
+                        default=None,
+                        help="S-curve coefficient set(s) 'c3,c2,c1,c0' to compare in replay mode.")
+
+    parser.add_argument("--replay_health",
+                        type=str,
+                        default=None,
+                        help="Optional validator health file whose rolling uptime is applied to replayed snapshots.")
+
+    parser.add_argument("--replay_output",
+                        type=str,
+                        default=None,
+                        help="Optional JSON file for the per-epoch replay results.")
+
     config = bt.config(parser=parser)
     bt.logging(config=config)
 
-    validator = Validator(config=config)
-    asyncio.run(validator.run())
+    if config.replay:
+        try:
+            s_curves = [weights.parse_s_curve(value) for value in config.s_curve or []]
+        except ValueError as e:
+            parser.error(str(e))
+        replay.run_replay(config.replay, burner_weights=config.burner_weight, s_curves=s_curves,
+                          since_block=config.replay_since_block, output=config.replay_output,
+                          health=config.replay_health)
+        return
+    if not config.netuid:
+        parser.error("--netuid is required unless --replay is given")
+
+    trace_file = config.trace_file or merit_config.TRACE_FILE
+    if config.trace:
+        tracing.TRACER.enable()
+
+    netuids = config.netuid
+    if len(netuids) == 1:
+        config.netuid = netuids[0]
+        validator = Validator(config=config)
+    else:
+        validator = MultiValidator(config=config, netuids=netuids)
+
+    async def run():
+        # Profiling / tracing toggles run as loop callbacks rather than in a signal handler.
+        tracing.install_signal_handlers(trace_path=trace_file)
+        await validator.run()
+
+    try:
+        asyncio.run(run())
+    finally:
+        if tracing.TRACER.enabled:
+            count = tracing.TRACER.export_chrome_trace(trace_file)
+            bt.logging.info(f"Wrote {count} trace spans to {trace_file}.")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,333 @@
+"""
+Append-only, segmented store for per-epoch validator results.
+
+Each segment is a pair of files named after the first block it holds:
+
+    seg_<block>.log   binary frames, one per epoch
+    seg_<block>.idx   JSON index: epoch -> frame position, hotkey -> row positions
+
+A frame is a header (magic, block, payload length, crc32) followed by one row per hotkey.
+Appends write the frame, fsync the log and then atomically replace the index, so a torn
+write is never referenced and is truncated away on the next open. The per-hotkey row index
+lets readers load one miner's history by seeking to its rows instead of parsing every epoch.
+"""
+import json
+import os
+import struct
+import zlib
+
+from merit.config import merit_config
+from merit.utils.fileio import atomic_write_json
+
+MAGIC = b"MEP1"
+FRAME_HEADER = struct.Struct("<4sQII")   # magic, block, payload length, crc32
+ROW_HEAD = struct.Struct("<Hdd?ddH")     # uid, weight, bmps, ping_success, last_ping_ts, timestamp, n_subnets
+ROW_SUBNET = struct.Struct("<Hf")        # netuid, incentive
+
+
+def encode_row(hotkey: str, row: dict) -> bytes:
+    hotkey_bytes = hotkey.encode("utf-8")
+    incentives = row.get("subnet_incentives", {})
+    parts = [
+        struct.pack("<B", len(hotkey_bytes)),
+        hotkey_bytes,
+        ROW_HEAD.pack(
+            int(row.get("uid", 0)),
+            float(row.get("weight", 0.0)),
+            float(row.get("bmps", 0.0)),
+            bool(row.get("ping_success", False)),
+            float(row.get("last_ping_timestamp", 0.0)),
+            float(row.get("timestamp", 0.0)),
+            len(incentives),
+        ),
+    ]
+    parts.extend(ROW_SUBNET.pack(int(netuid), incentive) for netuid, incentive in incentives.items())
+    return b"".join(parts)
+
+
+def decode_row(buf, offset: int = 0):
+    """
+    Decodes one row starting at `offset`. Returns (hotkey, row, next_offset).
+    """
+    hotkey_len = buf[offset]
+    offset += 1
+    hotkey = bytes(buf[offset:offset + hotkey_len]).decode("utf-8")
+    offset += hotkey_len
+    uid, weight, bmps, ping_success, last_ping_ts, timestamp, n_subnets = ROW_HEAD.unpack_from(buf, offset)
+    offset += ROW_HEAD.size
+    subnet_incentives = {}
+    for _ in range(n_subnets):
+        netuid, incentive = ROW_SUBNET.unpack_from(buf, offset)
+        subnet_incentives[netuid] = round(incentive, 6)
+        offset += ROW_SUBNET.size
+    row = {
+        "uid": uid,
+        "weight": weight,
+        "bmps": bmps,
+        "subnet_incentives": subnet_incentives,
+        "ping_success": ping_success,
+        "last_ping_timestamp": last_ping_ts,
+        "timestamp": timestamp,
+    }
+    return hotkey, row, offset
+
+
+class _Segment:
+    __slots__ = ("first_block", "log_path", "idx_path", "end", "epochs", "hotkeys", "_mtime")
+
+    def __init__(self, root: str, first_block: int):
+        self.first_block = first_block
+        self.log_path = os.path.join(root, f"seg_{first_block:012d}.log")
+        self.idx_path = os.path.join(root, f"seg_{first_block:012d}.idx")
+        self.end = 0
+        self.epochs = {}    # block -> (offset, length, n_rows)
+        self.hotkeys = {}   # hotkey -> [(block, offset, length), ...]
+        self._mtime = None
+
+    def load(self):
+        """
+        (Re)loads the index if it changed on disk; rebuilds it from the log if it is missing.
+        """
+        try:
+            mtime = os.stat(self.idx_path).st_mtime_ns
+        except FileNotFoundError:
+            self.rebuild()
+            return
+        if mtime == self._mtime:
+            return
+        with open(self.idx_path, "r") as f:
+            data = json.load(f)
+        self.end = data["end"]
+        self.epochs = {int(block): tuple(entry) for block, entry in data["epochs"].items()}
+        self.hotkeys = {hotkey: [tuple(e) for e in entries] for hotkey, entries in data["hotkeys"].items()}
+        self._mtime = mtime
+
+    def rebuild(self):
+        """
+        Scans the log frame by frame, stopping at the first torn or corrupt frame.
+        """
+        self.end, self.epochs, self.hotkeys = 0, {}, {}
+        if not os.path.isfile(self.log_path):
+            return
+        with open(self.log_path, "rb") as f:
+            data = f.read()
+        offset = 0
+        while offset + FRAME_HEADER.size <= len(data):
+            magic, block, length, crc = FRAME_HEADER.unpack_from(data, offset)
+            payload_start = offset + FRAME_HEADER.size
+            payload = data[payload_start:payload_start + length]
+            if magic != MAGIC or len(payload) != length or zlib.crc32(payload) != crc:
+                break
+            self._index_frame(block, payload_start, payload)
+            offset = payload_start + length
+        self.end = offset
+
+    def _index_frame(self, block: int, payload_start: int, payload):
+        row_offset = 0
+        n_rows = 0
+        while row_offset < len(payload):
+            hotkey, _, next_offset = decode_row(payload, row_offset)
+            self.hotkeys.setdefault(hotkey, []).append(
+                (block, payload_start + row_offset, next_offset - row_offset)
+            )
+            row_offset = next_offset
+            n_rows += 1
+        self.epochs[block] = (payload_start, len(payload), n_rows)
+
+    def save(self):
+        atomic_write_json(self.idx_path, {
+            "end": self.end,
+            "epochs": {str(block): list(entry) for block, entry in self.epochs.items()},
+            "hotkeys": {hotkey: [list(e) for e in entries] for hotkey, entries in self.hotkeys.items()},
+        })
+        self._mtime = os.stat(self.idx_path).st_mtime_ns
+
+    def size(self) -> int:
+        try:
+            return os.path.getsize(self.log_path)
+        except FileNotFoundError:
+            return 0
+
+    def remove(self):
+        for path in (self.idx_path, self.log_path):
+            if os.path.isfile(path):
+                os.remove(path)
+
+
+class EpochStore:
+    """
+    Writer and reader for epoch results. Rows look like the old `epoch_<block>.json` entries:
+    {"uid", "weight", "bmps", "subnet_incentives", "ping_success", "last_ping_timestamp", "timestamp"}.
+    """
+
+    def __init__(
+        self,
+        root: str = merit_config.EPOCH_RESULTS_DIR,
+        epochs_per_segment: int = merit_config.EPOCHS_PER_SEGMENT,
+        max_epochs: int = merit_config.MAX_EPOCHS,
+        max_bytes: int = merit_config.MAX_EPOCH_BYTES,
+    ):
+        self.root = root
+        self.epochs_per_segment = max(1, epochs_per_segment)
+        self.max_epochs = max_epochs
+        self.max_bytes = max_bytes
+        self._segments = {}
+        self._recovered = False
+
+    def _load_segments(self) -> list:
+        """
+        Returns segments sorted by first block (numerically), loading any new or changed indexes.
+        """
+        if not os.path.isdir(self.root):
+            return []
+        found = set()
+        for name in os.listdir(self.root):
+            if name.startswith("seg_") and name.endswith(".log"):
+                try:
+                    found.add(int(name[4:-4]))
+                except ValueError:
+                    continue
+        for first_block in list(self._segments):
+            if first_block not in found:
+                del self._segments[first_block]
+        for first_block in found:
+            if first_block not in self._segments:
+                self._segments[first_block] = _Segment(self.root, first_block)
+        segments = [self._segments[b] for b in sorted(self._segments)]
+        for segment in segments:
+            segment.load()
+        return segments
+
+    def _recover(self, segment: _Segment):
+        """
+        Truncates bytes past the indexed end of the active segment (left behind by a crash mid-append).
+        """
+        if segment.size() > segment.end:
+            with open(segment.log_path, "r+b") as f:
+                f.truncate(segment.end)
+
+    # Writer -----------------------------------------------------------------
+
+    def append(self, block: int, summary: dict):
+        """
+        Appends one epoch's {hotkey: row} summary and atomically publishes it in the segment index.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        segments = self._load_segments()
+        if segments and not self._recovered:
+            self._recover(segments[-1])
+        self._recovered = True
+
+        if not segments or len(segments[-1].epochs) >= self.epochs_per_segment:
+            segment = self._segments[block] = _Segment(self.root, block)
+        else:
+            segment = segments[-1]
+
+        payload = b"".join(encode_row(hotkey, row) for hotkey, row in summary.items())
+        header = FRAME_HEADER.pack(MAGIC, block, len(payload), zlib.crc32(payload))
+        with open(segment.log_path, "ab") as f:
+            f.write(header + payload)
+            f.flush()
+            os.fsync(f.fileno())
+
+        segment._index_frame(block, segment.end + FRAME_HEADER.size, payload)
+        segment.end += FRAME_HEADER.size + len(payload)
+        segment.save()
+
+    def prune(self) -> int:
+        """
+        Drops whole oldest segments while the remainder still satisfies the retention limits.
+        Returns the number of epochs removed.
+        """
+        segments = self._load_segments()
+        total_epochs = sum(len(s.epochs) for s in segments)
+        total_bytes = sum(s.size() for s in segments)
+        removed = 0
+        while len(segments) > 1:
+            oldest = segments[0]
+            over_count = self.max_epochs and total_epochs - len(oldest.epochs) >= self.max_epochs
+            over_size = self.max_bytes and total_bytes > self.max_bytes
+            if not (over_count or over_size):
+                break
+            total_epochs -= len(oldest.epochs)
+            total_bytes -= oldest.size()
+            removed += len(oldest.epochs)
+            oldest.remove()
+            del self._segments[oldest.first_block]
+            segments.pop(0)
+        return removed
+
+    # Reader -----------------------------------------------------------------
+
+    def blocks(self) -> list:
+        return sorted(block for segment in self._load_segments() for block in segment.epochs)
+
+    def _segment_for(self, block: int):
+        for segment in self._load_segments():
+            if block in segment.epochs:
+                return segment
+        return None
+
+    def read_epoch(self, block: int) -> dict:
+        """
+        Returns {hotkey: row} for the epoch at `block`, or {} if it is not stored.
+        """
+        segment = self._segment_for(block)
+        if segment is None:
+            return {}
+        offset, length, _ = segment.epochs[block]
+        with open(segment.log_path, "rb") as f:
+            f.seek(offset)
+            payload = f.read(length)
+        return self._decode_payload(payload)
+
+    @staticmethod
+    def _decode_payload(payload) -> dict:
+        summary = {}
+        offset = 0
+        while offset < len(payload):
+            hotkey, row, offset = decode_row(payload, offset)
+            summary[hotkey] = row
+        return summary
+
+    def iter_epochs(self, since_block: int = None):
+        """
+        Yields (block, {hotkey: row}) in block order, reading each segment once.
+        """
+        for segment in self._load_segments():
+            blocks = sorted(b for b in segment.epochs if since_block is None or b >= since_block)
+            if not blocks:
+                continue
+            with open(segment.log_path, "rb") as f:
+                for block in blocks:
+                    offset, length, _ = segment.epochs[block]
+                    f.seek(offset)
+                    yield block, self._decode_payload(f.read(length))
+
+    def latest(self):
+        """
+        Returns (block, {hotkey: row}) for the newest epoch, or None if the store is empty.
+        """
+        blocks = self.blocks()
+        if not blocks:
+            return None
+        return blocks[-1], self.read_epoch(blocks[-1])
+
+    def hotkey_history(self, hotkey: str, since_block: int = None) -> list:
+        """
+        Returns [(block, row), ...] for one hotkey by seeking to its rows only.
+        """
+        history = []
+        for segment in self._load_segments():
+            entries = segment.hotkeys.get(hotkey)
+            if not entries:
+                continue
+            with open(segment.log_path, "rb") as f:
+                for block, offset, length in entries:
+                    if since_block is not None and block < since_block:
+                        continue
+                    f.seek(offset)
+                    _, row, _ = decode_row(f.read(length))
+                    history.append((block, row))
+        history.sort(key=lambda item: item[0])
+        return history
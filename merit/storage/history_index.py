@@ -0,0 +1,263 @@
+"""
+In-memory, read-optimized index over the epochs in the epoch store, for the dashboard API.
+
+The index is built once from the store at startup and then updated incrementally: each epoch is
+added as it is written and dropped once the store prunes it. Rows are kept once as compact tuples
+shared by the per-epoch and per-hotkey views, and every aggregate served (per-epoch totals, per-hotkey
+uptime, cross-subnet participation) is maintained on add / drop instead of being recomputed per query.
+
+Rendered responses are cached as JSON bytes with a content ETag until the index changes, so clients
+polling every few seconds cost a dictionary lookup.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+
+from merit.config import merit_config
+
+# Row tuple fields
+BLOCK, UID, WEIGHT, BMPS, PING_SUCCESS, LAST_PING, TIMESTAMP, INCENTIVES = range(8)
+
+
+class _EpochEntry:
+    __slots__ = ("block", "timestamp", "rows", "weighted", "reachable", "total_bmps", "subnets")
+
+    def __init__(self, block: int):
+        self.block = block
+        self.timestamp = 0.0
+        self.rows = []          # [(hotkey, row tuple), ...]
+        self.weighted = 0
+        self.reachable = 0
+        self.total_bmps = 0.0
+        self.subnets = {}       # netuid -> miners with incentive there
+
+    def to_dict(self) -> dict:
+        return {
+            "block": self.block,
+            "timestamp": self.timestamp,
+            "miners": len(self.rows),
+            "weighted_miners": self.weighted,
+            "reachable_miners": self.reachable,
+            "total_bmps": self.total_bmps,
+            "subnets": {str(netuid): count for netuid, count in sorted(self.subnets.items())},
+        }
+
+
+class _HotkeyEntry:
+    __slots__ = ("rows", "successes", "subnet_epochs")
+
+    def __init__(self):
+        self.rows = deque()         # row tuples, oldest first
+        self.successes = 0
+        self.subnet_epochs = {}     # netuid -> epochs with incentive there
+
+    def to_summary(self) -> dict:
+        latest = self.rows[-1]
+        return {
+            "uid": latest[UID],
+            "epochs": len(self.rows),
+            "uptime": self.successes / len(self.rows),
+            "latest_block": latest[BLOCK],
+            "latest_weight": latest[WEIGHT],
+            "latest_bmps": latest[BMPS],
+            "subnets": len(latest[INCENTIVES]),
+        }
+
+
+class HistoryIndex:
+    """
+    Thread-safe: the validator adds and drops epochs from its event loop while the dashboard server
+    renders from its own threads.
+    """
+
+    def __init__(self, cache_size: int = merit_config.DASHBOARD_CACHE_SIZE):
+        self.cache_size = cache_size
+        self.version = 0
+        self.last_modified = time.time()
+        self._epochs = {}       # block -> _EpochEntry, in insertion (block) order
+        self._hotkeys = {}      # hotkey -> _HotkeyEntry
+        self._incentive_keys = {}
+        self._cache = {}        # (kind, arg) -> (body, etag), cleared on every change
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_store(cls, store, **kwargs):
+        index = cls(**kwargs)
+        for block, summary in store.iter_epochs():
+            index.add_epoch(block, summary)
+        return index
+
+    # Updates ----------------------------------------------------------------
+
+    def _intern_incentives(self, incentives: dict) -> tuple:
+        key = tuple(sorted((int(netuid), float(value)) for netuid, value in incentives.items()))
+        return self._incentive_keys.setdefault(key, key)
+
+    def add_epoch(self, block: int, summary: dict):
+        """
+        Indexes one epoch's {hotkey: row} summary (as written to the epoch store). Re-adding a block replaces it.
+        """
+        with self._lock:
+            if block in self._epochs:
+                self._drop(block)
+            out_of_order = bool(self._epochs) and block < next(reversed(self._epochs))
+            epoch = self._epochs[block] = _EpochEntry(block)
+            for hotkey, row in summary.items():
+                incentives = self._intern_incentives(row.get("subnet_incentives", {}))
+                entry = (
+                    block, row["uid"], row["weight"], row["bmps"], bool(row["ping_success"]),
+                    row["last_ping_timestamp"], row["timestamp"], incentives,
+                )
+                epoch.rows.append((hotkey, entry))
+                epoch.timestamp = max(epoch.timestamp, entry[TIMESTAMP])
+                epoch.weighted += entry[WEIGHT] > 0
+                epoch.reachable += entry[PING_SUCCESS]
+                epoch.total_bmps += entry[BMPS]
+
+                history = self._hotkeys.get(hotkey)
+                if history is None:
+                    history = self._hotkeys[hotkey] = _HotkeyEntry()
+                history.rows.append(entry)
+                history.successes += entry[PING_SUCCESS]
+                for netuid, incentive in incentives:
+                    if incentive > 0:
+                        epoch.subnets[netuid] = epoch.subnets.get(netuid, 0) + 1
+                        history.subnet_epochs[netuid] = history.subnet_epochs.get(netuid, 0) + 1
+            if out_of_order:
+                # Only happens when an epoch is re-added: restore block order everywhere.
+                self._epochs = dict(sorted(self._epochs.items()))
+                for history in self._hotkeys.values():
+                    history.rows = deque(sorted(history.rows, key=lambda r: r[BLOCK]))
+            self._changed()
+
+    def retain_since(self, first_block: int) -> int:
+        """
+        Drops epochs older than `first_block` (the oldest block still in the store). Returns how many were dropped.
+        """
+        with self._lock:
+            stale = [block for block in self._epochs if block < first_block]
+            for block in stale:
+                self._drop(block)
+            if stale:
+                live = {entry[INCENTIVES] for history in self._hotkeys.values() for entry in history.rows}
+                self._incentive_keys = {key: key for key in live}
+                self._changed()
+            return len(stale)
+
+    def _drop(self, block: int):
+        epoch = self._epochs.pop(block)
+        for hotkey, entry in epoch.rows:
+            history = self._hotkeys[hotkey]
+            if history.rows[0] is entry:
+                history.rows.popleft()
+            else:
+                history.rows.remove(entry)
+            history.successes -= entry[PING_SUCCESS]
+            for netuid, incentive in entry[INCENTIVES]:
+                if incentive > 0:
+                    history.subnet_epochs[netuid] -= 1
+                    if not history.subnet_epochs[netuid]:
+                        del history.subnet_epochs[netuid]
+            if not history.rows:
+                del self._hotkeys[hotkey]
+
+    def _changed(self):
+        self.version += 1
+        self.last_modified = time.time()
+        self._cache.clear()
+
+    # Queries (callers hold the lock, see `render`) --------------------------
+
+    def _summary(self) -> dict:
+        latest = self._epochs[next(reversed(self._epochs))] if self._epochs else None
+        return {
+            "epochs": len(self._epochs),
+            "hotkeys": len(self._hotkeys),
+            "first_block": next(iter(self._epochs), None),
+            "latest": latest.to_dict() if latest else None,
+        }
+
+    def _epoch_list(self, since_block: int = None) -> list:
+        return [
+            epoch.to_dict() for block, epoch in self._epochs.items()
+            if since_block is None or block >= since_block
+        ]
+
+    def _epoch_detail(self, block: int):
+        epoch = self._epochs.get(block)
+        if epoch is None:
+            return None
+        detail = epoch.to_dict()
+        detail["rows"] = {
+            hotkey: {
+                "uid": entry[UID],
+                "weight": entry[WEIGHT],
+                "bmps": entry[BMPS],
+                "ping_success": entry[PING_SUCCESS],
+                "last_ping_timestamp": entry[LAST_PING],
+                "subnet_incentives": {str(netuid): incentive for netuid, incentive in entry[INCENTIVES]},
+            }
+            for hotkey, entry in epoch.rows
+        }
+        return detail
+
+    def _hotkey_list(self) -> dict:
+        return {hotkey: history.to_summary() for hotkey, history in self._hotkeys.items()}
+
+    def _hotkey_detail(self, hotkey: str):
+        history = self._hotkeys.get(hotkey)
+        if history is None:
+            return None
+        rows = history.rows
+        detail = history.to_summary()
+        detail["subnet_epochs"] = {str(netuid): count for netuid, count in sorted(history.subnet_epochs.items())}
+        detail["subnet_incentives"] = {str(netuid): incentive for netuid, incentive in rows[-1][INCENTIVES]}
+        # Column-oriented series for graphing.
+        detail["series"] = {
+            "block": [r[BLOCK] for r in rows],
+            "weight": [r[WEIGHT] for r in rows],
+            "bmps": [r[BMPS] for r in rows],
+            "ping_success": [r[PING_SUCCESS] for r in rows],
+            "subnets": [len(r[INCENTIVES]) for r in rows],
+        }
+        return detail
+
+    def render(self, kind: str, arg=None):
+        """
+        Returns (body, etag) for a query, or None if the epoch / hotkey is not indexed. `kind` is one of
+        "summary", "epochs" (arg: since block or None), "epoch" (arg: block), "hotkeys" or "hotkey" (arg: hotkey).
+        """
+        key = (kind, arg)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            if kind == "summary":
+                data = self._summary()
+            elif kind == "epochs":
+                data = self._epoch_list(arg)
+            elif kind == "epoch":
+                data = self._epoch_detail(arg)
+            elif kind == "hotkeys":
+                data = self._hotkey_list()
+            elif kind == "hotkey":
+                data = self._hotkey_detail(arg)
+            else:
+                raise ValueError(f"Unknown query {kind!r}")
+            if data is None:
+                return None
+            body = json.dumps(data, separators=(",", ":")).encode("utf-8")
+            rendered = (body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = rendered
+            return rendered
+
+    def blocks(self) -> list:
+        with self._lock:
+            return list(self._epochs)
+
+    def __len__(self) -> int:
+        return len(self._epochs)
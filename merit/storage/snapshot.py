@@ -0,0 +1,139 @@
+"""
+Warm-start snapshot of the validator's view of the chain and its last ping round.
+
+Holds only what the validator reads back: its own metagraph's neurons (uid, hotkey, axon, skip
+fields) and weights version, each subnet's netuid / last_step / hotkeys / incentives, the latest
+ping outcomes and, if smoothing is on, the incentive EMAs (IncentiveSeries.to_dict). Stored as gzipped
+JSON and replaced atomically after every chain refresh.
+"""
+import gzip
+import json
+import os
+import time
+
+from merit.config import merit_config
+from merit.utils.fileio import atomic_write
+
+SNAPSHOT_VERSION = 1
+
+
+class SnapshotAxon:
+    __slots__ = ("ip", "port")
+
+    def __init__(self, ip: str, port: int):
+        self.ip = ip
+        self.port = port
+
+
+class SnapshotNeuron:
+    __slots__ = ("uid", "hotkey", "axon_info", "dividends", "validator_trust")
+
+    def __init__(self, uid: int, hotkey: str, ip: str, port: int, dividends: float, validator_trust: float):
+        self.uid = uid
+        self.hotkey = hotkey
+        self.axon_info = SnapshotAxon(ip, port)
+        self.dividends = dividends
+        self.validator_trust = validator_trust
+
+
+class SnapshotHparams:
+    __slots__ = ("weights_version",)
+
+    def __init__(self, weights_version: int):
+        self.weights_version = weights_version
+
+
+class SnapshotMetagraph:
+    """
+    Stand-in for bt.metagraph exposing the attributes the validator reads until the first live sync.
+    """
+
+    def __init__(self, netuid: int, neurons, weights_version: int):
+        self.netuid = netuid
+        self.neurons = neurons
+        self.hotkeys = [neuron.hotkey for neuron in neurons]
+        self.hparams = SnapshotHparams(weights_version)
+
+
+class SubnetSnapshot:
+    __slots__ = ("netuid", "last_step", "hotkeys", "incentives")
+
+    def __init__(self, netuid: int, last_step, hotkeys, incentives):
+        self.netuid = netuid
+        self.last_step = last_step
+        self.hotkeys = hotkeys
+        self.incentives = incentives
+
+
+class ValidatorSnapshot:
+    __slots__ = ("timestamp", "metagraph", "infos", "ping_success", "ping_times", "incentive_series")
+
+    def __init__(self, timestamp: float, metagraph, infos, ping_success: dict, ping_times: dict,
+                 incentive_series: dict = None):
+        self.timestamp = timestamp
+        self.metagraph = metagraph
+        self.infos = infos
+        self.ping_success = ping_success
+        self.ping_times = ping_times
+        self.incentive_series = incentive_series
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.timestamp
+
+
+def save_snapshot(path: str, metagraph, infos, ping_success: dict, ping_times: dict, incentive_series: dict = None):
+    neurons = [
+        [
+            int(n.uid), n.hotkey, n.axon_info.ip, int(n.axon_info.port),
+            float(n.dividends), float(n.validator_trust),
+        ]
+        for n in metagraph.neurons
+    ]
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "timestamp": time.time(),
+        "netuid": int(metagraph.netuid),
+        "weights_version": int(metagraph.hparams.weights_version),
+        "neurons": neurons,
+        "subnets": [
+            [int(info.netuid), getattr(info, "last_step", None), list(info.hotkeys), [float(x) for x in info.incentives]]
+            for info in infos
+        ],
+        "ping_success": ping_success,
+        "ping_times": ping_times,
+        "incentive_series": incentive_series,
+    }
+    payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    atomic_write(path, gzip.compress(payload, compresslevel=6))
+
+
+def load_snapshot(path: str = merit_config.SNAPSHOT_FILE, max_age: float = merit_config.SNAPSHOT_MAX_AGE,
+                  netuid: int = None):
+    """
+    Returns a ValidatorSnapshot, or None if the file is missing, unreadable, from another version, too old
+    or (if `netuid` is given) taken on another subnet.
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(gzip.decompress(f.read()))
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != SNAPSHOT_VERSION:
+        return None
+    if max_age and time.time() - data["timestamp"] > max_age:
+        return None
+    if netuid is not None and data.get("netuid") != netuid:
+        return None
+
+    neurons = [SnapshotNeuron(*entry) for entry in data["neurons"]]
+    return ValidatorSnapshot(
+        timestamp=data["timestamp"],
+        metagraph=SnapshotMetagraph(data["netuid"], neurons, data["weights_version"]),
+        infos=[SubnetSnapshot(*entry) for entry in data["subnets"]],
+        ping_success=data["ping_success"],
+        ping_times=data["ping_times"],
+        incentive_series=data.get("incentive_series"),
+    )
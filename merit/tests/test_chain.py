@@ -0,0 +1,51 @@
+import asyncio
+import time
+import unittest
+
+from merit.utils.chain import ChainClient
+
+
+class TestChainClient(unittest.TestCase):
+    def setUp(self):
+        self.chain = ChainClient(subtensor=None, default_timeout=0.2)
+
+    def tearDown(self):
+        self.chain.close()
+
+    def test_call_runs_off_loop_and_records_latency(self):
+        async def scenario():
+            ticks = []
+
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.perf_counter())
+                    await asyncio.sleep(0.01)
+
+            result, _ = await asyncio.gather(self.chain.call("slow", time.sleep, 0.1), ticker())
+            return result, ticks
+
+        result, ticks = asyncio.run(scenario())
+        self.assertIsNone(result)
+        self.assertEqual(len(ticks), 5)
+        self.assertLess(ticks[-1] - ticks[0], 0.09)
+        self.assertEqual(self.chain.latency_stats()["slow"]["calls"], 1)
+
+    def test_deadline_raises_timeout_and_counts_it(self):
+        async def scenario():
+            await self.chain.call("stuck", time.sleep, 0.5, timeout=0.05)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            asyncio.run(scenario())
+        self.assertEqual(self.chain.stats["stuck"].timeouts, 1)
+
+    def test_errors_are_counted_and_reraised(self):
+        def boom():
+            raise RuntimeError("chain down")
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.chain.call("boom", boom))
+        self.assertEqual(self.chain.stats["boom"].errors, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import json
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+from email.utils import formatdate
+
+from merit.storage.epoch_store import EpochStore
+from merit.storage.history_index import HistoryIndex
+from merit.utils.dashboard import start_dashboard_server
+
+
+def _summary(block, hotkeys):
+    return {
+        hotkey: {
+            "uid": uid,
+            "weight": 0.1 * uid,
+            "bmps": float(block + uid),
+            "subnet_incentives": {2: 0.5, 7: 0.25 if uid % 2 else 0.0},
+            "ping_success": (block + uid) % 3 != 0,
+            "last_ping_timestamp": 1700000000.0 + block,
+            "timestamp": 1700000001.0 + block,
+        }
+        for uid, hotkey in enumerate(hotkeys)
+    }
+
+
+class TestHistoryIndex(unittest.TestCase):
+    def test_incremental_aggregates_match_rebuild(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = EpochStore(tmp)
+            index = HistoryIndex()
+            for block in range(10, 20):
+                summary = _summary(block, ["a", "b", "c"] if block < 15 else ["a", "c", "d"])
+                store.append(block, summary)
+                index.add_epoch(block, summary)
+            self.assertEqual(index.retain_since(13), 3)
+
+            rebuilt = HistoryIndex()
+            for block, summary in store.iter_epochs(since_block=13):
+                rebuilt.add_epoch(block, summary)
+            for query in [("summary", None), ("epochs", None), ("epoch", 17), ("hotkeys", None), ("hotkey", "c")]:
+                self.assertEqual(index.render(*query), rebuilt.render(*query))
+
+        hotkey = json.loads(index.render("hotkey", "b")[0])
+        self.assertEqual(hotkey["series"]["block"], [13, 14])
+        self.assertEqual(hotkey["subnet_epochs"], {"2": 2, "7": 2})
+        self.assertAlmostEqual(hotkey["uptime"], 0.5)
+        epoch = json.loads(index.render("epoch", 15)[0])
+        self.assertEqual(epoch["subnets"], {"2": 3, "7": 1})
+        self.assertEqual(set(epoch["rows"]), {"a", "c", "d"})
+        self.assertIsNone(index.render("epoch", 10))
+        self.assertIsNone(index.render("hotkey", "zz"))
+
+    def test_render_is_cached_until_changed(self):
+        index = HistoryIndex()
+        index.add_epoch(1, _summary(1, ["a"]))
+        first = index.render("summary")
+        self.assertIs(index.render("summary"), first)
+        index.add_epoch(2, _summary(2, ["a"]))
+        second = index.render("summary")
+        self.assertNotEqual(first[1], second[1])
+
+
+class TestDashboardServer(unittest.TestCase):
+    def setUp(self):
+        self.index = HistoryIndex()
+        self.index.add_epoch(100, _summary(100, ["a", "b"]))
+        self.server = start_dashboard_server(0, {73: self.index}, addr="127.0.0.1")
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}/api"
+
+    def tearDown(self):
+        self.server.shutdown()
+
+    def _get(self, path, **headers):
+        request = urllib.request.Request(self.base + path, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.status, response.headers, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers, b""
+
+    def test_queries_and_conditional_requests(self):
+        status, _, body = self._get("/netuids")
+        self.assertEqual((status, json.loads(body)), (200, [73]))
+        status, headers, body = self._get("/73/hotkeys/b")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["series"]["block"], [100])
+        # Changed within the current second: only the ETag can revalidate.
+        self.assertNotIn("Last-Modified", headers)
+        self.assertEqual(self._get("/73/hotkeys/b", **{"If-Modified-Since": formatdate(usegmt=True)})[0], 200)
+
+        self.index.last_modified -= 2
+        status, headers, _ = self._get("/73/hotkeys/b")
+        etag, last_modified = headers["ETag"], headers["Last-Modified"]
+        self.assertEqual(self._get("/73/hotkeys/b", **{"If-None-Match": etag})[0], 304)
+        self.assertEqual(self._get("/73/hotkeys/b", **{"If-Modified-Since": last_modified})[0], 304)
+
+        self.index.add_epoch(101, _summary(101, ["a", "b"]))
+        status, _, body = self._get("/73/hotkeys/b", **{"If-None-Match": etag})
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(body)["series"]["block"], [100, 101])
+        self.assertEqual(len(json.loads(self._get("/73/epochs?since=101")[2])), 1)
+
+    def test_unknown_paths(self):
+        for path in ["/74/summary", "/73/epochs/5", "/73/nope", "/x/summary", "/subnets"]:
+            self.assertEqual(self._get(path)[0], 404)
+
+
+if __name__ == "__main__":
+    unittest.main()
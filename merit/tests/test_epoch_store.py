@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from merit.storage.epoch_store import EpochStore
+
+
+def _summary(block, hotkeys):
+    return {
+        hotkey: {
+            "uid": uid,
+            "weight": 0.25,
+            "bmps": float(block + uid),
+            "subnet_incentives": {2: 0.123456, 7: 0.5},
+            "ping_success": uid % 2 == 0,
+            "last_ping_timestamp": 1700000000.5,
+            "timestamp": 1700000001.25,
+        }
+        for uid, hotkey in enumerate(hotkeys)
+    }
+
+
+class TestEpochStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip_and_hotkey_history(self):
+        store = EpochStore(self.root, epochs_per_segment=2, max_epochs=0, max_bytes=0)
+        for block in (900, 1000, 10000, 10360):
+            store.append(block, _summary(block, ["a", "b"] if block < 10000 else ["b", "c"]))
+
+        self.assertEqual(store.blocks(), [900, 1000, 10000, 10360])
+        self.assertEqual(store.read_epoch(1000), _summary(1000, ["a", "b"]))
+        self.assertEqual([block for block, _ in store.hotkey_history("b")], [900, 1000, 10000, 10360])
+        self.assertEqual([row["uid"] for _, row in store.hotkey_history("c")], [1, 1])
+        self.assertEqual(store.latest()[0], 10360)
+
+        reader = EpochStore(self.root)
+        self.assertEqual([block for block, _ in reader.iter_epochs(since_block=1000)], [1000, 10000, 10360])
+
+    def test_prune_keeps_newest_segments_in_block_order(self):
+        store = EpochStore(self.root, epochs_per_segment=1, max_epochs=2, max_bytes=0)
+        for block in (9640, 10000, 99640, 100000):
+            store.append(block, _summary(block, ["a"]))
+        self.assertEqual(store.prune(), 2)
+        self.assertEqual(store.blocks(), [99640, 100000])
+
+    def test_torn_append_is_truncated(self):
+        store = EpochStore(self.root, max_epochs=0, max_bytes=0)
+        store.append(100, _summary(100, ["a"]))
+        log_path = os.path.join(self.root, f"seg_{100:012d}.log")
+        with open(log_path, "ab") as f:
+            f.write(b"MEP1garbage")
+
+        store = EpochStore(self.root, max_epochs=0, max_bytes=0)
+        store.append(460, _summary(460, ["a"]))
+        self.assertEqual(store.blocks(), [100, 460])
+        self.assertEqual(store.read_epoch(460)["a"]["bmps"], 460.0)
+
+        os.remove(os.path.join(self.root, f"seg_{100:012d}.idx"))
+        self.assertEqual(EpochStore(self.root).blocks(), [100, 460])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from types import SimpleNamespace
+
+from merit.neuron.incentive_index import IncentiveIndex
+
+
+def _info(netuid, hotkeys, incentives):
+    return SimpleNamespace(netuid=netuid, hotkeys=hotkeys, incentives=incentives)
+
+
+class TestIncentiveIndex(unittest.TestCase):
+    def test_maps_hotkey_to_incentive_per_netuid(self):
+        index = IncentiveIndex([
+            _info(0, ["a"], [0.9]),
+            _info(2, ["a", "b"], [0.1, 0.2]),
+            _info(3, ["b"], [0.3]),
+            _info(5, ["a"], [0.4]),
+        ], skip_netuids=(0, 5))
+        self.assertEqual(index.netuids, [2, 3])
+        self.assertEqual(index.get("a"), {2: 0.1})
+        self.assertEqual(index.get("b"), {2: 0.2, 3: 0.3})
+
+    def test_unknown_hotkey_is_empty(self):
+        index = IncentiveIndex([_info(2, ["a"], [0.1])])
+        self.assertNotIn("z", index)
+        self.assertEqual(index.get("z"), {})
+
+    def test_set_and_remove_subnet_match_full_rebuild(self):
+        index = IncentiveIndex([_info(2, ["a", "b"], [0.1, 0.2]), _info(3, ["b"], [0.3])])
+        index.set_subnet(2, ["b", "c"], [0.5, 0.6])
+        index.remove_subnet(3)
+        index.set_subnet(4, ["a"], [0.7])
+
+        rebuilt = IncentiveIndex([_info(2, ["b", "c"], [0.5, 0.6]), _info(4, ["a"], [0.7])])
+        self.assertEqual(sorted(index.netuids), sorted(rebuilt.netuids))
+        for hotkey in ("a", "b", "c"):
+            self.assertEqual(index.get(hotkey), rebuilt.get(hotkey))
+        self.assertEqual(len(index), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
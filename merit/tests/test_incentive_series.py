@@ -0,0 +1,73 @@
+import json
+import unittest
+
+from merit.neuron import scoring
+from merit.neuron.incentive_index import IncentiveIndex
+from merit.neuron.incentive_series import IncentiveSeries
+
+
+class TestIncentiveSeries(unittest.TestCase):
+    def test_ema_follows_block_time(self):
+        series = IncentiveSeries(half_life=360)
+        self.assertEqual(series.set_subnet(1, ["a", "b"], [0.4, 0.2], last_step=1000), {"a", "b"})
+        self.assertEqual(series.get("a"), {1: 0.4})
+
+        # A refetch of the same step changes nothing.
+        self.assertEqual(series.set_subnet(1, ["a", "b"], [0.8, 0.2], last_step=1000), set())
+        self.assertEqual(series.set_subnet(1, ["a", "b"], [0.8, 0.2], last_step=1360), {"a"})
+        self.assertAlmostEqual(series.get("a")[1], 0.6)
+        series.set_subnet(1, ["a", "b"], [0.8, 0.2], last_step=1720)
+        self.assertAlmostEqual(series.get("a")[1], 0.7)
+        self.assertAlmostEqual(series.get("b")[1], 0.2)
+
+    def test_evicts_deregistered_hotkeys(self):
+        series = IncentiveSeries(half_life=360, skip_netuids=(0,), capacity=2)
+        series.set_subnet(0, ["a"], [1.0], last_step=1)
+        series.set_subnet(1, ["a", "b"], [0.1, 0.2], last_step=1)
+        series.set_subnet(2, ["b", "c", "d"], [0.3, 0.3, 0.3], last_step=1)
+        self.assertEqual(len(series), 4)
+        self.assertEqual(sorted(series.netuids), [1, 2])
+
+        self.assertEqual(series.set_subnet(2, ["b", "e"], [0.3, 0.5], last_step=1), {"c", "d", "e"})
+        self.assertEqual(series.remove_subnet(1), {"a", "b"})
+        self.assertEqual(len(series), 2)
+        self.assertEqual(series.get("a"), {})
+        self.assertEqual(series.get("e"), {2: 0.5})
+
+    def test_restore_carries_smoothing_over(self):
+        series = IncentiveSeries(half_life=360, skip_netuids=(0,))
+        series.set_subnet(1, ["a", "b"], [0.4, 0.2], last_step=1000)
+        series.set_subnet(1, ["a", "b"], [0.8, 0.2], last_step=1360)
+        series.set_subnet(2, ["a"], [0.1], last_step=1000)
+
+        restored = IncentiveSeries(half_life=360, skip_netuids=(0,))
+        restored.restore(json.loads(json.dumps(series.to_dict())))
+        self.assertAlmostEqual(restored.get("a")[1], 0.6)
+        # Folding in the infos saved alongside changes nothing; the next step folds as before the restart.
+        self.assertEqual(restored.set_subnet(1, ["a", "b"], [0.8, 0.2], last_step=1360), set())
+        for each in (series, restored):
+            each.set_subnet(1, ["a", "b"], [0.8, 0.2], last_step=1720)
+        self.assertEqual(restored.get("a"), series.get("a"))
+        self.assertEqual(restored.get("b"), series.get("b"))
+
+    def test_vectorized_bmps_match_scoring(self):
+        infos = [
+            (1, ["a", "b", "c"], [0.1, 0.25, 0.5]),
+            (2, ["b", "c"], [0.125, 0.0625]),
+            (3, ["c", "d"], [0.75, 0.03125]),
+        ]
+        series = IncentiveSeries(half_life=360)
+        index = IncentiveIndex()
+        for netuid, hotkeys, incentives in infos:
+            series.set_subnet(netuid, hotkeys, incentives, last_step=100)
+            index.set_subnet(netuid, hotkeys, incentives)
+
+        hotkeys = ["a", "b", "c", "d", "unknown"]
+        bmps = series.bmps(hotkeys, len(index.netuids))
+        for hotkey, value in zip(hotkeys, bmps):
+            self.assertAlmostEqual(value, scoring.bmps(index.get(hotkey), len(index.netuids)))
+        self.assertEqual(list(series.bmps(hotkeys, 0)), [0.0] * 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from merit.neuron.weights import compute_normalized_weights
+from merit.scripts import merit_cli
+from merit.storage.epoch_store import EpochStore
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _row(uid, weight, bmps, ping_success=True):
+    return {
+        "uid": uid,
+        "weight": weight,
+        "bmps": bmps,
+        "subnet_incentives": {2: 0.5},
+        "ping_success": ping_success,
+        "last_ping_timestamp": 1700000000.0,
+        "timestamp": 1700000001.0,
+    }
+
+
+class TestMeritCli(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.epochs = os.path.join(self.tmp.name, "epoch_results")
+        self.state = os.path.join(self.tmp.name, "state.json")
+        self.health = os.path.join(self.tmp.name, "health.json")
+        store = EpochStore(self.epochs)
+        store.append(100, {"burn": _row(0, 0.75, 0.0), "a": _row(1, 0.15, 300.0), "b": _row(2, 0.10, 200.0)})
+        store.append(460, {"burn": _row(0, 0.75, 0.0), "a": _row(1, 0.25, 300.0), "c": _row(3, 0.0, 0.0, False)})
+        with open(self.state, "w") as f:
+            json.dump({"burn": 0.0, "a": 300.0, "c": 100.0}, f)
+        with open(self.health, "w") as f:
+            json.dump({"window": 4, "uids": {
+                "1": {"hotkey": "a", "ok": "1111", "rtt": [0.1, 0.2, 0.2, 0.3]},
+                "3": {"hotkey": "c", "ok": "1100", "rtt": [0.4, 0.4, None, None]},
+            }}, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, *argv):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            code = merit_cli.main(list(argv) + ["--epochs", self.epochs, "--state", self.state,
+                                                "--health", self.health, "--json"])
+        return code, [json.loads(line) for line in out.getvalue().splitlines()]
+
+    def test_epochs_list_and_filters(self):
+        _, lines = self._run("epochs")
+        self.assertEqual([(line["block"], line["miners"], line["pinged"]) for line in lines], [(100, 3, 3), (460, 3, 2)])
+        _, rows = self._run("epochs", "--hotkey", "a", "--since", "200")
+        self.assertEqual([(row["block"], row["weight"]) for row in rows], [(460, 0.25)])
+        _, rows = self._run("epochs", "--ping", "fail")
+        self.assertEqual([(row["block"], row["hotkey"]) for row in rows], [(460, "c")])
+
+    def test_state_summary(self):
+        code, (summary,) = self._run("state", "--top", "1")
+        self.assertEqual(code, 0)
+        self.assertEqual(summary["state"]["scored"], 2)
+        self.assertEqual(summary["state"]["top"], [{"hotkey": "a", "bmps": 300.0}])
+        self.assertEqual(summary["health"]["tracked"], 2)
+        self.assertAlmostEqual(summary["health"]["mean_uptime"], 0.75)
+        self.assertEqual(summary["health"]["down"], [{"uid": 3, "hotkey": "c", "uptime": 0.5}])
+
+    def test_weights_from_state(self):
+        _, rows = self._run("weights")
+        expected = compute_normalized_weights([0, 1, 3], [0.0, 300.0, 100.0]).tolist()
+        by_uid = {row["uid"]: row for row in rows}
+        self.assertEqual(sorted(by_uid), [0, 1, 3])
+        for uid, weight in zip([0, 1, 3], expected):
+            self.assertAlmostEqual(by_uid[uid]["weight"], weight)
+        self.assertEqual(by_uid[1]["recorded"], 0.25)
+
+    def test_diff(self):
+        _, (result,) = self._run("diff")
+        self.assertEqual((result["from"], result["to"]), (100, 460))
+        self.assertEqual(result["joined"], [{"hotkey": "c", "uid": 3}])
+        self.assertEqual(result["left"], [{"hotkey": "b", "uid": 2}])
+        self.assertEqual([(e["hotkey"], e["weight_delta"]) for e in result["changed"]], [("a", 0.1)])
+
+    def test_does_not_import_bittensor(self):
+        script = (
+            "import sys\n"
+            "from merit.scripts import merit_cli\n"
+            f"for command in ('epochs', 'state', 'weights', 'diff'):\n"
+            f"    merit_cli.main([command, '--epochs', {self.epochs!r}, '--state', {self.state!r}])\n"
+            "assert 'bittensor' not in sys.modules, 'bittensor was imported'\n"
+        )
+        result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+import urllib.request
+
+from merit.utils.metrics import Registry, start_metrics_server
+
+
+class TestMetrics(unittest.TestCase):
+    def test_render_exposition_format(self):
+        registry = Registry()
+        calls = registry.counter("calls_total", "Calls.", ["call"])
+        latency = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        calls.inc(call="get_current_block")
+        calls.inc(2, call="get_current_block")
+        latency.observe(0.05)
+        latency.observe(0.5)
+        latency.observe(5.0)
+
+        text = registry.render()
+        self.assertIn('calls_total{call="get_current_block"} 3.0', text)
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{le="1.0"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("latency_seconds_count 3", text)
+        self.assertIn("# TYPE latency_seconds histogram", text)
+
+    def test_label_mismatch_raises(self):
+        gauge = Registry().gauge("rtt", "RTT.", ["hotkey"])
+        with self.assertRaises(ValueError):
+            gauge.set(1.0)
+
+    def test_http_endpoint(self):
+        registry = Registry()
+        registry.gauge("up", "Up.").set(1)
+        server = start_metrics_server(0, addr="127.0.0.1", registry=registry)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                self.assertIn("up 1", response.read().decode())
+        finally:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from types import SimpleNamespace
+
+from merit.neuron.miner_guard import MinerGuard, TokenBucketLimiter
+
+
+class TestTokenBucketLimiter(unittest.TestCase):
+    def test_burst_then_refill(self):
+        limiter = TokenBucketLimiter(rate=1.0, burst=3, max_callers=10)
+        self.assertEqual([limiter.allow("a", now=0.0) for _ in range(4)], [True, True, True, False])
+        self.assertTrue(limiter.allow("b", now=0.0))
+        self.assertFalse(limiter.allow("a", now=0.5))
+        self.assertTrue(limiter.allow("a", now=1.6))
+
+    def test_caller_table_is_bounded(self):
+        limiter = TokenBucketLimiter(rate=1.0, burst=2, max_callers=8)
+        for i in range(100):
+            limiter.allow(f"spoof{i}", now=float(i) / 100)
+        self.assertLessEqual(len(limiter), 8)
+
+
+class TestMinerGuard(unittest.TestCase):
+    def setUp(self):
+        metagraph = SimpleNamespace(
+            hotkeys=["validator", "miner", "other"],
+            validator_permit=[True, False, True],
+            S=[1000.0, 5.0, 10.0],
+        )
+        self.guard = MinerGuard(TokenBucketLimiter(rate=0.1, burst=2), lookup_ttl=4320,
+                                lookup_limiter=TokenBucketLimiter(rate=0.01, burst=2, max_callers=1))
+        self.guard.update(metagraph)
+
+    def test_rejects_callers_without_permit(self):
+        self.assertEqual(self.guard.check("miner", "1.2.3.4", now=0.0), (True, "caller has no validator permit"))
+        self.assertEqual(self.guard.check(None, "1.2.3.4", now=0.0)[0], True)
+        self.assertFalse(self.guard.check("validator", "1.2.3.4", now=0.0)[0])
+
+    def test_rate_limits_per_hotkey_and_ip(self):
+        for _ in range(2):
+            self.assertFalse(self.guard.check("validator", "6.6.6.6", now=0.0)[0])
+        self.assertEqual(self.guard.check("validator", "6.6.6.6", now=0.0), (True, "rate limited"))
+        # The same hotkey from the validator's real address keeps its own bucket.
+        self.assertFalse(self.guard.check("validator", "1.2.3.4", now=0.0)[0])
+
+    def test_permit_lookups_are_cached_and_rate_limited(self):
+        self.assertTrue(self.guard.request_lookup("miner", now=0.0))
+        # A negative answer holds for a tempo, so the same caller cannot re-trigger the lookup.
+        self.assertFalse(self.guard.request_lookup("miner", now=4000.0))
+        self.assertTrue(self.guard.request_lookup("spoof1", now=0.0))
+        # Distinct callers share one lookup budget.
+        self.assertFalse(self.guard.request_lookup("spoof2", now=0.0))
+        self.assertTrue(self.guard.request_lookup("spoof2", now=100.0))
+        self.assertTrue(self.guard.request_lookup("miner", now=4320.0))
+
+    def test_granted_hotkey_is_admitted(self):
+        self.guard.grant("newvalidator", 50.0)
+        self.assertFalse(self.guard.check("newvalidator", "1.2.3.4", now=0.0)[0])
+        self.assertEqual(self.guard.priority("newvalidator"), 50.0)
+
+    def test_priority_follows_stake(self):
+        self.assertGreater(self.guard.priority("validator"), self.guard.priority("other"))
+        self.assertEqual(self.guard.priority("miner"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from merit.benchmarks.fakes import FakeConfig, FakeSubtensor, FakeSwarm, make_wallet
+from merit.neuron.multi_validator import MultiValidator
+from merit.utils import metrics
+
+
+class TestMultiValidator(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_shared_round_pings_each_axon_once(self):
+        subtensor = FakeSubtensor(num_neurons=16, num_subnets=4, uids_per_subnet=16)
+        metagraph = subtensor.metagraph(subtensor.netuid)
+        swarm = FakeSwarm(metagraph, latency=0.0, failure_rate=0.0)
+
+        ok_before = metrics.PING_RESULTS.value(stage="ok")
+
+        async def scenario():
+            # The fake serves the same metagraph for every netuid, so every miner is on both subnets.
+            multi = MultiValidator(FakeConfig(ping_concurrency=8), [subtensor.netuid, 1],
+                                   wallet=make_wallet(metagraph.hotkeys[0]), subtensor=subtensor, dendrite=swarm)
+            multi.shared.ping_engine.probe = False
+            try:
+                await multi._ping_round()
+                for validator in multi.validators:
+                    validator._evaluate_miners()
+            finally:
+                await multi.cleanup()
+            return multi
+
+        multi = asyncio.run(scenario())
+        first, second = multi.validators
+        self.assertEqual(swarm.calls, 15)
+        self.assertEqual(metrics.PING_RESULTS.value(stage="ok") - ok_before, 15)
+        self.assertEqual(len(first.valid_miners), 15)
+        self.assertEqual(first.valid_miners, second.valid_miners)
+        self.assertIs(first.subnet_cache, second.subnet_cache)
+        self.assertNotIn(subtensor.netuid, first.incentive_index.netuids)
+        self.assertNotIn(1, second.incentive_index.netuids)
+        self.assertIn(1, first.incentive_index.netuids)
+        self.assertTrue(os.path.isfile(first.state_file))
+        self.assertNotEqual(first.state_file, second.state_file)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from merit.neuron import ping_engine
+from merit.neuron.ping_engine import PingEngine
+
+
+class FakeDendrite:
+    def __init__(self, latencies, token="123456"):
+        self._session = object()
+        self.latencies = latencies
+        self.token = token
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call(self, target_axon, synapse, timeout, deserialize):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latencies[synapse.hotkey])
+        finally:
+            self.in_flight -= 1
+        synapse.token = self.token
+        return synapse
+
+
+def _neuron(hotkey, ip="8.8.8.8", port=8091):
+    return SimpleNamespace(hotkey=hotkey, axon_info=SimpleNamespace(ip=ip, port=port))
+
+
+class TestPingEngine(unittest.TestCase):
+    def _collect(self, engine, neurons):
+        async def scenario():
+            return [result async for result in engine.stream(neurons)]
+        return asyncio.run(scenario())
+
+    def test_stream_bounds_concurrency_and_yields_in_completion_order(self):
+        latencies = {"slow": 0.05, "a": 0.0, "b": 0.0, "c": 0.0}
+        dendrite = FakeDendrite(latencies)
+        engine = PingEngine(dendrite, lambda hotkey, token: True, concurrency=2, probe=False)
+        results = self._collect(engine, [_neuron(h) for h in latencies])
+
+        self.assertEqual(dendrite.max_in_flight, 2)
+        self.assertEqual(results[-1].neuron.hotkey, "slow")
+        self.assertTrue(all(r.success for r in results))
+
+    def test_failure_stages(self):
+        dendrite = FakeDendrite({"bad_token": 0.0, "rejected": 0.0}, token="12ab56")
+        engine = PingEngine(dendrite, lambda hotkey, token: hotkey != "rejected", probe=False)
+        results = {r.neuron.hotkey: r for r in self._collect(engine, [
+            _neuron("bad_token"), _neuron("private", ip="10.0.0.1"), _neuron("no_port", port=0),
+        ])}
+        self.assertEqual(results["bad_token"].stage, ping_engine.TOKEN)
+        self.assertEqual(results["private"].stage, ping_engine.INVALID_AXON)
+        self.assertEqual(results["no_port"].stage, ping_engine.INVALID_AXON)
+
+        dendrite.token = "654321"
+        result = asyncio.run(engine.ping(_neuron("rejected")))
+        self.assertFalse(result.success)
+        self.assertEqual(result.stage, ping_engine.TOKEN)
+
+    def test_empty_stream(self):
+        engine = PingEngine(FakeDendrite({}), lambda hotkey, token: True)
+        self.assertEqual(self._collect(engine, []), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+
+from merit.neuron.ping_history import PingHistory
+
+
+class TestPingHistory(unittest.TestCase):
+    def test_rolling_uptime_over_window(self):
+        history = PingHistory(window=4)
+        self.assertIsNone(history.uptime(3, "a"))
+        for ok in (True, False, True, True):
+            history.record(3, "a", ok, 0.1)
+        self.assertEqual(history.uptime(3, "a"), 0.75)
+        history.record(3, "a", True, 0.1)  # evicts the oldest (True)
+        history.record(3, "a", True, 0.1)  # evicts the failure
+        self.assertEqual(history.uptime(3, "a"), 1.0)
+        self.assertEqual(history.samples(3, "a"), 4)
+
+    def test_latency_percentiles_ignore_failures(self):
+        history = PingHistory(window=8)
+        for rtt in (0.1, 0.2, 0.3, 0.4):
+            history.record(0, "a", True, rtt)
+        history.record(0, "a", False)
+        self.assertAlmostEqual(history.latency_percentile(0, "a", 50), 0.25, places=5)
+        self.assertAlmostEqual(history.latency_percentile(0, "a", 100), 0.4, places=5)
+
+    def test_new_hotkey_on_uid_resets_slot(self):
+        history = PingHistory(window=4)
+        history.record(1, "old", False)
+        history.record(1, "new", True)
+        self.assertIsNone(history.uptime(1, "old"))
+        self.assertEqual(history.uptime(1, "new"), 1.0)
+        self.assertEqual(len(history.hotkeys), 2)
+
+    def test_dict_roundtrip_preserves_order(self):
+        history = PingHistory(window=3)
+        for ok in (False, True, True, False):
+            history.record(0, "a", ok, 0.5)
+        restored = PingHistory.from_dict(history.to_dict(), window=3)
+        self.assertEqual(restored.to_dict(), history.to_dict())
+        restored.record(0, "a", True, 0.5)
+        history.record(0, "a", True, 0.5)
+        self.assertEqual(restored.uptime(0, "a"), history.uptime(0, "a"))
+
+
+if __name__ == "__main__":
+    unittest.main()
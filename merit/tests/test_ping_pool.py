@@ -0,0 +1,78 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from merit.benchmarks.fakes import FakeMetagraph, FakeNeuron, FakeSwarmFactory, make_hotkey, make_ip
+from merit.neuron.ping_engine import EXCEPTION
+from merit.neuron.ping_pool import ShardedPingEngine
+
+
+def _metagraph(num_neurons: int):
+    return FakeMetagraph(1, [FakeNeuron(uid, make_hotkey(1, uid), make_ip(uid), 8091) for uid in range(num_neurons)])
+
+
+class TestShardedPingEngine(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.marker = os.path.join(self.tmp.name, "crashed")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, engine, neurons, rounds: int = 1):
+        async def scenario():
+            collected = []
+            try:
+                for _ in range(rounds):
+                    collected.append([result async for result in engine.stream(neurons)])
+            finally:
+                engine.close()
+            return collected
+        return asyncio.run(scenario())
+
+    def test_shards_across_workers(self):
+        metagraph = _metagraph(40)
+        engine = ShardedPingEngine(FakeSwarmFactory(metagraph, latency=0.001, failure_rate=0.0), 2,
+                                   concurrency=8, probe=False)
+        rounds = self._run(engine, metagraph.neurons, rounds=2)
+        for results in rounds:
+            self.assertEqual(sorted(r.neuron.uid for r in results), list(range(40)))
+            self.assertTrue(all(r.success for r in results))
+        self.assertEqual(engine.restarts, 0)
+        self.assertEqual(engine.workers, [])
+
+    def test_crashed_worker_is_restarted_and_its_pings_resent(self):
+        metagraph = _metagraph(20)
+        factory = FakeSwarmFactory(metagraph, latency=0.001, failure_rate=0.0,
+                                   crash_hotkey=metagraph.hotkeys[3], crash_marker=self.marker)
+        engine = ShardedPingEngine(factory, 2, concurrency=4, probe=False)
+        (results,) = self._run(engine, metagraph.neurons)
+        self.assertEqual(engine.restarts, 1)
+        self.assertEqual(sorted(r.neuron.uid for r in results), list(range(20)))
+        self.assertTrue(all(r.success for r in results))
+
+    def test_hung_worker_is_terminated_and_its_pings_resent(self):
+        metagraph = _metagraph(20)
+        factory = FakeSwarmFactory(metagraph, latency=0.001, failure_rate=0.0, crash_hotkey=metagraph.hotkeys[3],
+                                   crash_marker=self.marker, crash_mode="hang")
+        engine = ShardedPingEngine(factory, 2, concurrency=4, probe=False, stall_timeout=1.0)
+        (results,) = self._run(engine, metagraph.neurons)
+        self.assertEqual(engine.restarts, 1)
+        self.assertEqual(sorted(r.neuron.uid for r in results), list(range(20)))
+        self.assertTrue(all(r.success for r in results))
+
+    def test_pings_fail_once_restart_budget_is_spent(self):
+        metagraph = _metagraph(20)
+        factory = FakeSwarmFactory(metagraph, latency=0.001, failure_rate=0.0,
+                                   crash_hotkey=metagraph.hotkeys[3], crash_marker=self.marker)
+        engine = ShardedPingEngine(factory, 2, concurrency=4, probe=False, max_restarts=0)
+        (results,) = self._run(engine, metagraph.neurons)
+        by_uid = {r.neuron.uid: r for r in results}
+        self.assertEqual(len(by_uid), 20)
+        self.assertEqual(by_uid[3].stage, EXCEPTION)
+        self.assertFalse(by_uid[3].success)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from types import SimpleNamespace
+
+from merit.neuron.ping_scheduler import PingScheduler
+
+
+def _neurons(*hotkeys):
+    return [SimpleNamespace(hotkey=hotkey) for hotkey in hotkeys]
+
+
+class TestPingScheduler(unittest.TestCase):
+    def test_interval_backs_off_for_stable_miners_and_resets_on_failure(self):
+        scheduler = PingScheduler(600, min_interval=120, max_interval=2400, stable_streak=3)
+        self.assertEqual(scheduler.interval("a"), 120)
+        intervals = []
+        for _ in range(12):
+            scheduler.record("a", True, now=0)
+            intervals.append(scheduler.interval("a"))
+        self.assertEqual(intervals, [120, 600, 1200, 1200, 1200, 2400, 2400, 2400, 2400, 2400, 2400, 2400])
+        scheduler.record("a", False, now=0)
+        self.assertEqual(scheduler.interval("a"), 120)
+
+    def test_failing_miner_backs_off_to_max_interval(self):
+        scheduler = PingScheduler(600, min_interval=120, max_interval=2400, stable_streak=3)
+        intervals = []
+        for _ in range(7):
+            scheduler.record("dead", False, now=0)
+            intervals.append(scheduler.interval("dead"))
+        self.assertEqual(intervals, [120, 240, 480, 960, 1920, 2400, 2400])
+        scheduler.record("dead", True, now=0)
+        self.assertEqual(scheduler.interval("dead"), 120)
+
+    def test_due_and_retain(self):
+        scheduler = PingScheduler(600, min_interval=120, stable_streak=1)
+        neurons = _neurons("new", "stable", "flaky")
+        for _ in range(4):
+            scheduler.record("stable", True, now=1000)
+        scheduler.record("flaky", False, now=1000)
+
+        self.assertEqual([n.hotkey for n in scheduler.due(neurons, now=1000)], ["new"])
+        self.assertEqual([n.hotkey for n in scheduler.due(neurons[1:], now=1200)], ["flaky"])
+        self.assertEqual(scheduler.next_due_in(neurons[1:], now=1000), 120 - 15)
+
+        scheduler.retain(["stable"])
+        self.assertEqual(len(scheduler), 1)
+
+    def test_non_adaptive_pings_everyone_every_base_interval(self):
+        scheduler = PingScheduler(600, adaptive=False)
+        scheduler.record("a", True, now=0)
+        scheduler.record("b", False, now=0)
+        self.assertEqual(scheduler.due(_neurons("a", "b"), now=580), [])
+        self.assertEqual(len(scheduler.due(_neurons("a", "b"), now=600)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
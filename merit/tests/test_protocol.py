@@ -1,14 +1,16 @@
 import unittest
-from merit.protocol.merit_protocol import PingRequest, PingResponse
+from merit.protocol.merit_protocol import PingSynapse
 
 class TestMeritProtocol(unittest.TestCase):
-    def test_ping_request_fields(self):
-        req = PingRequest(hotkey="test_hotkey")
+    def test_ping_synapse_request_fields(self):
+        req = PingSynapse(hotkey="test_hotkey")
         self.assertEqual(req.hotkey, "test_hotkey")
+        self.assertIsNone(req.token)
 
-    def test_ping_response_fields(self):
-        res = PingResponse(token="123456")
-        self.assertEqual(res.token, "123456")
+    def test_ping_synapse_response_fields(self):
+        res = PingSynapse(hotkey="test_hotkey")
+        res.token = "123456"
+        self.assertEqual(res.forward().token, "123456")
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,42 @@
+import asyncio
+import unittest
+
+from merit.neuron.registration_watcher import RegistrationWatcher
+
+
+class FakeChain:
+    def __init__(self, answers):
+        self.answers = list(answers)
+        self.calls = 0
+
+    async def get_uid_for_hotkey_on_subnet(self, hotkey, netuid):
+        self.calls += 1
+        answer = self.answers.pop(0)
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+class TestRegistrationWatcher(unittest.TestCase):
+    def test_backs_off_and_resets_on_uid_change(self):
+        chain = FakeChain([7, 7, RuntimeError("rpc down"), 7, 9])
+        watcher = RegistrationWatcher(chain, "hk", 73, uid=7, min_interval=10, max_interval=50)
+
+        intervals = []
+        for _ in range(5):
+            self.assertTrue(asyncio.run(watcher.poll()))
+            intervals.append(watcher.interval)
+        self.assertEqual(intervals, [20, 40, 50, 50, 10])
+        self.assertEqual(watcher.uid, 9)
+
+    def test_watch_reports_deregistration(self):
+        chain = FakeChain([3, None])
+        watcher = RegistrationWatcher(chain, "hk", 73, uid=3, min_interval=0, max_interval=0)
+        events = []
+        asyncio.run(asyncio.wait_for(watcher.watch(lambda: events.append("deregistered")), timeout=1))
+        self.assertEqual(events, ["deregistered"])
+        self.assertEqual(chain.calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from merit.neuron import replay
+from merit.neuron.ping_history import PingHistory
+from merit.neuron.weights import compute_normalized_weights, parse_s_curve
+from merit.storage.epoch_store import EpochStore
+from merit.storage.snapshot import save_snapshot
+
+
+def _recorded_summary(block):
+    uids = [0, 1, 2, 3, 4]
+    scores = [0.0, 0.0, 100.0 + block % 7, 250.0, 40.0 + block % 3]
+    weights = compute_normalized_weights(uids, scores).tolist()
+    return {
+        f"hk{uid}": {
+            "uid": uid,
+            "weight": round(weight, 6),
+            "bmps": round(score, 6),
+            "subnet_incentives": {},
+            "ping_success": score > 0,
+            "last_ping_timestamp": 0.0,
+            "timestamp": 0.0,
+        }
+        for uid, score, weight in zip(uids, scores, weights)
+    }
+
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_epoch_store_replay_reproduces_recorded_weights(self):
+        store = EpochStore(os.path.join(self.root, "epochs"))
+        for block in range(100, 130):
+            store.append(block, _recorded_summary(block))
+
+        epochs = list(replay.load_epochs([store.root], since_block=110))
+        self.assertEqual([epoch.block for epoch in epochs], list(range(110, 130)))
+
+        baseline = replay.Scenario()
+        flat = replay.Scenario(s_curve=(0.0, 0.0, 0.0, 0.0))
+        results = replay.replay(epochs, [baseline, flat], batch_size=8)
+
+        for epoch, row in zip(epochs, results[baseline.name]):
+            self.assertLess(row["max_diff"], 1e-5)
+            self.assertAlmostEqual(row["burn"], 0.75)
+            self.assertEqual(row["miners"], 3)
+            expected = compute_normalized_weights(epoch.uids, epoch.scores)
+            self.assertAlmostEqual(row["top_weight"], float(expected[1:].max()), places=9)
+        # A flat curve splits the miner share evenly, away from what was recorded.
+        for row in results[flat.name]:
+            self.assertAlmostEqual(row["top_weight"], 0.25 / 3)
+            self.assertGreater(row["max_diff"], 1e-3)
+
+    def test_snapshot_replay_scores_reachable_miners(self):
+        neurons = [
+            SimpleNamespace(uid=uid, hotkey=f"hk{uid}", axon_info=SimpleNamespace(ip=ip, port=8000),
+                            dividends=0.0, validator_trust=1.0 if uid == 1 else 0.0)
+            for uid, ip in [(1, "8.8.8.8"), (2, "8.8.8.8"), (3, "8.8.4.4"), (4, "10.0.0.1")]
+        ]
+        metagraph = SimpleNamespace(netuid=73, neurons=neurons, hparams=SimpleNamespace(weights_version=1))
+        infos = [
+            SimpleNamespace(netuid=5, last_step=720, hotkeys=["hk2", "hk3", "hk4"], incentives=[0.2, 0.4, 0.9]),
+            SimpleNamespace(netuid=6, last_step=730, hotkeys=["hk2"], incentives=[0.6]),
+            SimpleNamespace(netuid=73, last_step=700, hotkeys=["hk3"], incentives=[1.0]),
+        ]
+        path = os.path.join(self.root, "snapshot.json.gz")
+        save_snapshot(path, metagraph, infos, {"hk2": True, "hk3": False, "hk4": True}, {})
+
+        (epoch,) = replay.load_epochs([path])
+        self.assertEqual(epoch.block, 730)
+        self.assertEqual(epoch.uids, (0, 2, 3, 4))
+        np.testing.assert_allclose(epoch.scores, [0.0, (0.2 + 0.6) / 2 * 100000, 0.0, 0.0])
+
+        # Like the validator: rolling uptime keeps hk3 scored despite its failed latest ping, and saved
+        # incentive EMAs replace the raw incentives.
+        history = PingHistory(window=10)
+        for ok in (True, True, True, True, False):
+            history.record(3, "hk3", ok)
+        series = {"subnets": [[5, 720, ["hk2", "hk3", "hk4"], [0.1, 0.3, 0.9]], [6, 730, ["hk2"], [0.5]]]}
+        save_snapshot(path, metagraph, infos, {"hk2": True, "hk3": False, "hk4": True}, {}, series)
+        (epoch,) = replay.load_epochs([path], ping_history=history)
+        np.testing.assert_allclose(epoch.scores, [0.0, (0.1 + 0.5) / 2 * 100000, 0.3 / 2 * 100000, 0.0])
+
+    def test_parse_s_curve(self):
+        self.assertEqual(parse_s_curve("1,2,3,4"), (1.0, 2.0, 3.0, 4.0))
+        with self.assertRaises(ValueError):
+            parse_s_curve("1,2")
+
+
+if __name__ == "__main__":
+    unittest.main()
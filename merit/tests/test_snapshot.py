@@ -0,0 +1,56 @@
+import os
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from merit.storage.snapshot import load_snapshot, save_snapshot
+from merit.utils.fileio import netuid_path
+
+
+def _metagraph():
+    neurons = [
+        SimpleNamespace(uid=uid, hotkey=f"hk{uid}", axon_info=SimpleNamespace(ip="8.8.8.8", port=8000 + uid),
+                        dividends=0.0, validator_trust=1.0 if uid == 0 else 0.0)
+        for uid in range(3)
+    ]
+    return SimpleNamespace(netuid=73, neurons=neurons, hparams=SimpleNamespace(weights_version=4))
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snapshot.json.gz")
+            infos = [SimpleNamespace(netuid=5, last_step=720, hotkeys=["hk1"], incentives=[0.25])]
+            series = {"subnets": [[5, 720, ["hk1"], [0.2]]]}
+            save_snapshot(path, _metagraph(), infos, {"hk1": True, "hk2": False}, {"hk1": 123.0}, series)
+
+            snapshot = load_snapshot(path, max_age=60)
+            self.assertEqual(snapshot.metagraph.hotkeys, ["hk0", "hk1", "hk2"])
+            self.assertEqual(snapshot.metagraph.neurons[2].axon_info.port, 8002)
+            self.assertEqual(snapshot.metagraph.hparams.weights_version, 4)
+            self.assertEqual(snapshot.infos[0].incentives, [0.25])
+            self.assertEqual(snapshot.infos[0].last_step, 720)
+            self.assertEqual(snapshot.ping_success, {"hk1": True, "hk2": False})
+            self.assertEqual(snapshot.incentive_series, series)
+
+    def test_missing_corrupt_or_stale(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "snapshot.json.gz")
+            self.assertIsNone(load_snapshot(path))
+            with open(path, "wb") as f:
+                f.write(b"not gzip")
+            self.assertIsNone(load_snapshot(path))
+            save_snapshot(path, _metagraph(), [], {}, {})
+            self.assertIsNone(load_snapshot(path, max_age=-1))
+
+    def test_other_netuid_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, netuid_path("snapshot.json.gz", 73))
+            self.assertEqual(os.path.basename(path), "snapshot_73.json.gz")
+            save_snapshot(path, _metagraph(), [], {}, {})
+            self.assertIsNone(load_snapshot(path, max_age=60, netuid=5))
+            self.assertEqual(load_snapshot(path, max_age=60, netuid=73).metagraph.netuid, 73)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import asyncio
+import json
+import unittest
+from types import SimpleNamespace
+
+from merit.neuron.subnet_analytics import SubnetAnalytics, difficulty_class
+from merit.neuron.subnet_cache import SubnetInfoCache
+
+
+def _info(netuid, last_step, hotkeys, incentives, burn=None, registration_allowed=None):
+    return SimpleNamespace(netuid=netuid, last_step=last_step, hotkeys=hotkeys, incentives=incentives,
+                           burn=burn, difficulty=10_000_000, registration_allowed=registration_allowed)
+
+
+class FakeChain:
+    def __init__(self, infos):
+        self.infos = {info.netuid: info for info in infos}
+
+    async def get_all_metagraphs_info(self):
+        return list(self.infos.values())
+
+    async def all_subnets(self):
+        return [SimpleNamespace(netuid=n, last_step=i.last_step) for n, i in self.infos.items()]
+
+    async def get_metagraph_info(self, netuid):
+        return self.infos[netuid]
+
+
+class TestSubnetAnalytics(unittest.TestCase):
+    def test_tracks_registrations_churn_and_mass_from_diffs(self):
+        chain = FakeChain([
+            _info(1, 100, ["a", "b", "c", "d"], [0.25] * 4, burn=0.05),
+            _info(2, 100, ["e", "f"], [0.5, 0.5], burn=2.0),
+            _info(3, 100, ["g"], [1.0], registration_allowed=False),
+        ])
+        cache = SubnetInfoCache(chain, full_refresh_interval=3600, full_refresh_ratio=0.9)
+        analytics = cache.analytics
+        asyncio.run(cache.refresh())
+        self.assertEqual(analytics.total_registrations, 0)  # first sighting is the baseline
+        self.assertEqual(analytics.classes, {"low": {1}, "high": {2}, "closed": {3}})
+        self.assertAlmostEqual(analytics.total_incentive_mass, 3.0)
+
+        chain.infos[1] = _info(1, 460, ["a", "b", "x", "y"], [0.1, 0.1, 0.1, 0.1], burn=0.5)
+        asyncio.run(cache.refresh())
+
+        stats = analytics.get(1)
+        self.assertEqual((stats.registrations, stats.deregistrations), (2, 2))
+        self.assertAlmostEqual(stats.churn_rate, 0.5)
+        self.assertAlmostEqual(analytics.total_incentive_mass, 2.4, places=5)
+        self.assertEqual(analytics.classes["medium"], {1})
+        self.assertEqual(analytics.classes["low"], set())
+        self.assertEqual(analytics.ranking(limit=1), [1])
+        self.assertEqual(analytics.ranking("incentive_mass"), [2, 3, 1])
+
+        del chain.infos[2]
+        asyncio.run(cache.refresh())
+        self.assertIsNone(analytics.get(2))
+        self.assertAlmostEqual(analytics.total_incentive_mass, 1.4, places=5)
+        self.assertEqual(json.loads(analytics.render()[0])["classes"], {"closed": [3], "medium": [1]})
+
+    def test_window_counts_expire(self):
+        analytics = SubnetAnalytics(window=100)
+        infos = {5: _info(5, 1, ["a", "b"], [0.5, 0.5])}
+        diff = SimpleNamespace(refreshed=[5], added={}, removed={})
+        analytics.update(diff, infos, now=0)
+        infos[5] = _info(5, 2, ["a", "c"], [0.5, 0.5])
+        analytics.update(SimpleNamespace(refreshed=[5], added={5: {"c"}}, removed={5: {"b"}}), infos, now=10)
+        self.assertEqual(analytics.get(5).window_registrations, 1)
+
+        analytics.update(SimpleNamespace(refreshed=[], added={}, removed={}), infos, now=111)
+        stats = analytics.get(5)
+        self.assertEqual((stats.window_registrations, stats.window_deregistrations), (0, 0))
+        self.assertEqual(stats.registrations, 1)
+
+    def test_difficulty_class_without_registration_info(self):
+        self.assertEqual(difficulty_class(SimpleNamespace()), "unknown")
+        self.assertEqual(difficulty_class(SimpleNamespace(burn=100.0, registration_allowed=True)), "high")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from merit.neuron.subnet_cache import SubnetInfoCache
+
+
+def _info(netuid, last_step, hotkeys, incentives):
+    return SimpleNamespace(netuid=netuid, last_step=last_step, hotkeys=hotkeys, incentives=incentives)
+
+
+class FakeChain:
+    def __init__(self, infos):
+        self.infos = {info.netuid: info for info in infos}
+        self.full_fetches = 0
+        self.subnet_fetches = []
+        self.failing = set()
+
+    async def get_all_metagraphs_info(self):
+        self.full_fetches += 1
+        return list(self.infos.values())
+
+    async def all_subnets(self):
+        return [SimpleNamespace(netuid=n, last_step=i.last_step) for n, i in self.infos.items()]
+
+    async def get_metagraph_info(self, netuid):
+        self.subnet_fetches.append(netuid)
+        if netuid in self.failing:
+            raise TimeoutError(f"get_metagraph_info({netuid}) timed out")
+        return self.infos[netuid]
+
+
+class TestSubnetInfoCache(unittest.TestCase):
+    def test_refetches_only_stepped_subnets_and_reports_diff(self):
+        chain = FakeChain([_info(n, 100, [f"h{n}", "shared"], [0.1, 0.2]) for n in range(1, 9)])
+        cache = SubnetInfoCache(chain, full_refresh_interval=3600, full_refresh_ratio=0.5)
+        self.assertTrue(asyncio.run(cache.refresh()).full)
+
+        chain.infos[3] = _info(3, 460, ["h3", "new"], [0.4, 0.0])
+        del chain.infos[8]
+        diff = asyncio.run(cache.refresh())
+
+        self.assertFalse(diff.full)
+        self.assertEqual(chain.full_fetches, 1)
+        self.assertEqual(chain.subnet_fetches, [3])
+        self.assertEqual(diff.added, {3: {"new"}})
+        self.assertEqual(diff.removed, {3: {"shared"}, 8: {"h8", "shared"}})
+        self.assertEqual(diff.changed, {3: {"h3"}})
+        self.assertEqual(diff.affected_hotkeys(skip_netuids=(8,)), {"new", "shared", "h3"})
+        self.assertEqual([info.netuid for info in cache.snapshot()], list(range(1, 8)))
+
+    def test_failed_fetch_applies_nothing(self):
+        chain = FakeChain([_info(n, 100, [f"h{n}"], [0.25]) for n in range(1, 9)])
+        cache = SubnetInfoCache(chain, full_refresh_interval=3600, full_refresh_ratio=0.5)
+        asyncio.run(cache.refresh())
+        chain.infos[2] = _info(2, 460, ["h2"], [0.5])
+        chain.infos[3] = _info(3, 460, ["h3"], [0.6])
+        chain.failing = {3}
+        with self.assertRaises(TimeoutError):
+            asyncio.run(cache.refresh())
+        self.assertEqual(list(cache.infos[2].incentives), [0.25])
+        self.assertEqual(cache.last_steps[2], 100)
+
+        chain.failing = set()
+        diff = asyncio.run(cache.refresh())
+        self.assertEqual(sorted(diff.refreshed), [2, 3])
+        self.assertEqual(diff.changed, {2: {"h2"}, 3: {"h3"}})
+
+    def test_falls_back_to_full_fetch_when_most_subnets_stepped(self):
+        chain = FakeChain([_info(n, 100, [f"h{n}"], [0.1]) for n in range(1, 5)])
+        cache = SubnetInfoCache(chain, full_refresh_interval=3600, full_refresh_ratio=0.5)
+        asyncio.run(cache.refresh())
+        for netuid in (1, 2):
+            chain.infos[netuid] = _info(netuid, 460, [f"h{netuid}"], [0.3])
+        self.assertTrue(asyncio.run(cache.refresh()).full)
+        self.assertEqual(chain.full_fetches, 2)
+
+    def test_stores_compact_infos_with_interned_hotkeys(self):
+        chain = FakeChain([_info(n, 100, ["".join(["sha", "red"]), f"h{n}"], [0.25, 0.5]) for n in (1, 2)])
+        cache = SubnetInfoCache(chain)
+        asyncio.run(cache.refresh())
+        first, second = cache.snapshot()
+        self.assertEqual(first.incentives.typecode, "f")
+        self.assertEqual(list(first.incentives), [0.25, 0.5])
+        self.assertIs(first.hotkeys[0], second.hotkeys[0])
+        self.assertFalse(hasattr(first, "__dict__"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import random
+import unittest
+
+import pyotp
+
+from merit.utils.totp import TotpCache, derive_secret
+
+
+class TestTotpCache(unittest.TestCase):
+    def test_matches_pyotp(self):
+        rng = random.Random(7)
+        cache = TotpCache()
+        for i in range(50):
+            hotkey = f"5Hotkey{i}"
+            totp = pyotp.TOTP(derive_secret(hotkey))
+            now = rng.randint(1_700_000_000, 1_800_000_000)
+            self.assertEqual(cache.token(hotkey, now), totp.at(now))
+            for delta in (-61, -31, -30, 0, 29, 30, 31, 61):
+                token = totp.at(now + delta)
+                self.assertEqual(cache.verify(hotkey, token, now), totp.verify(token, for_time=now, valid_window=1))
+
+    def test_retain_evicts_unlisted_hotkeys(self):
+        cache = TotpCache()
+        for hotkey in ("a", "b", "c"):
+            cache.verify(hotkey, "000000")
+        cache.retain(["b"])
+        self.assertEqual(len(cache), 1)
+        self.assertIn("b", cache._windows)
+
+
+if __name__ == "__main__":
+    unittest.main()
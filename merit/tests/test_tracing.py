@@ -0,0 +1,97 @@
+import asyncio
+import json
+import os
+import signal
+import tempfile
+import time
+import unittest
+
+from merit.utils.tracing import SamplingProfiler, Tracer, TRACER, install_signal_handlers, traced
+
+
+@traced("outer")
+async def _outer():
+    await asyncio.sleep(0)
+    _inner()
+
+
+@traced("inner")
+def _inner():
+    return 1
+
+
+class TestTracing(unittest.TestCase):
+    def tearDown(self):
+        TRACER.disable()
+        TRACER.clear()
+
+    def test_disabled_tracer_records_nothing(self):
+        asyncio.run(_outer())
+        self.assertEqual(TRACER.spans(), [])
+
+    def test_spans_nest_and_export_as_chrome_trace(self):
+        TRACER.enable()
+        asyncio.run(_outer())
+        with TRACER.span("manual", block=7):
+            pass
+        self.assertEqual([name for name, _, _ in TRACER.spans()], ["inner", "outer", "manual"])
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+            self.assertEqual(TRACER.export_chrome_trace(path), 3)
+            with open(path) as f:
+                events = json.load(f)["traceEvents"]
+        complete = {event["name"]: event for event in events if event["ph"] == "X"}
+        inner, outer = complete["inner"], complete["outer"]
+        self.assertGreaterEqual(inner["ts"], outer["ts"])
+        self.assertLessEqual(inner["ts"] + inner["dur"], outer["ts"] + outer["dur"])
+        self.assertEqual(complete["manual"]["args"], {"block": 7})
+        self.assertTrue(any(event["ph"] == "M" for event in events))
+
+    def test_buffer_is_bounded(self):
+        tracer = Tracer(max_spans=4)
+        tracer.enable()
+        for i in range(10):
+            with tracer.span(f"s{i}"):
+                pass
+        self.assertEqual([name for name, _, _ in tracer.spans()], ["s6", "s7", "s8", "s9"])
+
+    @unittest.skipUnless(hasattr(signal, "SIGUSR2"), "needs SIGUSR2")
+    def test_signal_toggles_tracing_on_the_loop(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trace.json")
+
+            async def scenario():
+                loop = asyncio.get_running_loop()
+                install_signal_handlers(trace_path=path, profile_path=os.path.join(tmp, "profile.folded"))
+                try:
+                    os.kill(os.getpid(), signal.SIGUSR2)
+                    await asyncio.sleep(0.05)
+                    self.assertTrue(TRACER.enabled)
+                    await _outer()
+                    os.kill(os.getpid(), signal.SIGUSR2)
+                    await asyncio.sleep(0.05)
+                    self.assertFalse(TRACER.enabled)
+                finally:
+                    loop.remove_signal_handler(signal.SIGUSR1)
+                    loop.remove_signal_handler(signal.SIGUSR2)
+
+            asyncio.run(scenario())
+            with open(path) as f:
+                self.assertIn("outer", {event["name"] for event in json.load(f)["traceEvents"]})
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    def test_collects_folded_stacks(self):
+        profiler = SamplingProfiler(interval=0.001)
+        profiler.start()
+        deadline = time.time() + 0.2
+        while time.time() < deadline:
+            sum(range(1000))
+        profiler.stop()
+        self.assertGreater(profiler.samples, 0)
+        self.assertIn("test_collects_folded_stacks", profiler.folded())
+
+
+if __name__ == "__main__":
+    unittest.main()
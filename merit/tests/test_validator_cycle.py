@@ -0,0 +1,89 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from merit.benchmarks.bench_validator_cycle import build_validator, run_cycle
+from merit.benchmarks.fakes import FakeMetagraph
+from merit.utils import metrics
+
+
+class TestValidatorCycle(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_full_cycle_against_fakes(self):
+        async def scenario():
+            validator, subtensor = build_validator(32, 8, latency=0.0, failure_rate=0.0, concurrency=8,
+                                                   uids_per_subnet=32)
+            try:
+                await run_cycle(validator, subtensor)
+            finally:
+                await validator.cleanup()
+            return validator, subtensor
+
+        validator, subtensor = asyncio.run(scenario())
+        self.assertEqual(len(validator.valid_miners), 31)
+        self.assertEqual(len(subtensor.weights_set), 1)
+        weights = subtensor.weights_set[0]["weights"]
+        self.assertAlmostEqual(sum(weights), 1.0, places=6)
+        self.assertEqual(len(validator.epoch_store.blocks()), 1)
+
+    def test_incremental_evaluation_matches_full(self):
+        async def scenario():
+            validator, subtensor = build_validator(32, 8, latency=0.0, failure_rate=0.0, concurrency=8,
+                                                   uids_per_subnet=32)
+            try:
+                await validator._ping_round()
+                self.assertEqual(validator._evaluate_miners(), 31)
+                self.assertEqual(validator._evaluate_miners(), 0)
+
+                stepped = next(n for n in subtensor.infos if n != subtensor.netuid)
+                subtensor.step(netuids=[stepped])
+                await validator._refresh_all_metagraphs_info()
+                failing = validator.metagraph.hotkeys[5]
+                validator.dendrite.set_behaviour(failing, failure="no_token")
+                await validator._ping_pass([validator.metagraph.neurons[5]])
+
+                rescored = validator._evaluate_miners()
+                incremental = dict(validator.state)
+                validator.full_eval_pending = True
+                validator._evaluate_miners()
+            finally:
+                await validator.cleanup()
+            return rescored, incremental, validator.state, failing
+
+        rescored, incremental, full, failing = asyncio.run(scenario())
+        self.assertEqual(incremental, full)
+        self.assertEqual(incremental[failing], 0.0)
+        self.assertLess(rescored, 31)
+        self.assertGreaterEqual(rescored, 1)
+
+    def test_chain_refresh_drops_rtt_gauges_of_departed_miners_only(self):
+        async def scenario():
+            validator, subtensor = build_validator(16, 4, latency=0.0, failure_rate=0.0, concurrency=8,
+                                                   uids_per_subnet=16)
+            try:
+                await validator._ping_round()
+                departed, kept = validator.metagraph.hotkeys[3], validator.metagraph.hotkeys[4]
+                neurons = [n for n in subtensor._metagraph.neurons if n.hotkey != departed]
+                subtensor._metagraph = FakeMetagraph(subtensor.netuid, neurons)
+                validator.last_chain_refresh = 0
+                await validator._ping_round()
+            finally:
+                await validator.cleanup()
+            return departed, kept
+
+        departed, kept = asyncio.run(scenario())
+        self.assertIsNone(metrics.MINER_PING_RTT.value(hotkey=departed))
+        self.assertIsNotNone(metrics.MINER_PING_RTT.value(hotkey=kept))
+
+
+if __name__ == "__main__":
+    unittest.main()
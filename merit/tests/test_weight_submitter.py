@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+
+from merit.benchmarks.fakes import FakeSubtensor, make_wallet
+from merit.neuron.weight_submitter import EXPIRED, INCLUDED, WeightSubmitter
+from merit.utils.chain import ChainClient
+
+
+class TestWeightSubmitter(unittest.TestCase):
+    def _run(self, subtensor, **kwargs):
+        async def scenario():
+            chain = ChainClient(subtensor)
+            submitter = WeightSubmitter(chain, make_wallet("5Validator"), subtensor.netuid, **kwargs)
+            included = []
+            try:
+                submission = submitter.submit(0, [0, 1], [0.75, 0.25], 1, on_included=included.append)
+                self.assertTrue(submitter.pending)
+                await submitter.wait()
+            finally:
+                chain.close()
+            return submission, included
+
+        return asyncio.run(scenario())
+
+    def test_retries_until_included(self):
+        subtensor = FakeSubtensor(num_neurons=4, num_subnets=1, uids_per_subnet=4)
+        subtensor.set_weights_failures = 2
+        start_block = subtensor.block
+        submission, included = self._run(subtensor, retry_delay=0.01, block_time=0.01)
+        self.assertEqual(submission.status, INCLUDED)
+        self.assertEqual(submission.attempts, 3)
+        self.assertEqual(submission.included_block, start_block + 1)
+        self.assertIsNotNone(submission.latency)
+        self.assertEqual(included, [submission])
+        self.assertEqual(subtensor.weights_set[0]["wait_for_inclusion"], False)
+
+    def test_included_block_ignores_blocks_landing_mid_check(self):
+        subtensor = FakeSubtensor(num_neurons=4, num_subnets=1, uids_per_subnet=4)
+        blocks_since_last_update = subtensor.blocks_since_last_update
+
+        def block_lands_first(netuid, uid):
+            subtensor.block += 1
+            return blocks_since_last_update(netuid, uid)
+
+        subtensor.blocks_since_last_update = block_lands_first
+        submission, _ = self._run(subtensor, retry_delay=0.01, block_time=0.01)
+        self.assertEqual(submission.status, INCLUDED)
+        self.assertEqual(submission.included_block, subtensor.last_update)
+
+    def test_gives_up_at_deadline(self):
+        subtensor = FakeSubtensor(num_neurons=4, num_subnets=1, uids_per_subnet=4)
+        subtensor.set_weights_failures = 100
+        submission, included = self._run(subtensor, retry_delay=0.01, block_time=0.01, deadline_blocks=5)
+        self.assertEqual(submission.status, EXPIRED)
+        self.assertGreater(submission.attempts, 1)
+        self.assertEqual(included, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import random
+import unittest
+
+import numpy as np
+
+from merit.neuron.validator import Validator
+from merit.neuron.weights import batch_normalized_weights, compute_normalized_weights
+
+
+def _reference(uids, scores, burner_uid=0, burner_weight=0.75):
+    validator = Validator.__new__(Validator)
+    return validator._calculate_normalized_weights(uids, scores, burner_uid=burner_uid, burner_weight=burner_weight)
+
+
+def _random_case(rng):
+    n = rng.randint(1, 400)
+    uids = list(range(n))
+    rng.shuffle(uids)
+    if rng.random() < 0.3 and 0 in uids:
+        uids.remove(0)
+    pool = [0.0, 0.0, 1.5, 3.0] + [rng.uniform(0, 5000) for _ in range(8)]
+    scores = [rng.choice(pool) if rng.random() < 0.5 else rng.uniform(0, 5000) for _ in uids]
+    return uids, scores
+
+
+class TestVectorizedWeights(unittest.TestCase):
+    def test_matches_reference_on_random_vectors(self):
+        rng = random.Random(1234)
+        for _ in range(200):
+            uids, scores = _random_case(rng)
+            burner_weight = rng.choice([0.0, 0.5, 0.75, 1.0])
+            expected = _reference(uids, scores, burner_weight=burner_weight)
+            actual = compute_normalized_weights(uids, scores, burner_weight=burner_weight)
+            np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=1e-12)
+
+    def test_no_valid_miners_gives_burner_only(self):
+        weights = compute_normalized_weights([0, 1, 2], [5.0, 0.0, 0.0])
+        self.assertEqual(weights.tolist(), [0.75, 0.0, 0.0])
+
+    def test_batch_matches_single_vector_path(self):
+        rng = np.random.default_rng(5)
+        uids = list(range(300))
+        matrix = rng.uniform(0, 1000, size=(64, len(uids)))
+        matrix[matrix < 400] = 0.0
+        matrix[3] = 0.0
+        matrix[7, :5] = 42.0
+        batch = batch_normalized_weights(uids, matrix)
+        for row, scores in zip(batch, matrix):
+            np.testing.assert_allclose(row, compute_normalized_weights(uids, scores), rtol=1e-9, atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
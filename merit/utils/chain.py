@@ -0,0 +1,160 @@
+import bittensor as bt
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from merit.config import merit_config
+from merit.utils import metrics
+
+
+class CallStats:
+    """
+    Running latency figures for a single chain call name.
+    """
+    __slots__ = ("calls", "errors", "timeouts", "total", "max", "last")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def record(self, elapsed: float):
+        self.calls += 1
+        self.total += elapsed
+        self.last = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "mean": self.mean,
+            "max": self.max,
+            "last": self.last,
+        }
+
+
+class ChainClient:
+    """
+    Runs blocking subtensor calls on a dedicated worker thread so the event loop keeps serving pings.
+    The substrate websocket is not thread-safe, so calls are serialised on a single worker. Every call
+    gets a deadline; a call still queued when its deadline passes or its caller is cancelled is dropped.
+    """
+
+    def __init__(self, subtensor, default_timeout: float = merit_config.CHAIN_CALL_TIMEOUT):
+        self.subtensor = subtensor
+        self.default_timeout = default_timeout
+        self.stats = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="merit-chain")
+
+    async def call(self, name: str, fn, *args, timeout: float = None, **kwargs):
+        """
+        Runs `fn(*args, **kwargs)` on the chain worker and awaits it with a deadline.
+        Raises asyncio.TimeoutError if the deadline passes.
+        """
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = CallStats()
+
+        start = time.perf_counter()
+        future = self._executor.submit(fn, *args, **kwargs)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), timeout or self.default_timeout)
+        except asyncio.TimeoutError:
+            stats.timeouts += 1
+            metrics.CHAIN_CALL_FAILURES.inc(call=name, kind="timeout")
+            bt.logging.warning(f"Chain call {name} exceeded its {timeout or self.default_timeout}s deadline.")
+            raise
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception:
+            stats.errors += 1
+            metrics.CHAIN_CALL_FAILURES.inc(call=name, kind="error")
+            raise
+        elapsed = time.perf_counter() - start
+        stats.record(elapsed)
+        metrics.CHAIN_CALL_DURATION.observe(elapsed, call=name)
+        return result
+
+    async def get_current_block(self) -> int:
+        return await self.call("get_current_block", self.subtensor.get_current_block)
+
+    async def blocks_since_last_update(self, netuid: int, uid: int):
+        return await self.call(
+            "blocks_since_last_update", self.subtensor.blocks_since_last_update, netuid=netuid, uid=uid
+        )
+
+    async def last_update(self, netuid: int, uid: int):
+        """
+        Block at which `uid` last set weights, read in one query (None if the subnet does not exist).
+        """
+        def read():
+            last_updates = self.subtensor.get_hyperparameter(param_name="LastUpdate", netuid=netuid)
+            return None if not last_updates else int(last_updates[uid])
+
+        return await self.call("last_update", read)
+
+    async def metagraph(self, netuid: int):
+        """
+        Downloads a fresh metagraph; callers swap it in whole instead of mutating the live one off-loop.
+        """
+        return await self.call(
+            "metagraph", self.subtensor.metagraph, netuid=netuid, timeout=merit_config.CHAIN_SYNC_TIMEOUT
+        )
+
+    async def get_all_metagraphs_info(self):
+        return await self.call(
+            "get_all_metagraphs_info", self.subtensor.get_all_metagraphs_info,
+            timeout=merit_config.CHAIN_SYNC_TIMEOUT
+        )
+
+    async def all_subnets(self):
+        return await self.call("all_subnets", self.subtensor.all_subnets)
+
+    async def get_metagraph_info(self, netuid: int):
+        return await self.call(
+            "get_metagraph_info", self.subtensor.get_metagraph_info, netuid=netuid,
+            timeout=merit_config.CHAIN_SYNC_TIMEOUT
+        )
+
+    async def get_uid_for_hotkey_on_subnet(self, hotkey: str, netuid: int):
+        return await self.call(
+            "get_uid_for_hotkey_on_subnet", self.subtensor.get_uid_for_hotkey_on_subnet, hotkey, netuid
+        )
+
+    async def neuron_for_hotkey(self, hotkey: str, netuid: int):
+        """
+        Looks up a single neuron (UID, validator permit, stake) without a metagraph download.
+        Returns None if the hotkey is not registered on the subnet.
+        """
+        neuron = await self.call(
+            "get_neuron_for_pubkey_and_subnet", self.subtensor.get_neuron_for_pubkey_and_subnet, hotkey, netuid
+        )
+        return None if neuron is None or neuron.is_null else neuron
+
+    async def set_weights(self, **kwargs):
+        return await self.call(
+            "set_weights", self.subtensor.set_weights, timeout=merit_config.CHAIN_SET_WEIGHTS_TIMEOUT, **kwargs
+        )
+
+    def latency_stats(self) -> dict:
+        return {name: stats.as_dict() for name, stats in self.stats.items()}
+
+    def format_stats(self) -> str:
+        return ", ".join(
+            f"{name}: n={s.calls} mean={s.mean:.2f}s max={s.max:.2f}s timeouts={s.timeouts} errors={s.errors}"
+            for name, s in self.stats.items()
+        )
+
+    def close(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,118 @@
+"""
+Optional read-only HTTP API over the validator's epoch history (see merit.storage.history_index), for
+the Merit Dashboard. Served from a daemon thread on a stdlib HTTP server, like the metrics endpoint.
+
+    GET /api/netuids                          netuids served by this process
+    GET /api/subnets                          cross-subnet registration / churn / incentive analytics
+    GET /api/<netuid>/summary                 epoch / hotkey counts and the latest epoch's aggregates
+    GET /api/<netuid>/epochs[?since=<block>]  per-epoch aggregates, oldest first
+    GET /api/<netuid>/epochs/<block>          one epoch with every miner's row
+    GET /api/<netuid>/hotkeys                 per-hotkey uptime and latest weight / BMPs
+    GET /api/<netuid>/hotkeys/<hotkey>        one hotkey's cross-subnet participation and history series
+
+Responses carry an ETag and Last-Modified; a matching If-None-Match or a current If-Modified-Since
+gets a 304 with no body. Last-Modified has 1s resolution, so it is left out while the data changed
+within the current second, and such responses can only be revalidated by ETag.
+"""
+import json
+import threading
+import time
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+class _DashboardHandler(BaseHTTPRequestHandler):
+    indexes = {}        # netuid -> HistoryIndex
+    analytics = None    # SubnetAnalytics
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+        if parts[:1] != ["api"]:
+            self.send_error(404)
+            return
+        if parts == ["api", "netuids"]:
+            body = json.dumps(sorted(self.indexes)).encode("utf-8")
+            self._send(200, body, {"Content-Type": "application/json"})
+            return
+        if parts == ["api", "subnets"] and self.analytics is not None:
+            source, query = self.analytics, ()
+        else:
+            try:
+                source = self.indexes[int(parts[1])]
+                query = self._query(parts[2:], parse_qs(url.query))
+            except (IndexError, KeyError, ValueError):
+                self.send_error(404)
+                return
+
+        # Read before rendering: an update landing in between leaves Last-Modified older than the body, never newer.
+        # A change in the current second could be followed by another within it that If-Modified-Since
+        # cannot tell apart, so Last-Modified is only given once that second is over.
+        last_modified = int(source.last_modified)
+        if last_modified >= int(time.time()):
+            last_modified = None
+        rendered = source.render(*query)
+        if rendered is None:
+            self.send_error(404)
+            return
+        body, etag = rendered
+        headers = {"Content-Type": "application/json", "ETag": etag, "Cache-Control": "no-cache"}
+        if last_modified is not None:
+            headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+        if self._not_modified(etag, last_modified):
+            self._send(304, b"", headers)
+        else:
+            self._send(200, body, headers)
+
+    @staticmethod
+    def _query(parts, params) -> tuple:
+        if parts == ["summary"]:
+            return "summary", None
+        if parts == ["epochs"]:
+            since = params.get("since")
+            return "epochs", int(since[0]) if since else None
+        if len(parts) == 2 and parts[0] == "epochs":
+            return "epoch", int(parts[1])
+        if parts == ["hotkeys"]:
+            return "hotkeys", None
+        if len(parts) == 2 and parts[0] == "hotkeys":
+            return "hotkey", parts[1]
+        raise KeyError("/".join(parts))
+
+    def _not_modified(self, etag: str, last_modified) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since and last_modified is not None:
+            try:
+                return last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _send(self, status: int, body: bytes, headers: dict):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_dashboard_server(port: int, indexes: dict, analytics=None, addr: str = "0.0.0.0"):
+    """
+    Serves the {netuid: HistoryIndex} `indexes` (and `analytics`, a SubnetAnalytics, if given) at
+    http://addr:port/api/ from a daemon thread. Returns the server (call shutdown() to stop).
+    """
+    handler = type("DashboardHandler", (_DashboardHandler,), {"indexes": indexes, "analytics": analytics})
+    server = ThreadingHTTPServer((addr, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="merit-dashboard", daemon=True).start()
+    return server
@@ -0,0 +1,32 @@
+import json
+import os
+
+
+def atomic_write(path: str, data: bytes):
+    """
+    Writes `data` to a sibling temp file, fsyncs it and renames it over `path`,
+    so readers see either the old or the new contents, never a partial file.
+    """
+    directory = os.path.dirname(path) or "."
+    tmp_path = os.path.join(directory, f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def atomic_write_json(path: str, obj, indent=None):
+    separators = None if indent else (",", ":")
+    atomic_write(path, json.dumps(obj, indent=indent, separators=separators).encode("utf-8"))
+
+
+def netuid_path(path: str, netuid: int) -> str:
+    """
+    Per-netuid variant of a state file or directory name, as used in multi-netuid mode.
+    """
+    root, ext = os.path.splitext(path)
+    if ext == ".gz":
+        root, inner = os.path.splitext(root)
+        ext = inner + ext
+    return f"{root}_{netuid}{ext}"
@@ -0,0 +1,212 @@
+"""
+Minimal Prometheus-compatible metrics: counters, gauges and histograms with labels, rendered in the
+text exposition format and served over an optional stdlib HTTP endpoint (`start_metrics_server`).
+Recording is always on and cheap; nothing is exposed unless the endpoint is started.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+
+def _format_labels(names, values, extra=()) -> str:
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def remove(self, **labels):
+        with self._lock:
+            self._values.pop(self._key(labels), None)
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_sample(key, value))
+        return lines
+
+    def _render_sample(self, key, value) -> list:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels):
+        return self._values.get(self._key(labels))
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            counts = state[0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def _render_sample(self, key, state) -> list:
+        counts, total, count = state
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets, counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labelnames, key, [("le", _format_value(bound))])
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+        lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# Validator
+PING_RTT = REGISTRY.histogram(
+    "merit_ping_rtt_seconds", "Round-trip time of successful miner pings.")
+MINER_PING_RTT = REGISTRY.gauge(
+    "merit_miner_ping_rtt_seconds", "Latest ping round-trip time per miner hotkey.", ["hotkey"])
+PING_RESULTS = REGISTRY.counter(
+    "merit_ping_results_total", "Ping outcomes by stage (ok, invalid_axon, probe, forward, token, exception).",
+    ["stage"])
+PING_ROUND_DURATION = REGISTRY.histogram(
+    "merit_ping_round_duration_seconds", "Wall time of a full background ping round.")
+PING_ROUND_TARGETS = REGISTRY.gauge(
+    "merit_ping_round_targets", "Miners targeted in the latest ping round.")
+EVALUATE_DURATION = REGISTRY.histogram(
+    "merit_evaluate_duration_seconds", "Runtime of Validator._evaluate_miners.")
+CHAIN_CALL_DURATION = REGISTRY.histogram(
+    "merit_chain_call_duration_seconds", "Latency of subtensor calls made through the chain client.", ["call"])
+CHAIN_CALL_FAILURES = REGISTRY.counter(
+    "merit_chain_call_failures_total", "Failed subtensor calls by kind (timeout, error).", ["call", "kind"])
+SET_WEIGHTS_DURATION = REGISTRY.histogram(
+    "merit_set_weights_duration_seconds", "Duration of set_weights submissions.")
+WEIGHTS_INCLUSION_LATENCY = REGISTRY.histogram(
+    "merit_weights_inclusion_latency_seconds", "Time from the first weight submission attempt to observed inclusion.",
+    buckets=(6.0, 12.0, 24.0, 36.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0))
+WEIGHT_SUBMISSIONS = REGISTRY.counter(
+    "merit_weight_submissions_total", "Weight submission outcomes (included, retried, expired).", ["outcome"])
+
+# Miner
+MINER_REQUEST_DURATION = REGISTRY.histogram(
+    "merit_miner_ping_request_duration_seconds", "Latency of Miner.handle_ping_request.",
+    buckets=(0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0))
+MINER_REQUESTS = REGISTRY.counter(
+    "merit_miner_ping_requests_total", "Ping requests handled by the miner.")
+MINER_REJECTED = REGISTRY.counter(
+    "merit_miner_ping_rejected_total", "Ping requests dropped by the miner blacklist, by reason.", ["reason"])
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int, addr: str = "0.0.0.0", registry: Registry = REGISTRY):
+    """
+    Serves `registry` at http://addr:port/metrics from a daemon thread. Returns the server (call shutdown() to stop).
+    """
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+    server = ThreadingHTTPServer((addr, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="merit-metrics", daemon=True).start()
+    return server
@@ -0,0 +1,81 @@
+import base64
+import hashlib
+import time
+
+import pyotp
+
+TOTP_INTERVAL = 30  # pyotp default step (seconds)
+
+
+def derive_secret(hotkey: str) -> str:
+    """
+    Per-hotkey base32 TOTP secret shared by miner and validator.
+    """
+    hashed = hashlib.sha256(hotkey.encode('utf-8')).digest()
+    return base64.b32encode(hashed).decode('utf-8').strip('=')
+
+
+class TotpCache:
+    """
+    Derives each hotkey's TOTP once and precomputes the tokens valid for the current step (±valid_window),
+    so verifying a token is a set lookup and issuing one is a dict lookup until the step rolls over.
+    Call `retain` with the current metagraph hotkeys to evict deregistered entries.
+    """
+
+    def __init__(self, valid_window: int = 1, interval: int = TOTP_INTERVAL):
+        self.valid_window = valid_window
+        self.interval = interval
+        self._totps = {}     # hotkey -> pyotp.TOTP
+        self._windows = {}   # hotkey -> (step, frozenset of valid tokens)
+        self._tokens = {}    # hotkey -> (step, token)
+
+    def _step(self, for_time=None) -> int:
+        return int(time.time() if for_time is None else for_time) // self.interval
+
+    def _totp(self, hotkey: str) -> pyotp.TOTP:
+        totp = self._totps.get(hotkey)
+        if totp is None:
+            totp = self._totps[hotkey] = pyotp.TOTP(derive_secret(hotkey), interval=self.interval)
+        return totp
+
+    def token(self, hotkey: str, for_time=None) -> str:
+        """
+        Token for the current step; equivalent to pyotp.TOTP(derive_secret(hotkey)).now().
+        """
+        step = self._step(for_time)
+        cached = self._tokens.get(hotkey)
+        if cached is not None and cached[0] == step:
+            return cached[1]
+        token = self._totp(hotkey).generate_otp(step)
+        self._tokens[hotkey] = (step, token)
+        return token
+
+    def valid_tokens(self, hotkey: str, for_time=None) -> frozenset:
+        step = self._step(for_time)
+        cached = self._windows.get(hotkey)
+        if cached is not None and cached[0] == step:
+            return cached[1]
+        totp = self._totp(hotkey)
+        tokens = frozenset(
+            totp.generate_otp(step + offset) for offset in range(-self.valid_window, self.valid_window + 1)
+        )
+        self._windows[hotkey] = (step, tokens)
+        return tokens
+
+    def verify(self, hotkey: str, token: str, for_time=None) -> bool:
+        """
+        Equivalent to pyotp's verify(token, valid_window=self.valid_window).
+        """
+        return token in self.valid_tokens(hotkey, for_time)
+
+    def retain(self, hotkeys):
+        """
+        Drops cached secrets and tokens for hotkeys no longer in `hotkeys`.
+        """
+        keep = set(hotkeys)
+        for cache in (self._totps, self._windows, self._tokens):
+            for hotkey in [h for h in cache if h not in keep]:
+                del cache[hotkey]
+
+    def __len__(self) -> int:
+        return len(self._totps)
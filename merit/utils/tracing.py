@@ -0,0 +1,260 @@
+"""
+Opt-in span tracing and a sampling profiler for the validator cycle.
+
+Spans are recorded with `span(name)` (a context manager) or `traced(name)` (a decorator for sync and
+async functions) into a bounded in-memory buffer and exported as Chrome trace JSON (load it in
+chrome://tracing or https://ui.perfetto.dev). While tracing is disabled both are a single flag check.
+
+The sampling profiler periodically captures the main thread's stack from a daemon thread and writes
+the counts in folded-stack format (for flamegraph.pl or speedscope). `install_signal_handlers` lets a
+running process be traced or profiled without a restart: SIGUSR1 toggles the profiler, SIGUSR2 toggles
+tracing and exports the trace when it is switched off.
+"""
+import asyncio
+import functools
+import inspect
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+
+import bittensor as bt
+
+from merit.config import merit_config
+from merit.utils.fileio import atomic_write, atomic_write_json
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name: str, args: dict):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer._record(self.name, self.start, time.perf_counter_ns() - self.start, self.args)
+        return False
+
+
+class Tracer:
+    """
+    Keeps the last `max_spans` completed spans. Spans are attributed to the asyncio task (or thread)
+    that ran them, so concurrent tasks show up as separate tracks.
+    """
+
+    def __init__(self, max_spans: int = merit_config.TRACE_MAX_SPANS):
+        self.enabled = False
+        self._spans = deque(maxlen=max_spans)
+        self._track_names = {}
+        self._origin = time.perf_counter_ns()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def clear(self):
+        self._spans.clear()
+        self._track_names.clear()
+
+    def span(self, name: str, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def _track(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            track, name = id(task), task.get_name()
+        else:
+            thread = threading.current_thread()
+            track, name = thread.ident, thread.name
+        if track not in self._track_names:
+            self._track_names[track] = name
+        return track
+
+    def _record(self, name: str, start_ns: int, duration_ns: int, args: dict):
+        self._spans.append((name, start_ns, duration_ns, self._track(), args))
+
+    def spans(self) -> list:
+        """
+        Completed spans as (name, start_seconds, duration_seconds) tuples, oldest first.
+        """
+        return [(name, (start - self._origin) / 1e9, duration / 1e9) for name, start, duration, _, _ in self._spans]
+
+    def chrome_trace(self) -> dict:
+        pid = os.getpid()
+        events = []
+        tracks = set()
+        for name, start, duration, track, args in list(self._spans):
+            tracks.add(track)
+            events.append({
+                "name": name, "cat": "merit", "ph": "X", "pid": pid, "tid": track,
+                "ts": (start - self._origin) / 1000, "dur": duration / 1000, "args": args,
+            })
+        for track in tracks:
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": track,
+                "args": {"name": self._track_names.get(track, str(track))},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str = merit_config.TRACE_FILE) -> int:
+        """
+        Writes the buffered spans to `path` as Chrome trace JSON and returns how many were written.
+        """
+        trace = self.chrome_trace()
+        atomic_write_json(path, trace)
+        return sum(1 for event in trace["traceEvents"] if event["ph"] == "X")
+
+
+TRACER = Tracer()
+
+
+def span(name: str, **args):
+    return TRACER.span(name, **args)
+
+
+def traced(name: str = None):
+    """
+    Decorator recording a span around every call of a sync or async function.
+    """
+    def decorate(fn):
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                if not TRACER.enabled:
+                    return await fn(*args, **kwargs)
+                with TRACER.span(span_name):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return fn(*args, **kwargs)
+            with TRACER.span(span_name):
+                return fn(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+class SamplingProfiler:
+    """
+    Samples one thread's Python stack every `interval` seconds from a daemon thread and counts
+    identical stacks. Costs nothing while stopped.
+    """
+
+    def __init__(self, interval: float = merit_config.PROFILE_INTERVAL, thread_id: int = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.counts = {}
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self.counts = {}
+        self.samples = 0
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._sample_loop, name="merit-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> dict:
+        if self.running:
+            self._stop.set()
+            self._thread.join()
+        self._thread = None
+        return self.counts
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            key = ";".join(reversed(stack))
+            self.counts[key] = self.counts.get(key, 0) + 1
+            self.samples += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.counts.items(), key=lambda kv: -kv[1]))
+
+    def write_folded(self, path: str = merit_config.PROFILE_FILE):
+        atomic_write(path, self.folded().encode("utf-8"))
+
+
+PROFILER = SamplingProfiler()
+
+
+def install_signal_handlers(trace_path: str = merit_config.TRACE_FILE, profile_path: str = merit_config.PROFILE_FILE,
+                            loop=None):
+    """
+    SIGUSR1 starts / stops the sampling profiler (writing `profile_path` on stop); SIGUSR2 starts / stops
+    tracing (writing `trace_path` on stop). The handlers are registered with `loop` (by default the running
+    loop) and so run as ordinary loop callbacks, never inside a signal handler where file I/O or logging
+    could deadlock on a lock the interrupted code holds. No-op on platforms without these signals.
+    """
+    if not hasattr(signal, "SIGUSR1") or threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop() if loop is None else loop
+
+    def toggle_profiler():
+        if PROFILER.running:
+            PROFILER.stop()
+            PROFILER.write_folded(profile_path)
+            bt.logging.info(f"Sampling profiler stopped: {PROFILER.samples} samples written to {profile_path}.")
+        else:
+            PROFILER.start()
+            bt.logging.info(f"Sampling profiler started (every {PROFILER.interval * 1000:.0f}ms).")
+
+    def toggle_tracing():
+        if TRACER.enabled:
+            TRACER.disable()
+            count = TRACER.export_chrome_trace(trace_path)
+            TRACER.clear()
+            bt.logging.info(f"Tracing stopped: {count} spans written to {trace_path}.")
+        else:
+            TRACER.enable()
+            bt.logging.info("Tracing started.")
+
+    loop.add_signal_handler(signal.SIGUSR1, toggle_profiler)
+    loop.add_signal_handler(signal.SIGUSR2, toggle_tracing)
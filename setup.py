@@ -8,11 +8,13 @@ setup(
     install_requires=[
         "bittensor",
         "pyotp",
+        "numpy",
     ],
     entry_points={
         "console_scripts": [
             "run_miner=merit.scripts.run_miner:main",
             "run_validator=merit.scripts.run_validator:main",
+            "merit=merit.scripts.merit_cli:main",
         ],
     },
 )